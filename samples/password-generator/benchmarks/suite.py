@@ -0,0 +1,229 @@
+"""
+Nanoagent Benchmark Suite
+
+Benchmarks the hot paths of the level-2 and level-3 nanoagents, offline:
+
+- generate_password / check_password_strength (both levels)
+- execute_tool dispatch and the level-2 tool loop (mock mode)
+- Orchestrator.run in mock mode (fast path and planner path)
+
+Each case is warmed up, then timed over several repeats; results can be stored
+as a JSON baseline and compared later to flag regressions.
+
+Usage:
+    python benchmarks/suite.py run
+    python benchmarks/suite.py run --save benchmarks/baselines/main.json
+    python benchmarks/suite.py run --save current.json --filter l3.
+    python benchmarks/suite.py compare benchmarks/baselines/main.json current.json --threshold 0.10
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+LEVEL_DIRS = {
+    "l2": ROOT / "level-2-intermediate" / "nanoagent",
+    "l3": ROOT / "level-3-advanced" / "nanoagent",
+}
+# Top-level module names that exist in more than one level
+LEVEL_MODULES = ("tools", "agents", "agent", "orchestrator", "prompt_cache", "cassette", "protocol", "assets")
+
+
+@contextmanager
+def level_imports(path: Path):
+    """Import a level's modules in isolation; both levels have a 'tools' package."""
+    def level_module_names() -> list[str]:
+        return [name for name in sys.modules if name.split(".")[0] in LEVEL_MODULES]
+
+    saved = {name: sys.modules.pop(name) for name in level_module_names()}
+    saved_path = list(sys.path)
+    sys.path.insert(0, str(path))
+    try:
+        yield
+    finally:
+        sys.path[:] = saved_path
+        for name in level_module_names():
+            del sys.modules[name]
+        sys.modules.update(saved)
+
+
+def _quiet(fn: Callable[[], object]) -> Callable[[], object]:
+    """Discard console output so printing does not dominate the timings."""
+    def run() -> object:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fn()
+    return run
+
+
+def _level2_cases(loop: asyncio.AbstractEventLoop) -> dict[str, Callable[[], object]]:
+    from tools.password_tools import (
+        CheckPasswordStrengthInput,
+        GeneratePasswordInput,
+        check_password_strength,
+        execute_tool,
+        generate_password,
+    )
+    from agent import run_agent
+
+    params = GeneratePasswordInput()
+    check = CheckPasswordStrengthInput(password="Kj9#mPx2$vNq8&Lw")
+    return {
+        "l2.generate_password": lambda: generate_password(params),
+        "l2.check_password_strength": lambda: check_password_strength(check),
+        "l2.execute_tool": lambda: execute_tool("check_password_strength", {"password": "password123"}),
+        "l2.tool_loop_mock": _quiet(lambda: loop.run_until_complete(run_agent("Generate a password", mock=True))),
+    }
+
+
+def _level3_cases(loop: asyncio.AbstractEventLoop) -> dict[str, Callable[[], object]]:
+    from tools.shared_tools import (
+        CheckPasswordStrengthInput,
+        GeneratePasswordInput,
+        check_password_strength,
+        generate_password,
+    )
+    from orchestrator import Orchestrator
+
+    params = GeneratePasswordInput(require_each_class=True)
+    check = CheckPasswordStrengthInput(password="Kj9#mPx2$vNq8&Lw")
+    orchestrator = Orchestrator(mock=True)
+    return {
+        "l3.generate_password": lambda: generate_password(params),
+        "l3.check_password_strength": lambda: check_password_strength(check),
+        "l3.orchestrator_fast_path": _quiet(
+            lambda: loop.run_until_complete(orchestrator.run("Generate a 20-character password"))
+        ),
+        "l3.orchestrator_planner": _quiet(
+            lambda: loop.run_until_complete(orchestrator.run("Generate a secure password for my bank"))
+        ),
+    }
+
+
+def load_cases(loop: asyncio.AbstractEventLoop) -> dict[str, Callable[[], object]]:
+    cases = {}
+    with level_imports(LEVEL_DIRS["l2"]):
+        cases.update(_level2_cases(loop))
+    with level_imports(LEVEL_DIRS["l3"]):
+        cases.update(_level3_cases(loop))
+    return cases
+
+
+def measure(fn: Callable[[], object], warmup: int, repeat: int, min_time: float) -> dict:
+    """Time fn: warmup calls, then `repeat` batches sized to take at least min_time each."""
+    for _ in range(warmup):
+        fn()
+
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - start >= min_time:
+            break
+        number *= 2
+
+    per_call = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        per_call.append((time.perf_counter() - start) / number * 1e6)
+
+    return {
+        "median_us": statistics.median(per_call),
+        "min_us": min(per_call),
+        "stdev_us": statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def cmd_run(args: argparse.Namespace) -> None:
+    loop = asyncio.new_event_loop()
+    try:
+        cases = load_cases(loop)
+        results = {}
+        print(f"{'case':<30} {'median µs':>12} {'min µs':>12} {'stdev':>8}")
+        for name, fn in cases.items():
+            if args.filter and args.filter not in name:
+                continue
+            result = measure(fn, args.warmup, args.repeat, args.min_time)
+            results[name] = result
+            print(f"{name:<30} {result['median_us']:>12.2f} {result['min_us']:>12.2f} {result['stdev_us']:>8.2f}")
+    finally:
+        loop.close()
+
+    if args.save:
+        payload = {
+            "meta": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            },
+            "results": results,
+        }
+        path = Path(args.save)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"\nSaved results to {path}")
+
+
+def cmd_compare(args: argparse.Namespace) -> None:
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))["results"]
+    current = json.loads(Path(args.current).read_text(encoding="utf-8"))["results"]
+
+    regressions = []
+    print(f"{'case':<30} {'baseline µs':>12} {'current µs':>12} {'change':>8}")
+    for name in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[name]["median_us"], current[name]["median_us"]
+        change = after / before - 1
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<30} {before:>12.2f} {after:>12.2f} {change:>+8.1%}{flag}")
+    for name in sorted(baseline.keys() ^ current.keys()):
+        print(f"{name:<30} (only in {'baseline' if name in baseline else 'current'})")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+        sys.exit(1)
+    print(f"\nNo regressions above {args.threshold:.0%}")
+
+
+def main():
+    """Entry point for the benchmark suite."""
+    parser = argparse.ArgumentParser(description="Nanoagent benchmark suite")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="Run the benchmarks")
+    run.add_argument("--warmup", type=int, default=20, help="Untimed calls before measuring")
+    run.add_argument("--repeat", type=int, default=7, help="Timed batches per case")
+    run.add_argument("--min-time", type=float, default=0.05, help="Minimum seconds per batch")
+    run.add_argument("--filter", default="", help="Only run cases containing this text")
+    run.add_argument("--save", help="Write results to this JSON file")
+    run.set_defaults(handler=cmd_run)
+
+    compare = subparsers.add_parser("compare", help="Compare two result files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown (0.10 = 10%%)")
+    compare.set_defaults(handler=cmd_compare)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,15 +9,22 @@ This is the simplest possible agent implementation:
 Usage:
     uv run agent.py "Generate a secure password with 16 characters"
     uv run agent.py --mock "Generate a password"  # No API key needed
+    uv run agent.py --record cassettes/basic.json "Generate a password"
+    uv run agent.py --replay cassettes/basic.json "Generate a password"
+    uv run agent.py --mock --profile "Generate a password"  # Writes profile.txt/.collapsed/.prof
 """
 
 import argparse
 import asyncio
+import contextlib
 import os
 import sys
 import warnings
 from pathlib import Path
 
+from cassette import Cassette, CassetteMiss
+from profiler import Profiler, stage
+
 # Mock responses for demo mode (no API key required)
 MOCK_RESPONSES = {
     "default": """Here's a secure 16-character password: `Kj9#mPx2$vNq8&Lw`
@@ -63,13 +70,14 @@ def _get_llm_config() -> tuple[str, str | None, str | None]:
     return model, api_key, api_base
 
 
-async def call_llm(prompt: str, mock: bool = False) -> str:
+async def call_llm(prompt: str, mock: bool = False, cassette: Cassette | None = None) -> str:
     """
     Call the LLM with a simple prompt and return the response.
     
     Args:
         prompt: The user's request
         mock: If True, return a mock response without calling the API
+        cassette: Optional cassette to record real calls to, or replay them from
     
     Returns:
         The LLM's response text
@@ -81,14 +89,17 @@ async def call_llm(prompt: str, mock: bool = False) -> str:
         print()
         return MOCK_RESPONSES["default"]
     
-    # Import litellm only when needed (allows mock mode without dependencies)
-    try:
-        from litellm import acompletion
-    except ImportError:
-        print("Error: litellm not installed. Run 'uv sync' or use --mock flag.")
-        sys.exit(1)
-
-    _load_dotenv_if_available()
+    # Import litellm only when needed (allows mock and replay modes without dependencies)
+    if cassette and cassette.replaying:
+        acompletion = None
+    else:
+        try:
+            from litellm import acompletion
+        except ImportError:
+            print("Error: litellm not installed. Run 'uv sync' or use --mock flag.")
+            sys.exit(1)
+
+        _load_dotenv_if_available()
     model, api_key, api_base = _get_llm_config()
     
     # Simple one-shot completion
@@ -117,12 +128,16 @@ async def call_llm(prompt: str, mock: bool = False) -> str:
     if api_base:
         request["api_base"] = api_base
 
-    response = await acompletion(**request)
+    with stage("llm"):
+        if cassette:
+            response = await cassette.call(lambda: acompletion(**request), request)
+        else:
+            response = await acompletion(**request)
     
     return response.choices[0].message.content
 
 
-async def run_agent(user_input: str, mock: bool = False) -> None:
+async def run_agent(user_input: str, mock: bool = False, cassette: Cassette | None = None) -> None:
     """
     Run the basic agent with the given input.
     
@@ -137,7 +152,7 @@ async def run_agent(user_input: str, mock: bool = False) -> None:
     print(f"\nUser: {user_input}")
     print("\nAgent thinking...\n")
     
-    response = await call_llm(user_input, mock=mock)
+    response = await call_llm(user_input, mock=mock, cassette=cassette)
     
     print(f"Agent: {response}")
     print(f"\n{'='*60}\n")
@@ -159,10 +174,58 @@ def main():
         action="store_true",
         help="Run in mock mode without calling the LLM API"
     )
+    parser.add_argument(
+        "--record",
+        metavar="CASSETTE",
+        help="Record real LLM requests/responses (with latency) to a cassette file"
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="CASSETTE",
+        help="Replay LLM responses from a cassette file (no network)"
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=None,
+        help="Replay at recorded latency divided by this factor (default: instant)"
+    )
+    parser.add_argument(
+        "--replay-loose",
+        action="store_true",
+        help="With --replay, serve unmatched requests from the next recorded interaction instead of failing"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the run; writes PREFIX.txt, PREFIX.collapsed and PREFIX.prof"
+    )
+    parser.add_argument(
+        "--profile-out",
+        default="profile",
+        metavar="PREFIX",
+        help="Output prefix for --profile (default: profile)"
+    )
     
     args = parser.parse_args()
     
-    asyncio.run(run_agent(args.prompt, mock=args.mock))
+    cassette = None
+    if args.record:
+        cassette = Cassette(args.record, mode="record")
+    elif args.replay:
+        cassette = Cassette(args.replay, mode="replay", speed=args.replay_speed, loose=args.replay_loose)
+    
+    profiler = Profiler(args.profile_out) if args.profile else None
+    try:
+        with profiler or contextlib.nullcontext():
+            asyncio.run(run_agent(args.prompt, mock=args.mock, cassette=cassette))
+    except CassetteMiss as e:
+        print(f"Error: {e}. Re-record it, or pass --replay-loose to replay in recorded order.", file=sys.stderr)
+        sys.exit(1)
+    
+    if profiler:
+        print(profiler.format_summary(limit=0))
+        print(f"\nProfile written to: {', '.join(str(p) for p in profiler.write())}")
 
 
 if __name__ == "__main__":
@@ -4,28 +4,33 @@ Nanoagent Level 2: Intermediate Agent with Tool Calling
 This agent demonstrates:
 - Tool definition with Pydantic schemas
 - Tool calling loop (agent decides when to use tools)
-- System instruction loading from file
+- System instruction loading from a preloaded asset bundle (assets.py)
 - Structured tool responses
 
 Usage:
     uv run agent.py "Generate a secure 20-character password"
     uv run agent.py --mock "Check if 'password123' is secure"
+    uv run agent.py --mock --tool-encoding kv "Check if 'password123' is secure"
+    uv run agent.py --record cassettes/generate.json "Generate a password"
+    uv run agent.py --replay cassettes/generate.json --replay-loose --replay-speed 1 "Generate a password"
+    uv run agent.py --mock --profile --profile-out runs/check "Check if 'password123' is secure"
 """
 
 import argparse
 import asyncio
+import contextlib
 import json
 import os
 import sys
 import warnings
 from pathlib import Path
 
+from assets import get_bundle
+from cassette import Cassette, CassetteMiss
+from profiler import Profiler, stage
+from prompt_cache import PrefixCacheMeter, mark_cacheable
 from tools import get_tool_schemas, execute_tool
 
-# Load system instructions from file
-INSTRUCTIONS_PATH = Path(__file__).parent / "instructions" / "system.md"
-
-
 # Keep the console output clean: LiteLLM/OpenAI response models can trigger noisy
 # Pydantic v2 serializer warnings when internally converted to plain Python.
 warnings.filterwarnings(
@@ -58,10 +63,8 @@ def _get_llm_config() -> tuple[str, str | None, str | None]:
 
 
 def load_system_instructions() -> str:
-    """Load system instructions from markdown file."""
-    if INSTRUCTIONS_PATH.exists():
-        return INSTRUCTIONS_PATH.read_text()
-    return "You are a helpful password generator assistant."
+    """System instructions (instructions/system.md) from the preloaded asset bundle."""
+    return get_bundle().get("system", default="You are a helpful password generator assistant.")
 
 
 # Mock responses for demo mode
@@ -114,49 +117,72 @@ async def call_llm_with_tools(
     messages: list[dict],
     tools: list[dict],
     mock: bool = False,
-    mock_scenario: str = "generate"
+    mock_scenario: str = "generate",
+    prefix_meter: PrefixCacheMeter | None = None,
+    cassette: Cassette | None = None,
 ) -> object:
     """
     Call the LLM with tool definitions and handle tool calls.
     
     Returns the LLM response which may include tool_calls.
     """
+    prefix = prefix_meter.record(messages, tools) if prefix_meter else None
+    
     if mock:
         print("\n[MOCK MODE] Would send to LLM with tools:")
         print(f"  Messages: {len(messages)} messages")
         print(f"  Tools: {[t['function']['name'] for t in tools]}")
+        if prefix:
+            print(f"  Cacheable prefix: {prefix['cacheable_tokens']}/{prefix['prompt_tokens']} tokens")
         return {"tool_calls": MOCK_TOOL_CALLS[mock_scenario]["tool_calls"]}
     
-    try:
-        from litellm import acompletion
-    except ImportError:
-        print("Error: litellm not installed. Run 'uv sync' or use --mock flag.")
-        sys.exit(1)
+    replaying = cassette is not None and cassette.replaying
+    if replaying:
+        # Replay needs neither LiteLLM nor credentials
+        acompletion = None
+        model, api_key, api_base = _get_llm_config()
+    else:
+        try:
+            from litellm import acompletion
+        except ImportError:
+            print("Error: litellm not installed. Run 'uv sync' or use --mock flag.")
+            sys.exit(1)
 
-    _load_dotenv_if_available()
-    model, api_key, api_base = _get_llm_config()
-    if not api_key or not api_base:
-        print(
-            "Error: missing LLM configuration. Set NANOAGENT_API_KEY and NANOAGENT_API_BASE "
-            "(or OPENAI_API_KEY and OPENAI_API_BASE).\n"
-            "Tip: create a .env file next to agent.py with these values."
-        )
-        sys.exit(2)
+        _load_dotenv_if_available()
+        model, api_key, api_base = _get_llm_config()
+        if not api_key or not api_base:
+            print(
+                "Error: missing LLM configuration. Set NANOAGENT_API_KEY and NANOAGENT_API_BASE "
+                "(or OPENAI_API_KEY and OPENAI_API_BASE).\n"
+                "Tip: create a .env file next to agent.py with these values."
+            )
+            sys.exit(2)
     
-    response = await acompletion(
-        model=model,  # Can be any litellm-supported model
-        api_key=api_key,  # API key to your OpenAI-compatible endpoint
-        api_base=api_base,  # API base URL for your endpoint
-        messages=messages,
-        tools=tools,
-        tool_choice="auto",
-        temperature=0.7,
-    )
+    request = {
+        "model": model,  # Can be any litellm-supported model
+        "api_key": api_key,  # API key to your OpenAI-compatible endpoint
+        "api_base": api_base,  # API base URL for your endpoint
+        "messages": mark_cacheable(messages, model),
+        "tools": tools,
+        "tool_choice": "auto",
+        "temperature": 0.7,
+    }
+    
+    with stage("llm"):
+        if cassette:
+            response = await cassette.call(lambda: acompletion(**request), request)
+        else:
+            response = await acompletion(**request)
     
     return response.choices[0].message
 
 
-async def run_agent(user_input: str, mock: bool = False) -> None:
+async def run_agent(
+    user_input: str,
+    mock: bool = False,
+    tool_encoding: str = "json",
+    cassette: Cassette | None = None,
+) -> None:
     """
     Run the intermediate agent with tool calling capability.
     
@@ -183,15 +209,19 @@ async def run_agent(user_input: str, mock: bool = False) -> None:
         {"role": "user", "content": user_input}
     ]
     
-    # Get tool schemas
+    # Get tool schemas (built once, fixed order: part of the cacheable prefix)
     tools = get_tool_schemas()
+    prefix_meter = PrefixCacheMeter(exact=not mock)
     
     print("\nAgent thinking (with tools available)...\n")
     
     # Tool calling loop
     max_iterations = 5
     for iteration in range(max_iterations):
-        response = await call_llm_with_tools(messages, tools, mock=mock, mock_scenario=mock_scenario)
+        response = await call_llm_with_tools(
+            messages, tools, mock=mock, mock_scenario=mock_scenario,
+            prefix_meter=prefix_meter, cassette=cassette,
+        )
         
         # Check if LLM wants to call tools
         tool_calls = response.get("tool_calls") if isinstance(response, dict) else getattr(response, "tool_calls", None)
@@ -218,7 +248,8 @@ async def run_agent(user_input: str, mock: bool = False) -> None:
                 tool_id = tool_call.id
             
             print(f"  → Calling {tool_name}({tool_args})")
-            result = execute_tool(tool_name, tool_args)
+            with stage(f"tool:{tool_name}"):
+                result = execute_tool(tool_name, tool_args, encoding=tool_encoding)
             print(f"  ← Result: {result[:100]}..." if len(str(result)) > 100 else f"  ← Result: {result}")
             
             tool_results.append({
@@ -248,6 +279,11 @@ async def run_agent(user_input: str, mock: bool = False) -> None:
                 "content": result["result"]
             })
     
+    summary = prefix_meter.summary()
+    print(
+        f"\n[Prompt cache] {summary['cacheable_tokens']}/{summary['prompt_tokens']} prompt tokens "
+        f"in a cacheable prefix over {summary['calls']} call(s)"
+    )
     print(f"\n{'='*60}\n")
 
 
@@ -267,10 +303,69 @@ def main():
         action="store_true",
         help="Run in mock mode without calling the LLM API"
     )
+    parser.add_argument(
+        "--tool-encoding",
+        choices=["json", "kv", "repr"],
+        default="json",
+        help="How tool results are encoded for the LLM (default: compact JSON)"
+    )
+    parser.add_argument(
+        "--record",
+        metavar="CASSETTE",
+        help="Record real LLM requests/responses (with latency) to a cassette file"
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="CASSETTE",
+        help="Replay LLM responses from a cassette file (no network)"
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=None,
+        help="Replay at recorded latency divided by this factor (default: instant)"
+    )
+    parser.add_argument(
+        "--replay-loose",
+        action="store_true",
+        help="With --replay, serve unmatched requests from the next recorded interaction instead of failing"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the run; writes PREFIX.txt, PREFIX.collapsed and PREFIX.prof"
+    )
+    parser.add_argument(
+        "--profile-out",
+        default="profile",
+        metavar="PREFIX",
+        help="Output prefix for --profile (default: profile)"
+    )
     
     args = parser.parse_args()
     
-    asyncio.run(run_agent(args.prompt, mock=args.mock))
+    cassette = None
+    if args.record:
+        cassette = Cassette(args.record, mode="record")
+    elif args.replay:
+        cassette = Cassette(args.replay, mode="replay", speed=args.replay_speed, loose=args.replay_loose)
+    
+    profiler = Profiler(args.profile_out) if args.profile else None
+    try:
+        with profiler or contextlib.nullcontext():
+            asyncio.run(run_agent(
+                args.prompt,
+                mock=args.mock,
+                tool_encoding=args.tool_encoding,
+                cassette=cassette,
+            ))
+    except CassetteMiss as e:
+        print(f"Error: {e}. Re-record it, or pass --replay-loose to replay in recorded order.", file=sys.stderr)
+        sys.exit(1)
+    
+    if profiler:
+        print(profiler.format_summary(limit=0))
+        print(f"\nProfile written to: {', '.join(str(p) for p in profiler.write())}")
 
 
 if __name__ == "__main__":
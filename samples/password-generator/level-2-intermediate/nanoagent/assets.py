@@ -0,0 +1,151 @@
+"""
+Instruction and Prompt Asset Bundle
+
+Discovers the markdown assets (instructions/*.md) once and serves them by name
+from memory: "system" is instructions/system.md. Each fetch checks the file's
+mtime and size, so an edited asset is re-read on the next fetch while an
+unchanged one costs a single stat() call.
+
+The bundle can be precompiled to one JSON file (`uv run assets.py compile`).
+Starting from the compiled file replaces discovery and one read per asset with
+a single read; entries are still checked against the files' mtime before use.
+
+Usage:
+    from assets import get_bundle
+    system_prompt = get_bundle().get("system")
+
+    uv run assets.py list
+    uv run assets.py compile            # writes .assets.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+ASSET_DIRS = (ROOT / "instructions",)
+COMPILED_PATH = ROOT / ".assets.json"
+COMPILED_VERSION = 1
+
+
+class AssetNotFoundError(KeyError):
+    """Raised when no asset with the requested name exists."""
+
+
+@dataclass
+class Asset:
+    path: str  # Relative to the nanoagent folder, so compiled bundles are portable
+    mtime_ns: int
+    size: int
+    text: str
+
+
+def asset_name(path: Path, root: Path) -> str:
+    """'system' for system.md; 'style.instructions' style suffixes are dropped too."""
+    name = path.relative_to(root).with_suffix("").as_posix()
+    for suffix in (".instructions", ".prompt"):
+        name = name.removesuffix(suffix)
+    return name
+
+
+class AssetBundle:
+    """In-memory markdown assets, keyed by name, invalidated by mtime."""
+
+    def __init__(self, dirs: tuple[Path, ...] = ASSET_DIRS):
+        self.dirs = dirs
+        self.assets: dict[str, Asset] = {}
+        self.reads = 0
+        self.discover()
+
+    def discover(self) -> None:
+        """Index every *.md under the asset dirs (contents are read on first fetch)."""
+        found = {}
+        for root in self.dirs:
+            for path in sorted(root.rglob("*.md")) if root.is_dir() else ():
+                name = asset_name(path, root)
+                found[name] = self.assets.get(name) or Asset(os.path.relpath(path, ROOT), -1, -1, "")
+        self.assets = found
+
+    def get(self, name: str, default: str | None = None) -> str:
+        """Asset text by name (trailing newlines stripped); re-read if the file changed."""
+        asset = self.assets.get(name)
+        if asset is None:
+            self.discover()  # A file may have been added since discovery
+            asset = self.assets.get(name)
+        if asset is None:
+            if default is not None:
+                return default
+            raise AssetNotFoundError(name)
+        try:
+            stat = os.stat(ROOT / asset.path)
+        except FileNotFoundError:
+            del self.assets[name]
+            return self.get(name, default)
+        if (stat.st_mtime_ns, stat.st_size) != (asset.mtime_ns, asset.size):
+            asset.text = (ROOT / asset.path).read_text(encoding="utf-8").rstrip("\n")
+            asset.mtime_ns, asset.size = stat.st_mtime_ns, stat.st_size
+            self.reads += 1
+        return asset.text
+
+    def names(self) -> list[str]:
+        return sorted(self.assets)
+
+    def compile(self, path: Path = COMPILED_PATH) -> Path:
+        """Write every asset (freshly validated) to a single JSON file."""
+        for name in self.names():
+            self.get(name)
+        payload = {"version": COMPILED_VERSION, "assets": {k: asdict(v) for k, v in self.assets.items()}}
+        path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, path: Path = COMPILED_PATH, dirs: tuple[Path, ...] = ASSET_DIRS) -> "AssetBundle":
+        """A bundle started from a compiled file, skipping discovery."""
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != COMPILED_VERSION:
+            raise ValueError(f"{path}: unsupported asset bundle version {data.get('version')!r}")
+        bundle = cls.__new__(cls)
+        bundle.dirs = dirs
+        bundle.assets = {name: Asset(**entry) for name, entry in data["assets"].items()}
+        bundle.reads = 0
+        return bundle
+
+
+_bundle: AssetBundle | None = None
+
+
+def get_bundle() -> AssetBundle:
+    """The process-wide bundle: from the compiled file if present, else discovered."""
+    global _bundle
+    if _bundle is None:
+        compiled = Path(os.getenv("NANOAGENT_ASSET_BUNDLE", COMPILED_PATH))
+        try:
+            _bundle = AssetBundle.load(compiled)
+        except (OSError, ValueError, TypeError):
+            _bundle = AssetBundle()
+    return _bundle
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or precompile the instruction asset bundle")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="List asset names and paths")
+    compile_parser = sub.add_parser("compile", help="Write all assets to one JSON file")
+    compile_parser.add_argument("--output", type=Path, default=COMPILED_PATH)
+    args = parser.parse_args()
+
+    bundle = AssetBundle()
+    if args.command == "list":
+        for name in bundle.names():
+            print(f"{name:<24} {bundle.assets[name].path}")
+    else:
+        path = bundle.compile(args.output)
+        print(f"Compiled {len(bundle.assets)} assets to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
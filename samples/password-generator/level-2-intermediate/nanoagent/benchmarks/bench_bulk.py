@@ -0,0 +1,48 @@
+"""
+Bulk Generation Benchmark
+
+Reports throughput and dedup-structure memory for unique bulk generation at
+10^4, 10^6 and 10^7 passwords (auto mode: exact set up to 10^6, Bloom filter
+above). Passwords are consumed and discarded, so only the dedup structure stays
+in memory. The 10^7 run takes a minute or two on a typical laptop.
+
+Usage:
+    uv run benchmarks/bench_bulk.py
+    uv run benchmarks/bench_bulk.py --sizes 10000,100000 --dedup bloom
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from tools.bulk import BulkGenerateInput, BulkStats, generate_unique_passwords
+
+
+def run(count: int, dedup: str, length: int) -> None:
+    stats = BulkStats()
+    start = time.perf_counter()
+    for _ in generate_unique_passwords(BulkGenerateInput(count=count, length=length, dedup=dedup), stats):
+        pass
+    elapsed = time.perf_counter() - start
+    print(
+        f"{count:>12,}  {stats.dedup:<6} {count / elapsed:>12,.0f}/s  "
+        f"{stats.dedup_bytes / 2**20:>9.1f} MiB  {stats.rejected:>8}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark unique bulk password generation")
+    parser.add_argument("--sizes", default="10000,1000000,10000000")
+    parser.add_argument("--dedup", choices=["auto", "set", "bloom"], default="auto")
+    parser.add_argument("--length", type=int, default=16)
+    args = parser.parse_args()
+
+    print(f"{'count':>12}  {'dedup':<6} {'throughput':>14}  {'memory':>13}  {'rejected':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        run(size, args.dedup, args.length)
+
+
+if __name__ == "__main__":
+    main()
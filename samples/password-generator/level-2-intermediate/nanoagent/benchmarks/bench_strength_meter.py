@@ -0,0 +1,87 @@
+"""
+Strength Meter Benchmark
+
+Simulates typing passwords up to the 128-character limit (with occasional
+backspaces) and compares re-scoring every keystroke with check_password_strength
+against IncrementalStrengthMeter. Every keystroke's results are compared too.
+
+Usage:
+    uv run benchmarks/bench_strength_meter.py
+    uv run benchmarks/bench_strength_meter.py --sessions 500
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from tools.password_tools import CheckPasswordStrengthInput, check_password_strength
+from tools.strength_meter import IncrementalStrengthMeter
+
+
+def keystrokes(rng: random.Random, length: int) -> list[str | None]:
+    """A typing session: characters, with None meaning backspace."""
+    alphabet = "abcXYZ019!@#é "
+    events: list[str | None] = []
+    typed = 0
+    while typed < length:
+        if typed and rng.random() < 0.1:
+            events.append(None)
+            typed -= 1
+        else:
+            events.append(rng.choice(alphabet))
+            typed += 1
+    return events
+
+
+def run_full(sessions: list[list[str | None]]) -> tuple[float, list[dict]]:
+    results = []
+    start = time.perf_counter()
+    for events in sessions:
+        text = ""
+        for event in events:
+            text = text[:-1] if event is None else text + event
+            results.append(check_password_strength(CheckPasswordStrengthInput(password=text)))
+    return time.perf_counter() - start, results
+
+
+def run_incremental(sessions: list[list[str | None]]) -> tuple[float, list[dict]]:
+    results = []
+    start = time.perf_counter()
+    for events in sessions:
+        meter = IncrementalStrengthMeter()
+        for event in events:
+            if event is None:
+                meter.delete()
+            else:
+                meter.append(event)
+            results.append(meter.result())
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark incremental vs full strength scoring")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'length':>6} {'full µs/key':>12} {'incr µs/key':>12} {'speedup':>8}")
+    for length in (16, 32, 64, 128):
+        sessions = [keystrokes(rng, length) for _ in range(args.sessions)]
+        keys = sum(len(s) for s in sessions)
+        full_s, full = run_full(sessions)
+        incremental_s, incremental = run_incremental(sessions)
+        if full != incremental:
+            print("Mismatch between incremental and full results")
+            sys.exit(1)
+        print(
+            f"{length:>6} {full_s / keys * 1e6:>12.2f} {incremental_s / keys * 1e6:>12.2f} "
+            f"{full_s / incremental_s:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Tool Encoding Report
+
+Prints the per-tool token size of typical tool results under each encoding,
+so the savings of compact results are visible per tool round trip. Uses
+LiteLLM's tokenizer when installed, otherwise a 4-characters-per-token estimate.
+
+Usage:
+    uv run benchmarks/bench_tool_encoding.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from tools.encoding import size_report
+from tools.password_tools import TOOLS
+
+SAMPLE_CALLS = [
+    ("generate_password", {"length": 16}),
+    ("check_password_strength", {"password": "password123"}),
+    ("check_password_strength", {"password": "Kj9#mPx2$vNq8&Lw"}),
+    ("generate_multiple_passwords", {"count": 5, "length": 16}),
+]
+
+
+def main():
+    print(f"{'tool call':<42} {'repr':>5} {'json':>5} {'pruned':>7} {'kv':>5}")
+    totals = {"repr": 0, "json": 0, "json_pruned": 0, "kv_pruned": 0}
+    for name, arguments in SAMPLE_CALLS:
+        tool = TOOLS[name]
+        result = tool["function"](tool["schema"](**arguments))
+        sizes = size_report(result)
+        for key in totals:
+            totals[key] += sizes[key]
+        label = f"{name}({', '.join(f'{k}={v!r}' for k, v in arguments.items())})"
+        print(
+            f"{label[:42]:<42} {sizes['repr']:>5} {sizes['json']:>5} "
+            f"{sizes['json_pruned']:>7} {sizes['kv_pruned']:>5}"
+        )
+    print(
+        f"{'total':<42} {totals['repr']:>5} {totals['json']:>5} "
+        f"{totals['json_pruned']:>7} {totals['kv_pruned']:>5}"
+    )
+    print(f"\nCompact JSON saves {1 - totals['json_pruned'] / totals['repr']:.0%} of tool-result tokens vs repr")
+
+
+if __name__ == "__main__":
+    main()
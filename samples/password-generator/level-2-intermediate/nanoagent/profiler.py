@@ -0,0 +1,197 @@
+"""
+Run Profiler
+
+Profiles a single agent run and separates CPU time from time spent awaiting
+(LLM calls, sleeps, other I/O):
+
+- A cProfile CPU profile (thread CPU clock, so awaiting costs nothing)
+- Per-stage wall and CPU time; await time is wall minus CPU
+- A sampling profiler whose stacks are written in the collapsed format used by
+  flamegraph.pl / speedscope / inferno, prefixed with the active stage
+
+Code marks stages with the module-level stage() helper, which is a no-op when
+no profiler is running:
+
+    with stage("llm"):
+        response = await acompletion(**request)
+
+Usage:
+    with Profiler("profile") as profiler:
+        asyncio.run(run_agent(...))
+    profiler.write()   # profile.txt, profile.collapsed, profile.prof
+"""
+
+import contextlib
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+# Profiler of the current run, if any (see stage())
+ACTIVE: "Profiler | None" = None
+
+
+@dataclass
+class StageTiming:
+    """Accumulated timings for one stage name."""
+    calls: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+
+    @property
+    def await_s(self) -> float:
+        return max(0.0, self.wall_s - self.cpu_s)
+
+
+def stage(name: str) -> contextlib.AbstractContextManager:
+    """Mark a stage of the active profiler (no-op when not profiling)."""
+    if ACTIVE is None:
+        return contextlib.nullcontext()
+    return ACTIVE.stage(name)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class Profiler:
+    """CPU profile, per-stage await/CPU split and sampled stacks for one run."""
+
+    def __init__(self, output: str | Path = "profile", interval: float = 0.002):
+        self.output = Path(output)
+        self.interval = interval
+        self.stages: dict[str, StageTiming] = {}
+        self.samples: Counter[str] = Counter()
+        self.startup_cpu_s = 0.0
+        self.wall_s = 0.0
+        self.cpu_s = 0.0
+
+        self._cprofile = cProfile.Profile(time.thread_time)
+        self._active_stages: list[str] = []
+        self._main_thread_id = threading.get_ident()
+        self._stopping = threading.Event()
+        self._sampler: threading.Thread | None = None
+        self._started_at = 0.0
+        self._started_cpu = 0.0
+
+    def start(self) -> "Profiler":
+        global ACTIVE
+        ACTIVE = self
+        # CPU already spent before profiling started: interpreter startup and imports
+        self.startup_cpu_s = time.process_time()
+        self._main_thread_id = threading.get_ident()
+        self._stopping.clear()
+        self._sampler = threading.Thread(target=self._sample_loop, name="profiler-sampler", daemon=True)
+        self._sampler.start()
+        self._started_at = time.perf_counter()
+        self._started_cpu = time.thread_time()
+        self._cprofile.enable()
+        return self
+
+    def stop(self) -> None:
+        global ACTIVE
+        self._cprofile.disable()
+        self.wall_s = time.perf_counter() - self._started_at
+        self.cpu_s = time.thread_time() - self._started_cpu
+        self._stopping.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        ACTIVE = None
+
+    def __enter__(self) -> "Profiler":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a stage; CPU is measured on this thread, the rest is await time."""
+        self._active_stages.append(name)
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            timing = self.stages.setdefault(name, StageTiming())
+            timing.calls += 1
+            timing.wall_s += time.perf_counter() - wall
+            timing.cpu_s += time.thread_time() - cpu
+            # Concurrent tasks may close stages out of order
+            for i in range(len(self._active_stages) - 1, -1, -1):
+                if self._active_stages[i] == name:
+                    del self._active_stages[i]
+                    break
+
+    def _sample_loop(self) -> None:
+        while not self._stopping.wait(self.interval):
+            frame = sys._current_frames().get(self._main_thread_id)
+            if frame is None:
+                continue
+            stack = []
+            innermost = frame
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.reverse()
+            if innermost.f_code.co_name == "select" and innermost.f_code.co_filename.endswith("selectors.py"):
+                stack.append("[awaiting I/O]")
+            self.samples[";".join(list(self._active_stages) + stack)] += 1
+
+    def summary(self) -> dict:
+        """Stage timings and run totals, in seconds."""
+        return {
+            "startup_cpu_s": self.startup_cpu_s,
+            "wall_s": self.wall_s,
+            "cpu_s": self.cpu_s,
+            "await_s": max(0.0, self.wall_s - self.cpu_s),
+            "stages": {
+                name: {"calls": t.calls, "wall_s": t.wall_s, "cpu_s": t.cpu_s, "await_s": t.await_s}
+                for name, t in sorted(self.stages.items(), key=lambda item: -item[1].wall_s)
+            },
+        }
+
+    def format_summary(self, limit: int = 30) -> str:
+        """Human-readable summary; limit is the number of functions listed (0 for none)."""
+        data = self.summary()
+        lines = [
+            f"Startup + imports before profiling: {data['startup_cpu_s']*1000:.1f} ms CPU",
+            f"Profiled run: {data['wall_s']*1000:.1f} ms wall = "
+            f"{data['cpu_s']*1000:.1f} ms CPU + {data['await_s']*1000:.1f} ms awaiting",
+            "",
+            "Stages (inclusive; nested stages are also counted in their parent)",
+            f"  {'stage':<28} {'calls':>6} {'wall ms':>10} {'cpu ms':>10} {'await ms':>10}",
+        ]
+        for name, t in data["stages"].items():
+            lines.append(
+                f"  {name:<28} {t['calls']:>6} {t['wall_s']*1000:>10.1f} "
+                f"{t['cpu_s']*1000:>10.1f} {t['await_s']*1000:>10.1f}"
+            )
+        if limit:
+            stream = io.StringIO()
+            stats = pstats.Stats(self._cprofile, stream=stream)
+            stats.sort_stats("cumulative").print_stats(limit)
+            lines += ["", f"Top {limit} functions by cumulative CPU time", stream.getvalue()]
+        return "\n".join(lines)
+
+    def write(self) -> list[Path]:
+        """Write <output>.txt, <output>.collapsed and <output>.prof; return their paths."""
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        summary_path = self.output.with_suffix(".txt")
+        collapsed_path = self.output.with_suffix(".collapsed")
+        pstats_path = self.output.with_suffix(".prof")
+
+        summary_path.write_text(self.format_summary(), encoding="utf-8")
+        collapsed_path.write_text(
+            "".join(f"{stack} {count}\n" for stack, count in sorted(self.samples.items())),
+            encoding="utf-8",
+        )
+        self._cprofile.dump_stats(pstats_path)
+        return [summary_path, collapsed_path, pstats_path]
@@ -0,0 +1,123 @@
+"""
+Password Tools CLI
+
+Command-line access to the level-2 tools for batch work that should not go
+through the LLM.
+
+Usage:
+    uv run python -m tools export --count 1000000 --output passwords.txt
+    uv run python -m tools export --count 50000 --format jsonl --length 20
+    uv run python -m tools export --count 10 --format csv          # to stdout
+    uv run python -m tools audit passwords.txt --workers 8
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+
+from pydantic import ValidationError
+
+from .audit import audit_file
+from .bulk import BulkGenerateInput, BulkStats, generate_unique_passwords
+from .export import export_passwords
+
+
+def format_validation_error(error: ValidationError) -> str:
+    """'--count: Input should be greater than or equal to 1'-style messages, one per field."""
+    return "; ".join(
+        f"--{'.'.join(map(str, e['loc'])).replace('_', '-')}: {e['msg']}" for e in error.errors()
+    )
+
+
+def cmd_export(args: argparse.Namespace) -> None:
+    try:
+        params = BulkGenerateInput(
+            count=args.count,
+            length=args.length,
+            include_uppercase=not args.no_uppercase,
+            include_lowercase=not args.no_lowercase,
+            include_numbers=not args.no_numbers,
+            include_symbols=not args.no_symbols,
+            dedup=args.dedup,
+        )
+    except ValidationError as e:
+        args.parser.error(format_validation_error(e))
+    stats = BulkStats()
+    passwords = generate_unique_passwords(params, stats)
+    try:
+        # Generation is lazy: an empty charset or too small a keyspace surfaces on the first pull
+        first = next(passwords, None)
+    except ValueError as e:
+        args.parser.error(str(e))
+    if first is not None:
+        passwords = itertools.chain([first], passwords)
+
+    if args.output == "-":
+        written = export_passwords(passwords, sys.stdout, args.format, args.chunk_size)
+    else:
+        # The export is a file of secrets: create it owner-only rather than with the umask default
+        fd = os.open(args.output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)  # O_CREAT's mode does not apply when overwriting an existing file
+        with os.fdopen(fd, "w", encoding="utf-8", newline="", buffering=1 << 20) as out:
+            written = export_passwords(passwords, out, args.format, args.chunk_size)
+
+    print(
+        f"Exported {written} passwords ({args.format}, dedup={stats.dedup}, "
+        f"{stats.rejected} duplicates rejected)",
+        file=sys.stderr,
+    )
+
+
+def cmd_audit(args: argparse.Namespace) -> None:
+    start = time.perf_counter()
+    report = audit_file(args.path, workers=args.workers, chunk_bytes=args.chunk_mb * 2**20)
+    elapsed = time.perf_counter() - start
+    print(json.dumps(report.as_dict(), indent=2))
+    print(
+        f"Audited {report.total} passwords in {elapsed:.2f}s "
+        f"({report.total / elapsed if elapsed else 0:,.0f}/s)",
+        file=sys.stderr,
+    )
+
+
+def main():
+    """Entry point for the tools CLI."""
+    parser = argparse.ArgumentParser(
+        prog="python -m tools",
+        description="Level 2 password tools for batch use"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export = subparsers.add_parser("export", help="Stream unique passwords to a file or stdout")
+    export.add_argument("--count", type=int, required=True, help="Number of passwords")
+    export.add_argument("--length", type=int, default=16, help="Password length (8-128)")
+    export.add_argument("--format", choices=["text", "csv", "jsonl"], default="text")
+    export.add_argument("--output", default="-", help="Output file ('-' for stdout)")
+    export.add_argument("--chunk-size", type=int, default=10_000, help="Passwords per write")
+    export.add_argument(
+        "--dedup",
+        choices=["auto", "set", "bloom", "none"],
+        default="auto",
+        help="Uniqueness check ('none' keeps memory constant regardless of count)"
+    )
+    export.add_argument("--no-uppercase", action="store_true")
+    export.add_argument("--no-lowercase", action="store_true")
+    export.add_argument("--no-numbers", action="store_true")
+    export.add_argument("--no-symbols", action="store_true")
+    export.set_defaults(handler=cmd_export, parser=export)
+
+    audit = subparsers.add_parser("audit", help="Strength histogram for a password file")
+    audit.add_argument("path", help="Password file, one password per line")
+    audit.add_argument("--workers", type=int, default=None, help="Processes (default: all cores)")
+    audit.add_argument("--chunk-mb", type=int, default=8, help="Chunk size in MiB")
+    audit.set_defaults(handler=cmd_audit)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
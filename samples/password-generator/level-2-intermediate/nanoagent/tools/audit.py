@@ -0,0 +1,105 @@
+"""
+Password File Audit
+
+Runs check_password_strength over a password file (one password per line)
+without holding the file in memory. The file is split into byte-range chunks,
+chunks are scored across a ProcessPoolExecutor, and only the aggregated
+counts are kept.
+"""
+
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+from typing import Iterable, Iterator
+
+from .password_tools import CheckPasswordStrengthInput, check_password_strength
+
+
+@dataclass
+class AuditReport:
+    """Aggregated results of an audit."""
+    total: int = 0
+    strength: Counter = field(default_factory=Counter)
+    failed_checks: Counter = field(default_factory=Counter)
+
+    def merge(self, other: "AuditReport") -> None:
+        self.total += other.total
+        self.strength.update(other.strength)
+        self.failed_checks.update(other.failed_checks)
+
+    def as_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "strength": dict(sorted(self.strength.items())),
+            "failed_checks": dict(sorted(self.failed_checks.items())),
+        }
+
+
+def audit_passwords(passwords: Iterable[str]) -> AuditReport:
+    """Single-process audit of an iterable of passwords."""
+    report = AuditReport()
+    for password in passwords:
+        result = check_password_strength(CheckPasswordStrengthInput(password=password))
+        report.total += 1
+        report.strength[result["strength"]] += 1
+        for check, passed in result["checks"].items():
+            if not passed:
+                report.failed_checks[check] += 1
+    return report
+
+
+def audit_range(path: str, start: int, end: int) -> AuditReport:
+    """
+    Audit the lines that start within the byte range [start, end).
+
+    A line straddling a boundary belongs to the range it starts in, so adjacent
+    ranges never double-count or drop a password.
+    """
+    def passwords() -> Iterator[str]:
+        with open(path, "rb") as f:
+            position = start
+            if start:
+                f.seek(start - 1)
+                position = start - 1 + len(f.readline())
+            while position < end:
+                line = f.readline()
+                if not line:
+                    return
+                position += len(line)
+                password = line.rstrip(b"\r\n").decode("utf-8", errors="surrogateescape")
+                if password:
+                    yield password
+
+    return audit_passwords(passwords())
+
+
+def byte_ranges(path: str, chunk_bytes: int) -> list[tuple[int, int]]:
+    size = os.path.getsize(path)
+    return [(start, min(start + chunk_bytes, size)) for start in range(0, size, chunk_bytes)]
+
+
+def audit_file(path: str, workers: int | None = None, chunk_bytes: int = 8 * 2**20) -> AuditReport:
+    """
+    Audit a password file using all cores.
+
+    The file is split into byte ranges; each worker opens the file itself and
+    streams its range, so the parent never reads or pickles password data and
+    memory stays bounded regardless of file size. workers=1 runs in-process.
+    """
+    workers = workers or os.cpu_count() or 1
+    report = AuditReport()
+    ranges = byte_ranges(path, chunk_bytes)
+
+    if workers == 1:
+        for start, end in ranges:
+            report.merge(audit_range(path, start, end))
+        return report
+
+    starts = [start for start, _ in ranges]
+    ends = [end for _, end in ranges]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for partial in pool.map(audit_range, repeat(path), starts, ends):
+            report.merge(partial)
+    return report
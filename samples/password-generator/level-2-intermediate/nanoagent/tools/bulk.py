@@ -0,0 +1,166 @@
+"""
+Bulk Password Generation
+
+Generates arbitrarily many unique passwords as a stream. Uniqueness is enforced
+with an exact set for moderate counts and a memory-bounded Bloom filter for very
+large runs. A Bloom filter never misses a password it has seen, so rejecting every
+"maybe seen" candidate guarantees uniqueness; false positives only cost a
+regeneration. verify_unique() re-checks a finished run exactly in bounded memory.
+dedup="none" skips the check entirely for constant-memory streaming.
+"""
+
+import hashlib
+import math
+import os
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Literal
+
+from pydantic import Field
+
+from .password_tools import GeneratePasswordInput, build_charset
+
+# Above this count the exact set is replaced by a Bloom filter (auto mode)
+SET_DEDUP_LIMIT = 1_000_000
+
+
+class BulkGenerateInput(GeneratePasswordInput):
+    """Input schema for bulk password generation."""
+    count: int = Field(ge=1, description="Number of unique passwords to generate")
+    dedup: Literal["auto", "set", "bloom", "none"] = Field(
+        default="auto", description="Uniqueness structure (auto picks set or bloom by count)"
+    )
+    error_rate: float = Field(
+        default=1e-6, gt=0, lt=1, description="Bloom filter false-positive rate"
+    )
+
+
+@dataclass
+class BulkStats:
+    """Counters describing a bulk run."""
+    generated: int = 0
+    rejected: int = 0
+    dedup: str = ""
+    dedup_bytes: int = 0
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings using double hashing on BLAKE2b."""
+
+    def __init__(self, capacity: int, error_rate: float = 1e-6):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+    def add(self, item: str) -> bool:
+        """Add an item; return True if it was possibly present already."""
+        present = True
+        for p in self._positions(item):
+            mask = 1 << (p & 7)
+            if not self.bits[p >> 3] & mask:
+                present = False
+                self.bits[p >> 3] |= mask
+        return present
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.bits)
+
+
+def password_stream(params: GeneratePasswordInput, chunk_size: int = 4096) -> Iterator[str]:
+    """
+    Yield an endless stream of uniformly random passwords.
+
+    Random bytes are drawn from os.urandom in chunks and mapped onto the charset
+    with bytes.translate; bytes that would bias the mapping are dropped.
+    """
+    charset = build_charset(params)
+    if not charset:
+        raise ValueError("At least one character type must be selected")
+    limit = 256 - 256 % len(charset)
+    table = bytes(ord(charset[b % len(charset)]) if b < limit else 0 for b in range(256))
+    biased = bytes(range(limit, 256))
+
+    buffer = ""
+    while True:
+        while len(buffer) < params.length * chunk_size:
+            buffer += os.urandom(params.length * chunk_size).translate(table, biased).decode("ascii")
+        for start in range(0, params.length * chunk_size, params.length):
+            yield buffer[start:start + params.length]
+        buffer = buffer[params.length * chunk_size:]
+
+
+def generate_unique_passwords(params: BulkGenerateInput, stats: BulkStats | None = None) -> Iterator[str]:
+    """Yield params.count unique passwords without materializing them in a list."""
+    keyspace = len(build_charset(params)) ** params.length
+    if params.count > keyspace:
+        raise ValueError(f"Cannot generate {params.count} unique passwords from a keyspace of {keyspace}")
+
+    stats = stats if stats is not None else BulkStats()
+    use_bloom = params.dedup == "bloom" or (params.dedup == "auto" and params.count > SET_DEDUP_LIMIT)
+    use_set = params.dedup == "set" or (params.dedup == "auto" and not use_bloom)
+    if params.dedup == "none":
+        stats.dedup = "none"
+
+        def is_duplicate(password: str) -> bool:
+            return False
+    elif use_bloom:
+        bloom = BloomFilter(params.count, params.error_rate)
+        stats.dedup, stats.dedup_bytes = "bloom", bloom.nbytes
+        is_duplicate = bloom.add
+    else:
+        seen: set[str] = set()
+        stats.dedup = "set"
+
+        def is_duplicate(password: str) -> bool:
+            if password in seen:
+                return True
+            seen.add(password)
+            return False
+
+    for password in password_stream(params):
+        if stats.generated >= params.count:
+            break
+        if is_duplicate(password):
+            stats.rejected += 1
+            continue
+        stats.generated += 1
+        yield password
+
+    if use_set:
+        stats.dedup_bytes = set_memory_bytes(seen)
+
+
+def set_memory_bytes(items: set[str]) -> int:
+    """Approximate memory held by a set of strings (table + string objects)."""
+    import sys
+    return sys.getsizeof(items) + sum(sys.getsizeof(s) for s in items)
+
+
+def verify_unique(make_iter: Callable[[], Iterable[str]], passes: int = 1) -> int:
+    """
+    Count exact duplicates in a re-iterable source using bounded memory.
+
+    Each pass only keeps passwords whose hash falls in that pass's bucket, so
+    peak memory is roughly 1/passes of a full set.
+    """
+    duplicates = 0
+    for bucket in range(passes):
+        seen: set[str] = set()
+        for password in make_iter():
+            if hash(password) % passes != bucket:
+                continue
+            if password in seen:
+                duplicates += 1
+            else:
+                seen.add(password)
+    return duplicates
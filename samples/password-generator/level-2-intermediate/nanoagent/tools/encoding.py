@@ -0,0 +1,89 @@
+"""
+Tool Result Encoding
+
+Tool results go back to the LLM as message content, so every character costs
+prompt tokens on the next round trip. Instead of str(result) (a Python repr with
+quotes, True/False and redundant keys) results are encoded as:
+
+- json: compact JSON (no spaces)
+- kv:   terse key=value pairs, e.g. "strength=weak score=2/5 failed=uppercase,symbols"
+- repr: the original str(result), kept for comparison
+
+With prune=True, fields the model does not need are dropped: the checks map
+becomes a list of failed checks (omitted when everything passed), empty lists
+are removed, and recommendations that only restate the failed checks are dropped.
+"""
+
+import json
+from typing import Any, Literal
+
+ResultEncoding = Literal["json", "kv", "repr"]
+
+
+def prune_result(result: Any) -> Any:
+    """Drop fields the model does not need from dict results."""
+    if not isinstance(result, dict):
+        return result
+    pruned = {}
+    for key, value in result.items():
+        if key == "checks" and isinstance(value, dict):
+            failed = [name for name, passed in value.items() if not passed]
+            if failed:
+                pruned["failed"] = failed
+        elif value not in ([], {}, None):
+            pruned[key] = value
+    # "Add <check>" recommendations only restate the failed list
+    if pruned.get("recommendations") == [f"Add {name}" for name in pruned.get("failed", [])]:
+        del pruned["recommendations"]
+    return pruned
+
+
+def _kv_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    if isinstance(value, (list, tuple)):
+        return ",".join(_kv_value(v) for v in value)
+    if isinstance(value, dict):
+        return ",".join(f"{k}:{_kv_value(v)}" for k, v in value.items())
+    return str(value)
+
+
+def encode_result(result: Any, encoding: ResultEncoding = "json", prune: bool = True) -> str:
+    """Encode a tool result for the LLM."""
+    if encoding == "repr":
+        return str(result)
+    if isinstance(result, str):
+        return result  # Passwords and error messages go through unchanged
+    if prune:
+        result = prune_result(result)
+    if encoding == "kv":
+        if isinstance(result, dict):
+            return " ".join(f"{k}={_kv_value(v)}" for k, v in result.items())
+        if isinstance(result, list):
+            return "\n".join(_kv_value(v) for v in result)
+        return _kv_value(result)
+    return json.dumps(result, separators=(",", ":"), ensure_ascii=False)
+
+
+def estimate_tokens(text: str, model: str | None = None, exact: bool = True) -> int:
+    """
+    Count tokens with LiteLLM's tokenizer when available, else ~4 chars per token.
+    exact=False always uses the estimate (mock mode: no LiteLLM import, no tokenizer).
+    """
+    if not exact:
+        return max(1, round(len(text) / 4))
+    try:
+        from litellm import token_counter
+        return token_counter(model=model or "gpt-4o-mini", text=text)
+    except Exception:
+        return max(1, round(len(text) / 4))
+
+
+def size_report(result: Any, model: str | None = None) -> dict[str, int]:
+    """Token estimate of a result under each encoding."""
+    return {
+        "repr": estimate_tokens(encode_result(result, "repr"), model),
+        "json": estimate_tokens(encode_result(result, "json", prune=False), model),
+        "json_pruned": estimate_tokens(encode_result(result, "json"), model),
+        "kv_pruned": estimate_tokens(encode_result(result, "kv"), model),
+    }
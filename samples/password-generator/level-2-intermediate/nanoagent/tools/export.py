@@ -0,0 +1,72 @@
+"""
+Streaming Password Export
+
+Writes generated passwords straight to a file or stdout in chunks, so memory
+stays constant regardless of how many passwords are exported.
+
+Formats:
+- text:  one password per line
+- csv:   password,strength,score
+- jsonl: one JSON object per line with the full strength analysis
+"""
+
+import csv
+import io
+import json
+from typing import Iterable, Iterator, Literal, TextIO
+
+from .password_tools import CheckPasswordStrengthInput, check_password_strength
+
+ExportFormat = Literal["text", "csv", "jsonl"]
+
+CSV_HEADER = ["password", "strength", "score"]
+
+
+def _chunks(items: Iterable[str], size: int) -> Iterator[list[str]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _format_chunk(passwords: list[str], fmt: ExportFormat) -> str:
+    if fmt == "text":
+        return "".join(f"{p}\n" for p in passwords)
+
+    rows = [(p, check_password_strength(CheckPasswordStrengthInput(password=p))) for p in passwords]
+    if fmt == "jsonl":
+        return "".join(
+            json.dumps({"password": p, **{k: v for k, v in r.items() if k != "recommendations"}}) + "\n"
+            for p, r in rows
+        )
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows((p, r["strength"], r["score"]) for p, r in rows)
+    return buffer.getvalue()
+
+
+def export_passwords(
+    passwords: Iterable[str],
+    out: TextIO,
+    fmt: ExportFormat = "text",
+    chunk_size: int = 10_000,
+) -> int:
+    """
+    Stream passwords to out, one formatted chunk per write.
+
+    Returns the number of passwords written.
+    """
+    if fmt == "csv":
+        out.write(",".join(CSV_HEADER) + "\n")
+
+    written = 0
+    for chunk in _chunks(passwords, chunk_size):
+        out.write(_format_chunk(chunk, fmt))
+        written += len(chunk)
+    out.flush()
+    return written
@@ -7,8 +7,13 @@ Uses Pydantic for schema validation and automatic JSON schema generation.
 
 import secrets
 import string
+from functools import lru_cache
 from pydantic import BaseModel, Field
 
+from .encoding import ResultEncoding, encode_result
+
+SYMBOLS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+
 
 # Tool input schemas (Pydantic models)
 class GeneratePasswordInput(BaseModel):
@@ -32,8 +37,8 @@ class GenerateMultiplePasswordsInput(BaseModel):
 
 
 # Tool implementations
-def generate_password(params: GeneratePasswordInput) -> str:
-    """Generate a cryptographically secure password."""
+def build_charset(params: GeneratePasswordInput) -> str:
+    """Return the merged character set for the enabled character types."""
     charset = ""
     if params.include_uppercase:
         charset += string.ascii_uppercase
@@ -42,7 +47,13 @@ def generate_password(params: GeneratePasswordInput) -> str:
     if params.include_numbers:
         charset += string.digits
     if params.include_symbols:
-        charset += "!@#$%^&*()_+-=[]{}|;:,.<>?"
+        charset += SYMBOLS
+    return charset
+
+
+def generate_password(params: GeneratePasswordInput) -> str:
+    """Generate a cryptographically secure password."""
+    charset = build_charset(params)
     
     if not charset:
         return "Error: At least one character type must be selected"
@@ -60,9 +71,14 @@ def check_password_strength(params: CheckPasswordStrengthInput) -> dict:
         "uppercase": any(c.isupper() for c in password),
         "lowercase": any(c.islower() for c in password),
         "numbers": any(c.isdigit() for c in password),
-        "symbols": any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password),
+        "symbols": any(c in SYMBOLS for c in password),
     }
     
+    return strength_report(len(password), checks)
+
+
+def strength_report(password_length: int, checks: dict[str, bool]) -> dict:
+    """Build the strength result dict from precomputed checks."""
     score = sum(checks.values())
     
     if score <= 2:
@@ -75,7 +91,7 @@ def check_password_strength(params: CheckPasswordStrengthInput) -> dict:
         strength = "very_strong"
     
     return {
-        "password_length": len(password),
+        "password_length": password_length,
         "strength": strength,
         "score": f"{score}/5",
         "checks": checks,
@@ -88,9 +104,12 @@ def check_password_strength(params: CheckPasswordStrengthInput) -> dict:
 def generate_multiple_passwords(params: GenerateMultiplePasswordsInput) -> list[str]:
     """Generate multiple unique passwords."""
     passwords = []
-    for _ in range(params.count):
+    seen = set()
+    while len(passwords) < params.count:
         password = generate_password(GeneratePasswordInput(length=params.length))
-        passwords.append(password)
+        if password not in seen:
+            seen.add(password)
+            passwords.append(password)
     return passwords
 
 
@@ -114,10 +133,10 @@ TOOLS = {
 }
 
 
-def get_tool_schemas() -> list[dict]:
-    """Generate OpenAI-compatible tool schemas from Pydantic models."""
+@lru_cache(maxsize=None)
+def _build_tool_schemas() -> tuple[dict, ...]:
     schemas = []
-    for name, tool in TOOLS.items():
+    for name, tool in sorted(TOOLS.items()):
         schemas.append({
             "type": "function",
             "function": {
@@ -126,11 +145,21 @@ def get_tool_schemas() -> list[dict]:
                 "parameters": tool["schema"].model_json_schema()
             }
         })
-    return schemas
+    return tuple(schemas)
+
+
+def get_tool_schemas() -> list[dict]:
+    """
+    Generate OpenAI-compatible tool schemas from Pydantic models.
+    
+    Schemas are built once and returned in name order, so the tool definitions
+    are a byte-stable part of the prompt prefix across calls.
+    """
+    return list(_build_tool_schemas())
 
 
-def execute_tool(name: str, arguments: dict) -> str:
-    """Execute a tool by name with the given arguments."""
+def execute_tool(name: str, arguments: dict, encoding: ResultEncoding = "json") -> str:
+    """Execute a tool by name and encode the result compactly for the LLM."""
     if name not in TOOLS:
         return f"Error: Unknown tool '{name}'"
     
@@ -139,6 +168,6 @@ def execute_tool(name: str, arguments: dict) -> str:
         # Validate arguments with Pydantic
         params = tool["schema"](**arguments)
         result = tool["function"](params)
-        return str(result)
+        return encode_result(result, encoding)
     except Exception as e:
         return f"Error executing {name}: {str(e)}"
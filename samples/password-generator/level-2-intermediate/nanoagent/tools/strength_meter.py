@@ -0,0 +1,77 @@
+"""
+Incremental Strength Meter
+
+Scores a password as it is typed. Instead of rescanning the whole password on
+every keystroke, the meter keeps per-class character counts and updates them
+in O(1) on append and delete. result() returns the same dict as
+check_password_strength for the current text.
+"""
+
+from .password_tools import SYMBOLS, strength_report
+
+
+def _classes(c: str) -> tuple[bool, bool, bool, bool]:
+    """Same per-character predicates as check_password_strength."""
+    return c.isupper(), c.islower(), c.isdigit(), c in SYMBOLS
+
+
+class IncrementalStrengthMeter:
+    """
+    Keystroke-level strength scoring.
+
+    Usage:
+        meter = IncrementalStrengthMeter()
+        meter.append("P")
+        meter.append("@")
+        meter.delete()
+        meter.result()  # == check_password_strength(...) for "P"
+    """
+
+    def __init__(self, password: str = ""):
+        self._chars: list[str] = []
+        self._counts = [0, 0, 0, 0]  # uppercase, lowercase, numbers, symbols
+        self.extend(password)
+
+    def __len__(self) -> int:
+        return len(self._chars)
+
+    @property
+    def password(self) -> str:
+        return "".join(self._chars)
+
+    def append(self, c: str) -> None:
+        """Add one character at the end (a keystroke); use extend() for longer text."""
+        if len(c) != 1:
+            raise ValueError(f"append() takes exactly one character, got {len(c)}")
+        self._chars.append(c)
+        for i, hit in enumerate(_classes(c)):
+            self._counts[i] += hit
+
+    def extend(self, text: str) -> None:
+        """Add several characters (e.g. a paste); O(len(text))."""
+        for c in text:
+            self.append(c)
+
+    def delete(self) -> None:
+        """Remove the last character (backspace); no-op when empty."""
+        if not self._chars:
+            return
+        c = self._chars.pop()
+        for i, hit in enumerate(_classes(c)):
+            self._counts[i] -= hit
+
+    def clear(self) -> None:
+        self._chars.clear()
+        self._counts = [0, 0, 0, 0]
+
+    def result(self) -> dict:
+        """Current analysis, identical to check_password_strength."""
+        uppercase, lowercase, numbers, symbols = self._counts
+        checks = {
+            "length": len(self._chars) >= 12,
+            "uppercase": uppercase > 0,
+            "lowercase": lowercase > 0,
+            "numbers": numbers > 0,
+            "symbols": symbols > 0,
+        }
+        return strength_report(len(self._chars), checks)
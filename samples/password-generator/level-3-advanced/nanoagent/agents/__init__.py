@@ -1,15 +1,52 @@
 # Agents package for the advanced nanoagent
 from .base import BaseAgent, AgentRole, AgentContext, AgentMessage
+from .assets import AssetBundle, AssetNotFoundError, get_bundle
+from .batching import BatchPolicy, BatchParseError, MicroBatcher
+from .cassette import Cassette, CassetteMiss
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, BreakerState
+from .hedging import LatencyTracker, hedged_call
+from .log import configure_logging, get_logger, new_request_id, request_id_var
+from .profiler import Profiler
+from .classifier import RequestClassifier, ParsedRequest, FastPathStats
+from .plan_cache import PlanCache
 from .planner import PlannerAgent
 from .implementer import ImplementerAgent
 from .tester import TesterAgent
+from .usage import Budget, BudgetExceededError, UsageLedger, budget_var, usage_batch
 
 __all__ = [
     "BaseAgent",
     "AgentRole", 
     "AgentContext",
     "AgentMessage",
+    "AssetBundle",
+    "AssetNotFoundError",
+    "get_bundle",
+    "BatchPolicy",
+    "BatchParseError",
+    "MicroBatcher",
+    "Cassette",
+    "CassetteMiss",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "BreakerState",
+    "LatencyTracker",
+    "hedged_call",
+    "configure_logging",
+    "get_logger",
+    "new_request_id",
+    "request_id_var",
+    "Profiler",
+    "RequestClassifier",
+    "ParsedRequest",
+    "FastPathStats",
+    "PlanCache",
     "PlannerAgent",
     "ImplementerAgent",
     "TesterAgent",
+    "Budget",
+    "BudgetExceededError",
+    "UsageLedger",
+    "budget_var",
+    "usage_batch",
 ]
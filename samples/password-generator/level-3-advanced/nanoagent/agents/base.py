@@ -5,7 +5,9 @@ Provides the foundation for all specialized agents in the multi-agent system.
 Each agent has a role, system prompt, and can communicate via messages.
 """
 
+import logging
 import os
+import time
 import warnings
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -13,6 +15,15 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from .assets import get_bundle
+from .cassette import Cassette, CassetteMiss
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .hedging import LatencyTracker, hedged_call, timed_call
+from .log import get_logger
+from .profiler import stage
+from .prompt_cache import PrefixCacheMeter, estimate_tokens, mark_cacheable
+from .usage import UsageLedger, usage_from_response
+
 
 # Keep the console output clean: LiteLLM/OpenAI response models can trigger noisy
 # Pydantic v2 serializer warnings when internally converted to plain Python.
@@ -39,6 +50,15 @@ class AgentRole(Enum):
     COORDINATOR = "coordinator"
 
 
+# Per-role model overrides; roles without an override use NANOAGENT_MODEL
+ROLE_MODEL_ENV = {
+    AgentRole.PLANNER: "NANOAGENT_MODEL_PLANNER",
+    AgentRole.IMPLEMENTER: "NANOAGENT_MODEL_IMPLEMENTER",
+    AgentRole.TESTER: "NANOAGENT_MODEL_TESTER",
+    AgentRole.COORDINATOR: "NANOAGENT_MODEL_COORDINATOR",
+}
+
+
 @dataclass
 class AgentMessage:
     """Message passed between agents."""
@@ -56,6 +76,7 @@ class AgentContext:
     """Shared context passed through the agent pipeline."""
     user_request: str
     plan: str | None = None
+    config: dict | None = None
     implementation: dict | None = None
     test_results: dict | None = None
     final_response: str | None = None
@@ -72,13 +93,33 @@ class BaseAgent(ABC):
     
     Each agent has:
     - A role (planner, implementer, tester, coordinator)
-    - A system prompt defining its behavior
+    - A system prompt defining its behavior (prompts/{role}.md, see agents/assets.py)
     - An async process method for handling requests
+    - A latency tracker used for optional request hedging
+    - An optional circuit breaker shared with the other agents
+    - An optional cassette to record LLM calls to, or replay them from
+    - A structured logger (see agents/log.py)
+    - An optional usage ledger for token/cost accounting and budgets (see agents/usage.py)
     """
     
-    def __init__(self, role: AgentRole, mock: bool = False):
+    def __init__(
+        self,
+        role: AgentRole,
+        mock: bool = False,
+        hedge: bool = False,
+        breaker: CircuitBreaker | None = None,
+        cassette: Cassette | None = None,
+        ledger: UsageLedger | None = None,
+    ):
         self.role = role
         self.mock = mock
+        self.hedge = hedge
+        self.breaker = breaker
+        self.cassette = cassette
+        self.ledger = ledger
+        self.latency = LatencyTracker()
+        self.prefix_meter = PrefixCacheMeter(exact=not mock)
+        self.logger = get_logger(role.value)
         self.system_prompt = self._get_system_prompt()
 
     def _load_dotenv_if_available(self) -> None:
@@ -100,7 +141,7 @@ class BaseAgent(ABC):
 
     def _get_llm_config(self) -> tuple[str, str | None, str | None]:
         """Resolve model + optional credentials from environment variables."""
-        model = os.getenv("NANOAGENT_MODEL", "gpt-4.1-mini")
+        model = os.getenv(ROLE_MODEL_ENV[self.role]) or os.getenv("NANOAGENT_MODEL", "gpt-4.1-mini")
         api_key = os.getenv("NANOAGENT_API_KEY") or os.getenv("OPENAI_API_KEY")
         api_base = (
             os.getenv("NANOAGENT_API_BASE")
@@ -109,10 +150,16 @@ class BaseAgent(ABC):
         )
         return model, api_key, api_base
     
-    @abstractmethod
     def _get_system_prompt(self) -> str:
-        """Return the system prompt for this agent."""
-        pass
+        """Return the system prompt for this agent: prompts/{role}.md from the asset bundle."""
+        return get_bundle().get(self.role.value)
+    
+    def build_messages(self, user_content: str) -> list[dict]:
+        """System prompt first, so every call shares a byte-stable, cacheable prefix."""
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": user_content},
+        ]
     
     @abstractmethod
     async def process(self, context: AgentContext) -> AgentContext:
@@ -127,26 +174,42 @@ class BaseAgent(ABC):
         """
         pass
     
-    async def call_llm(self, messages: list[dict], tools: list[dict] | None = None) -> str:
+    async def call_llm(
+        self,
+        messages: list[dict],
+        tools: list[dict] | None = None,
+        mock_response: str | None = None,
+    ) -> str:
         """
         Call the LLM with messages and optional tools.
         
         Returns the response content or tool call results.
+        mock_response replaces the agent's mock response in mock mode.
+        Raises CircuitOpenError if the circuit breaker rejects the call, and
+        BudgetExceededError if the request's budget does not allow it.
         """
+        prompt = self.prefix_meter.record(messages, tools)
         if self.mock:
-            return self._get_mock_response()
+            return self._mock_reply(prompt["prompt_tokens"], mock_response)
         
-        try:
-            from litellm import acompletion
-        except ImportError:
-            return self._get_mock_response()
+        replaying = self.cassette is not None and self.cassette.replaying
+        if replaying:
+            acompletion = None  # Replay needs neither LiteLLM nor credentials
+        else:
+            try:
+                from litellm import acompletion
+            except ImportError:
+                return self._mock_reply(prompt["prompt_tokens"], mock_response)
 
-        self._load_dotenv_if_available()
+            self._load_dotenv_if_available()
         model, api_key, api_base = self._get_llm_config()
+        if self.ledger:
+            # May switch to a cheaper model, or raise BudgetExceededError
+            model = self.ledger.admit(model, prompt["prompt_tokens"])
         
         kwargs: dict[str, Any] = {
             "model": model,
-            "messages": messages,
+            "messages": mark_cacheable(messages, model),
             "temperature": 0.7,
         }
 
@@ -161,14 +224,65 @@ class BaseAgent(ABC):
             kwargs["tools"] = tools
             kwargs["tool_choice"] = "auto"
         
-        response = await acompletion(**kwargs)
-        return response.choices[0].message.content
+        if self.breaker and not self.breaker.allow_request():
+            raise CircuitOpenError(f"{self.role.value}: LLM backend circuit is open")
+
+        async def complete() -> Any:
+            if self.cassette:
+                return await self.cassette.call(lambda: acompletion(**kwargs), kwargs)
+            return await acompletion(**kwargs)
+
+        start = time.perf_counter()
+        try:
+            with stage(f"llm:{self.role.value}"):
+                # Hedging would consume two recorded interactions per call on replay
+                if self.hedge and not replaying:
+                    response = await hedged_call(complete, self.latency)
+                else:
+                    response = await timed_call(complete, self.latency)
+        except CassetteMiss:
+            # Replay never reached a backend: say nothing about its health
+            if self.breaker:
+                self.breaker.record_cancelled()
+            raise
+        except Exception as e:
+            if self.breaker:
+                self.breaker.record_failure(f"{type(e).__name__}: {e}")
+            raise
+        except BaseException:
+            # Cancelled: no verdict on the backend, but a half-open probe must not leak
+            if self.breaker:
+                self.breaker.record_cancelled()
+            raise
+        if self.breaker:
+            self.breaker.record_success(time.perf_counter() - start)
+        content = response.choices[0].message.content
+        if self.ledger:
+            usage = usage_from_response(response)
+            if usage:
+                self.ledger.record(self.role.value, model, *usage)
+            else:
+                self.ledger.record(
+                    self.role.value, model, prompt["prompt_tokens"],
+                    estimate_tokens(content or "", model), estimated=True,
+                )
+        return content
+    
+    def _mock_reply(self, prompt_tokens: int, mock_response: str | None) -> str:
+        """The mock response, with its estimated usage recorded against the configured model."""
+        content = mock_response if mock_response is not None else self._get_mock_response()
+        if self.ledger:
+            model = self.ledger.admit(self._get_llm_config()[0], prompt_tokens)
+            self.ledger.record(
+                self.role.value, model, prompt_tokens, estimate_tokens(content, exact=not self.mock), estimated=True
+            )
+        return content
     
     @abstractmethod
     def _get_mock_response(self) -> str:
         """Return a mock response for demo mode."""
         pass
     
-    def log(self, message: str) -> None:
-        """Log a message with agent role prefix."""
-        print(f"  [{self.role.value.upper()}] {message}")
+    def log(self, message: str, level: int = logging.INFO, **fields: Any) -> None:
+        """Log a message tagged with the agent role (and any extra structured fields)."""
+        self.logger.log(level, message, extra={"role": self.role.value, **fields})
@@ -0,0 +1,135 @@
+"""
+Micro-Batching
+
+Collects requests that arrive close together and hands them to a batch
+function in one call, then fans the results back out to the callers. The
+Planner uses it to plan several user requests with a single LLM round trip,
+paying for its long system prompt once per batch instead of once per request.
+
+A batch is flushed when it reaches max_batch_size, when no new request has
+arrived for `window` seconds, or `max_wait` seconds after its first request,
+whichever comes first. If the batch call fails to produce a usable result
+(BatchParseError), every request falls back to its own single call.
+
+Single calls run in the context of the request that submitted the item, so
+context variables (request id, budget) charge and log them to that request
+rather than to whichever request happened to start the collector.
+"""
+
+import asyncio
+import contextvars
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+
+class BatchParseError(ValueError):
+    """Raised by a batch function whose response cannot be split into per-request results."""
+
+
+@dataclass
+class BatchPolicy:
+    """When to flush a micro-batch."""
+    max_batch_size: int = 8
+    window: float = 0.01
+    max_wait: float = 0.05
+
+
+class MicroBatcher:
+    """
+    Batches submit() calls within one event loop.
+
+    single(item) handles one item; batch(items) must return one result per
+    item, in order, or raise BatchParseError.
+    """
+
+    def __init__(
+        self,
+        single: Callable[[str], Awaitable[str]],
+        batch: Callable[[list[str]], Awaitable[list[str]]],
+        policy: BatchPolicy | None = None,
+    ):
+        self.single = single
+        self.batch = batch
+        self.policy = policy or BatchPolicy()
+        self._pending: list[tuple[str, asyncio.Future, contextvars.Context]] = []
+        self._arrived = asyncio.Event()
+        self._collector: asyncio.Task | None = None
+        self._running: set[asyncio.Task] = set()
+
+        self.batches = 0
+        self.batched_items = 0
+        self.single_calls = 0
+        self.fallbacks = 0
+
+    async def submit(self, item: str) -> str:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((item, future, contextvars.copy_context()))
+        self._arrived.set()
+        if self._collector is None:
+            self._collector = asyncio.ensure_future(self._collect())
+        return await future
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self._pending:
+                deadline = loop.time() + self.policy.max_wait
+                while len(self._pending) < self.policy.max_batch_size:
+                    self._arrived.clear()
+                    timeout = min(self.policy.window, deadline - loop.time())
+                    if timeout <= 0:
+                        break
+                    try:
+                        await asyncio.wait_for(self._arrived.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                batch = self._pending[:self.policy.max_batch_size]
+                del self._pending[:len(batch)]
+                # Run the batch without blocking collection of the next one
+                task = asyncio.ensure_future(self._run(batch))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+        finally:
+            self._collector = None
+
+    def _single_in_context(self, item: str, context: contextvars.Context) -> asyncio.Task:
+        """single(item) as a task running in the submitter's context."""
+        return asyncio.create_task(self.single(item), context=context)
+
+    async def _run(self, batch: list[tuple[str, asyncio.Future, contextvars.Context]]) -> None:
+        items = [item for item, _, _ in batch]
+        try:
+            if len(items) == 1:
+                self.single_calls += 1
+                results: list = [await self._single_in_context(items[0], batch[0][2])]
+            else:
+                self.batches += 1
+                self.batched_items += len(items)
+                try:
+                    results = await self.batch(items)
+                except BatchParseError:
+                    self.fallbacks += 1
+                    self.single_calls += len(items)
+                    results = await asyncio.gather(
+                        *(self._single_in_context(item, context) for item, _, context in batch),
+                        return_exceptions=True,
+                    )
+        except Exception as e:
+            results = [e] * len(items)
+
+        for (_, future, _), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "batched_requests": self.batched_items,
+            "mean_batch_size": self.batched_items / self.batches if self.batches else 0.0,
+            "single_calls": self.single_calls,
+            "parse_fallbacks": self.fallbacks,
+        }
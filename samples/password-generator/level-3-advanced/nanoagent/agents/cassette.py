@@ -0,0 +1,132 @@
+"""
+LLM Cassettes (Record / Replay)
+
+Records real LLM requests, responses and latencies into a JSON cassette file,
+and replays them later without network access. Replay is strict: a call is
+served the recorded interaction with the same request, and a request that was
+never recorded raises CassetteMiss. With loose=True it gets the next unused
+interaction in recorded order instead (requests that embed freshly generated
+passwords never match exactly). Replay can run instantly, at the recorded
+speed, or accelerated.
+
+Record mode strips credentials but writes everything else to the cassette in
+plaintext, including the generated passwords: treat cassettes as secrets.
+
+Usage:
+    cassette = Cassette("run.json", mode="record")
+    response = await cassette.call(lambda: acompletion(**request), request)
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Literal
+
+CassetteMode = Literal["record", "replay"]
+
+# Request fields that never go into a cassette
+SECRET_FIELDS = {"api_key", "api_base"}
+
+
+class Replayed(dict):
+    """Dict with attribute access, standing in for LiteLLM response objects."""
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def to_plain(value: Any) -> Any:
+    """Convert LiteLLM/pydantic objects into JSON-serializable data."""
+    if isinstance(value, dict):
+        return {k: to_plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain(v) for v in value]
+    if hasattr(value, "model_dump"):
+        return to_plain(value.model_dump())
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _to_replayed(value: Any) -> Any:
+    if isinstance(value, dict):
+        return Replayed({k: _to_replayed(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return [_to_replayed(v) for v in value]
+    return value
+
+
+def request_key(request: dict) -> str:
+    plain = to_plain({k: v for k, v in request.items() if k not in SECRET_FIELDS})
+    return hashlib.sha256(json.dumps(plain, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class CassetteMiss(LookupError):
+    """Raised in replay mode when no recorded interaction matches the request."""
+
+
+class Cassette:
+    """
+    Record or replay LLM interactions.
+
+    speed (replay only): None replays instantly, 1.0 at recorded latency,
+    2.0 twice as fast, and so on. loose (replay only): serve the next unused
+    interaction in recorded order when no recorded request matches.
+    """
+
+    def __init__(self, path: str | Path, mode: CassetteMode, speed: float | None = None, loose: bool = False):
+        self.path = Path(path)
+        self.mode = mode
+        self.speed = speed
+        self.loose = loose
+        self.interactions: list[dict] = []
+        self._used: set[int] = set()
+        if mode == "replay":
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self.interactions = data["interactions"]
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    async def call(self, make_call: Callable[[], Awaitable[Any]], request: dict) -> Any:
+        if self.replaying:
+            return await self._replay(request)
+
+        start = time.perf_counter()
+        response = await make_call()
+        self.interactions.append({
+            "key": request_key(request),
+            "request": to_plain({k: v for k, v in request.items() if k not in SECRET_FIELDS}),
+            "response": to_plain(response),
+            "latency_s": time.perf_counter() - start,
+        })
+        self.save()
+        return response
+
+    async def _replay(self, request: dict) -> Any:
+        key = request_key(request)
+        unused = [i for i in range(len(self.interactions)) if i not in self._used]
+        if not unused:
+            raise CassetteMiss(f"No recorded interactions left in {self.path}")
+        index = next((i for i in unused if self.interactions[i]["key"] == key), None)
+        if index is None:
+            if not self.loose:
+                raise CassetteMiss(f"No recorded interaction in {self.path} matches this request")
+            index = unused[0]
+        self._used.add(index)
+
+        interaction = self.interactions[index]
+        if self.speed:
+            await asyncio.sleep(interaction["latency_s"] / self.speed)
+        return _to_replayed(interaction["response"])
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": 1, "interactions": self.interactions}
+        self.path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
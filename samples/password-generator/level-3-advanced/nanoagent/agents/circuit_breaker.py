@@ -0,0 +1,120 @@
+"""
+Circuit Breaker
+
+Guards LLM calls against an unhealthy backend. After enough consecutive
+failures or latency breaches the circuit opens and calls are rejected
+immediately, letting the orchestrator degrade to local processing. After a
+cool-down, a limited number of half-open probes decide whether to close again.
+"""
+
+import time
+from collections import Counter, deque
+from enum import Enum
+
+
+class BreakerState(Enum):
+    """States of the circuit breaker."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker shared by all agents.
+
+    - CLOSED: calls pass through; failures and slow calls are counted
+    - OPEN: calls are rejected until reset_timeout has elapsed
+    - HALF_OPEN: up to half_open_probes calls are let through; one success
+      closes the circuit, one failure re-opens it, a cancelled probe frees
+      its slot for the next call
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        latency_threshold: float = 15.0,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        clock=time.monotonic,
+        max_transitions: int = 100,
+    ):
+        self.failure_threshold = failure_threshold
+        self.latency_threshold = latency_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.clock = clock
+
+        self.state = BreakerState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: float | None = None
+        self.probes_in_flight = 0
+        self.rejected_calls = 0
+        self.transitions: deque[dict] = deque(maxlen=max_transitions)  # Most recent only; counts are complete
+        self.transition_counts: Counter[str] = Counter()
+
+    def _transition(self, new_state: BreakerState, reason: str) -> None:
+        if new_state is self.state:
+            return
+        key = f"{self.state.value}->{new_state.value}"
+        self.transitions.append({"transition": key, "reason": reason, "at": self.clock()})
+        self.transition_counts[key] += 1
+        self.state = new_state
+        if new_state is BreakerState.OPEN:
+            self.opened_at = self.clock()
+        self.probes_in_flight = 0
+
+    def allow_request(self) -> bool:
+        """Return True if a call may proceed (moving OPEN → HALF_OPEN after the cool-down)."""
+        if self.state is BreakerState.OPEN:
+            if self.clock() - self.opened_at < self.reset_timeout:
+                self.rejected_calls += 1
+                return False
+            self._transition(BreakerState.HALF_OPEN, "reset timeout elapsed")
+
+        if self.state is BreakerState.HALF_OPEN:
+            if self.probes_in_flight >= self.half_open_probes:
+                self.rejected_calls += 1
+                return False
+            self.probes_in_flight += 1
+        return True
+
+    def is_open(self) -> bool:
+        """Non-mutating check used by the orchestrator to pick degraded mode."""
+        return (
+            self.state is BreakerState.OPEN
+            and self.clock() - self.opened_at < self.reset_timeout
+        )
+
+    def record_success(self, latency: float) -> None:
+        if latency > self.latency_threshold:
+            self.record_failure(f"latency {latency:.1f}s over {self.latency_threshold:.1f}s")
+            return
+        self.consecutive_failures = 0
+        if self.state is BreakerState.HALF_OPEN:
+            self._transition(BreakerState.CLOSED, "probe succeeded")
+
+    def record_failure(self, reason: str = "call failed") -> None:
+        self.consecutive_failures += 1
+        if self.state is BreakerState.HALF_OPEN:
+            self._transition(BreakerState.OPEN, f"probe failed: {reason}")
+        elif self.consecutive_failures >= self.failure_threshold:
+            self._transition(BreakerState.OPEN, reason)
+
+    def record_cancelled(self) -> None:
+        """A call ended without an outcome (e.g. cancelled); release its probe slot."""
+        if self.state is BreakerState.HALF_OPEN and self.probes_in_flight > 0:
+            self.probes_in_flight -= 1
+
+    def metrics(self) -> dict:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "rejected_calls": self.rejected_calls,
+            "transition_counts": dict(self.transition_counts),
+            "transitions": list(self.transitions),
+        }
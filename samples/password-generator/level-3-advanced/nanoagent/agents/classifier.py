@@ -0,0 +1,245 @@
+"""
+Request Classifier
+
+Extracts password constraints directly from the user request without an LLM call.
+The orchestrator uses it as a fast path: confidently-parsed requests skip the
+Planner and go straight to the Implementer.
+"""
+
+import re
+from dataclasses import dataclass
+
+
+# Synonyms for each character class, keyed by the GeneratePasswordInput field
+CHARACTER_CLASSES = {
+    "include_uppercase": ["uppercase", "upper case", "upper-case", "capital letters", "capitals"],
+    "include_lowercase": ["lowercase", "lower case", "lower-case"],
+    "include_numbers": ["numbers", "number", "digits", "digit", "numerals", "numeric"],
+    "include_symbols": ["symbols", "symbol", "special characters", "special chars", "punctuation"],
+}
+
+# Phrases that need real planning (or a different tool) rather than a single password
+AMBIGUOUS_TERMS = [
+    "memorable", "pronounceable", "passphrase", "pass phrase", "words", "pin",
+    "multiple", "several", "options", "passwords", "check", "strength of",
+    "analyze", "analyse", "is this", "compare", "explain",
+]
+
+# Strength wording the Planner would act on; part of the plan cache key
+STRENGTH_TERMS = {
+    "high": r"\b(?:very|highly|extremely|super|maximum|max|ultra)[\s-]+(?:secure|strong|safe)\b|\bstrongest\b|\bmost secure\b",
+    "low": r"\b(?:simple|basic|easy|short|weak)\b",
+}
+
+GENERATE_VERBS = ["generate", "create", "make", "give", "need", "want", "new"]
+
+NEGATIONS = r"(?:no|without|exclude|excluding|except|avoid|not)"
+
+# Ambiguous-character exclusions, negated like a character class
+AMBIGUOUS_NAMES = ["ambiguous", "look-alike", "lookalike", "similar-looking"]
+
+
+def _names_pattern(names: list[str]) -> str:
+    # Longest first, so "numbers" wins over "number" and "upper case" over "upper"
+    return "|".join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+
+
+_CLASS_NAMES = {name: key for key, synonyms in CHARACTER_CLASSES.items() for name in synonyms}
+_CLASS = _names_pattern(list(_CLASS_NAMES))
+_ITEM = rf"(?:any\s+)?(?:{_names_pattern([*_CLASS_NAMES, *AMBIGUOUS_NAMES])})(?:\s+(?:characters?|chars?|letters?))?"
+# "numbers, symbols or uppercase": a coordinated list of classes
+_ITEM_LIST = rf"{_ITEM}(?:\s*(?:,|/|&|\bor\b|\band\b|\bnor\b)\s*{_ITEM})*"
+_CLASS_LIST = rf"(?:{_CLASS})(?:\s+(?:characters?|chars?|letters?))?(?:\s*(?:,|/|&|\bor\b|\band\b)\s*(?:{_CLASS})(?:\s+(?:characters?|chars?|letters?))?)*"
+
+# Constraint wording the classifier cannot map onto the config; the Planner handles it
+UNMAPPED_CONSTRAINTS = [
+    r"\bat\s+(?:least|most)\b",
+    r"\b(?:minimum|maximum|min|max)\s+(?:of\s+)?\d",
+    r"\b(?:more|fewer|less)\s+than\b",
+    r"\bexactly\s+\d+\s+(?!characters?\b|chars?\b)",
+    rf"\b\d+\s+(?:{_CLASS})\b",
+    r"\b(?:starts?|begins?|ends?)\s+with\b",
+    r"\b(?:(?:do|does|should|must|ca|wo)n[’']?t|cannot|never)\b",
+]
+
+LENGTH_PATTERNS = [
+    r"(\d{1,3})\s*-?\s*(?:characters?|chars?)\b",
+    r"\blength\s*(?:of\s*)?[:=]?\s*(\d{1,3})\b",
+    r"(\d{1,3})\s*-?\s*long\b",
+]
+
+MIN_LENGTH = 8
+MAX_LENGTH = 128
+
+
+@dataclass
+class ParsedRequest:
+    """
+    Result of classifying a user request locally.
+
+    cacheable: the request is a plain single-password request whose constraints
+    are fully captured by length, config and use case (see PlanCache).
+    """
+    config: dict
+    use_case: str | None = None
+    strength: str | None = None
+    length: int | None = None
+    confident: bool = False
+    cacheable: bool = False
+    reason: str = ""
+
+
+@dataclass
+class FastPathStats:
+    """
+    Counters for how many requests were served without the Planner. Planner
+    latency is kept as a running sum and count, so a long-running daemon
+    does not accumulate one entry per call.
+    """
+    total_requests: int = 0
+    fast_path_hits: int = 0
+    planner_calls: int = 0
+    planner_seconds: float = 0.0
+
+    def record_fast_path(self) -> None:
+        self.total_requests += 1
+        self.fast_path_hits += 1
+
+    def record_planner(self, latency: float) -> None:
+        self.total_requests += 1
+        self.planner_calls += 1
+        self.planner_seconds += latency
+
+    @property
+    def fast_path_fraction(self) -> float:
+        return self.fast_path_hits / self.total_requests if self.total_requests else 0.0
+
+    @property
+    def mean_planner_latency(self) -> float | None:
+        if not self.planner_calls:
+            return None
+        return self.planner_seconds / self.planner_calls
+
+    @property
+    def latency_saved(self) -> float | None:
+        """Estimated seconds saved: fast path hits × mean observed Planner latency."""
+        mean = self.mean_planner_latency
+        return None if mean is None else mean * self.fast_path_hits
+
+    def summary(self) -> dict:
+        return {
+            "total_requests": self.total_requests,
+            "fast_path_hits": self.fast_path_hits,
+            "fast_path_fraction": round(self.fast_path_fraction, 3),
+            "mean_planner_latency_s": self.mean_planner_latency,
+            "estimated_latency_saved_s": self.latency_saved,
+        }
+
+
+class RequestClassifier:
+    """
+    Parses length and character-class constraints from a plain-text request.
+
+    A request is confident only when it clearly asks for a single password,
+    states an explicit length within range, and contains no terms that need
+    the Planner to interpret. Everything else falls back to the Planner.
+    """
+
+    def classify(self, user_request: str) -> ParsedRequest:
+        text = user_request.lower()
+        config = {
+            "length": 16,
+            "include_uppercase": True,
+            "include_lowercase": True,
+            "include_numbers": True,
+            "include_symbols": True,
+            "require_each_class": True,
+        }
+        parsed = ParsedRequest(
+            config=config,
+            use_case=self._extract_use_case(text),
+            strength=self._extract_strength(text),
+        )
+
+        if not re.search(r"\bpassw(?:or)?d\b", text):
+            parsed.reason = "not a password request"
+            return parsed
+
+        ambiguous = [term for term in AMBIGUOUS_TERMS if re.search(rf"\b{re.escape(term)}\b", text)]
+        if ambiguous:
+            parsed.reason = f"ambiguous terms: {', '.join(ambiguous)}"
+            return parsed
+
+        if not any(re.search(rf"\b{verb}\b", text) for verb in GENERATE_VERBS) and not re.match(r"\s*\d", text):
+            parsed.reason = "no generation intent"
+            return parsed
+
+        unmapped = self._apply_character_classes(text, config)
+        if unmapped:
+            parsed.reason = f"unmapped constraints: {', '.join(repr(u.strip()) for u in unmapped)}"
+            return parsed
+
+        lengths = {int(m) for pattern in LENGTH_PATTERNS for m in re.findall(pattern, text)}
+        if len(lengths) > 1:
+            parsed.reason = "conflicting lengths"
+            return parsed
+        parsed.cacheable = True
+        if not lengths:
+            parsed.reason = "no explicit length"
+            return parsed
+        length = parsed.length = lengths.pop()
+        if not MIN_LENGTH <= length <= MAX_LENGTH:
+            parsed.reason = f"length {length} out of range"
+            return parsed
+        config["length"] = length
+
+        if not any(config[key] for key in CHARACTER_CLASSES):
+            parsed.reason = "all character classes excluded"
+            return parsed
+
+        parsed.confident = True
+        parsed.reason = "explicit constraints"
+        return parsed
+
+    def _apply_character_classes(self, text: str, config: dict) -> list[str]:
+        """
+        Apply 'only X', 'X only' and 'without X or Y' phrases to the config.
+        Returns the constraint wording it could not map (the Planner's job).
+        """
+        unmapped = [m.group(0) for pattern in UNMAPPED_CONSTRAINTS for m in re.finditer(pattern, text)]
+
+        only = re.finditer(rf"\bonly\s+(?:use\s+|using\s+)?({_CLASS_LIST})|({_CLASS_LIST})\s+only\b", text)
+        allowed = set()
+        mapped_only = set()
+        for match in only:
+            allowed |= {_CLASS_NAMES[name] for name in re.findall(_CLASS, match.group(0))}
+            mapped_only.add(match.start() if match.group(1) else match.end() - len("only"))
+        unmapped += [
+            text[m.start():].split(",", 1)[0][:40] for m in re.finditer(r"\bonly\b", text) if m.start() not in mapped_only
+        ]
+        if allowed:
+            for key in CHARACTER_CLASSES:
+                config[key] = key in allowed
+
+        for negation in re.finditer(rf"\b{NEGATIONS}\b", text):
+            excluded = re.match(rf"{NEGATIONS}\s+({_ITEM_LIST})", text[negation.start():])
+            if excluded is None:
+                unmapped.append(text[negation.start():].split(",", 1)[0][:40])
+                continue
+            rest = text[negation.start() + excluded.end():]
+            if re.match(r"\s*(?:,\s*)?(?:or|nor)\s+\w", rest):
+                unmapped.append(excluded.group(0) + rest[:20])  # "without numbers or spaces"
+                continue
+            for name in re.findall(_names_pattern([*_CLASS_NAMES, *AMBIGUOUS_NAMES]), excluded.group(1)):
+                if name in AMBIGUOUS_NAMES:
+                    config["exclude_ambiguous"] = True
+                else:
+                    config[_CLASS_NAMES[name]] = False
+        return unmapped
+
+    def _extract_strength(self, text: str) -> str | None:
+        return next((level for level, pattern in STRENGTH_TERMS.items() if re.search(pattern, text)), None)
+
+    def _extract_use_case(self, text: str) -> str | None:
+        match = re.search(r"\bfor\s+(?:my\s+|a\s+|an\s+|the\s+)?([a-z][a-z\s-]*?)\s*(?:[.,!?]|$|\bwith\b)", text)
+        return match.group(1).strip() if match else None
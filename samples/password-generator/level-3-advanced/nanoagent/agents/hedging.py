@@ -0,0 +1,106 @@
+"""
+Hedged LLM Requests
+
+Tracks per-agent call latency and, when hedging is enabled, fires a second
+identical request if the first has not answered within the observed p95.
+Whichever request answers first wins; the other is cancelled.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+
+class LatencyTracker:
+    """Rolling window of call latencies used to derive the hedge delay."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20, default_delay: float = 2.0):
+        self.samples: deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+        self.default_delay = default_delay
+        self.calls = 0
+        self.hedges_fired = 0
+        self.hedges_won = 0
+
+    def record(self, latency: float) -> None:
+        self.samples.append(latency)
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the given percentile, or None until enough samples exist."""
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+        return ordered[index]
+
+    def hedge_delay(self) -> float:
+        p95 = self.percentile(95)
+        return self.default_delay if p95 is None else p95
+
+    def summary(self) -> dict:
+        return {
+            "calls": self.calls,
+            "p50_s": self.percentile(50),
+            "p95_s": self.percentile(95),
+            "hedges_fired": self.hedges_fired,
+            "hedges_won": self.hedges_won,
+        }
+
+
+async def _timed(make_call: Callable[[], Awaitable[Any]]) -> tuple[Any, float]:
+    start = time.perf_counter()
+    result = await make_call()
+    return result, time.perf_counter() - start
+
+
+async def timed_call(make_call: Callable[[], Awaitable[Any]], tracker: LatencyTracker) -> Any:
+    """Run a single call and record its latency."""
+    tracker.calls += 1
+    result, latency = await _timed(make_call)
+    tracker.record(latency)
+    return result
+
+
+async def hedged_call(make_call: Callable[[], Awaitable[Any]], tracker: LatencyTracker) -> Any:
+    """
+    Run make_call(), hedging with a second attempt after the p95-derived delay.
+
+    Returns the first successful result. If one attempt fails while the other
+    is still running, the other attempt's outcome is used instead.
+    """
+    tracker.calls += 1
+    start = time.perf_counter()
+    primary = asyncio.ensure_future(_timed(make_call))
+    attempts = [primary]
+    try:
+        done, _ = await asyncio.wait({primary}, timeout=tracker.hedge_delay())
+        if done:
+            result, latency = primary.result()
+            tracker.record(latency)
+            return result
+
+        tracker.hedges_fired += 1
+        backup = asyncio.ensure_future(_timed(make_call))
+        attempts.append(backup)
+        pending = {primary, backup}
+        error: BaseException | None = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is not None:
+                    error = task.exception()
+                    continue
+                result, latency = task.result()
+                if task is backup:
+                    # Record the primary's censored latency so the tail stays visible
+                    tracker.hedges_won += 1
+                    latency = time.perf_counter() - start
+                tracker.record(latency)
+                return result
+        raise error
+    finally:
+        # The loser of the race, or both attempts if the caller was cancelled
+        for task in attempts:
+            if not task.done():
+                task.cancel()
@@ -7,12 +7,16 @@ Hands off to the Tester agent.
 
 import json
 from .base import BaseAgent, AgentRole, AgentContext, AgentMessage
+from .cassette import Cassette
+from .circuit_breaker import CircuitBreaker
+from .usage import UsageLedger
 
 # Import tools
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from tools.shared_tools import generate_password, GeneratePasswordInput
+from tools.executor import ToolExecutor
 
 
 class ImplementerAgent(BaseAgent):
@@ -26,42 +30,32 @@ class ImplementerAgent(BaseAgent):
     - Hand off results to Tester
     """
     
-    def __init__(self, mock: bool = False):
-        super().__init__(AgentRole.IMPLEMENTER, mock)
-    
-    def _get_system_prompt(self) -> str:
-        return """You are an Implementation Agent that executes password generation plans.
-
-Given a plan, you will:
-1. Extract the password configuration from the plan
-2. Call the password generation tool
-3. Document what was generated
-
-Output format:
----
-CONFIGURATION:
-- Length: [number]
-- Uppercase: [yes/no]
-- Lowercase: [yes/no]
-- Numbers: [yes/no]
-- Symbols: [yes/no]
-
-GENERATED PASSWORD: [password]
-
-IMPLEMENTATION NOTES:
-- [Any relevant notes]
----"""
+    def __init__(
+        self,
+        mock: bool = False,
+        hedge: bool = False,
+        breaker: CircuitBreaker | None = None,
+        cassette: Cassette | None = None,
+        ledger: UsageLedger | None = None,
+        executor: ToolExecutor | None = None,
+    ):
+        super().__init__(AgentRole.IMPLEMENTER, mock, hedge, breaker, cassette, ledger)
+        self.executor = executor or ToolExecutor()
     
     async def process(self, context: AgentContext) -> AgentContext:
         """Execute the plan and generate passwords."""
         self.log("Executing implementation plan...")
         
-        # Parse plan to extract configuration (simplified)
-        config = self._parse_plan(context.plan)
+        # Use constraints from the fast path if present, otherwise parse the plan
+        if context.config is not None:
+            config = context.config
+        else:
+            config = self._parse_plan(context.plan)
         
         # Generate password using tool
         self.log(f"Generating password with config: {config}")
-        password = generate_password(GeneratePasswordInput(**config))
+        params = GeneratePasswordInput(**config)
+        password = await self.executor.run(generate_password, params, size=params.length)
         
         implementation = {
             "config": config,
@@ -91,7 +85,8 @@ IMPLEMENTATION NOTES:
             "include_uppercase": True,
             "include_lowercase": True,
             "include_numbers": True,
-            "include_symbols": True
+            "include_symbols": True,
+            "require_each_class": True
         }
         
         if not plan:
@@ -0,0 +1,147 @@
+"""
+Structured Logging
+
+Queue-backed logging for the agents and the orchestrator. Log calls only build
+a record and put it on a queue; a listener thread formats and writes it, so
+console and file I/O stay off the event loop even with many concurrent
+pipelines.
+
+- Levels: the standard logging levels; disabled levels cost one integer check
+- Sinks: a human-readable console sink and an optional JSON-lines file
+- Quiet mode: the console only shows warnings and errors (batch runs)
+- Correlation IDs: every record carries the request ID of the pipeline that
+  logged it, taken from a context variable that asyncio copies into each task
+
+Usage:
+    listener = configure_logging(quiet=True, json_path="runs/log.jsonl")
+    try:
+        ...
+    finally:
+        listener.stop()   # drains the queue
+"""
+
+import contextvars
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import uuid
+from pathlib import Path
+from typing import TextIO
+
+LOGGER_NAME = "nanoagent"
+
+# Request ID of the pipeline running in the current context ("-" outside a request)
+request_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="-")
+
+# LogRecord attributes that are not user-supplied `extra` fields
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+def get_logger(name: str | None = None) -> logging.Logger:
+    """Logger under the nanoagent namespace."""
+    return logging.getLogger(f"{LOGGER_NAME}.{name}" if name else LOGGER_NAME)
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+class CorrelationFilter(logging.Filter):
+    """Stamp records with the current request ID (runs in the caller, before queuing)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class ConsoleFormatter(logging.Formatter):
+    """The sample's console layout: agent lines are prefixed with the role."""
+
+    def __init__(self, with_request_id: bool = False):
+        super().__init__()
+        self.with_request_id = with_request_id
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        role = getattr(record, "role", None)
+        if role:
+            message = f"  [{role.upper()}] {message}"
+        if record.levelno >= logging.WARNING:
+            message = f"{record.levelname}: {message}"
+        if self.with_request_id:
+            # Prefix every line so interleaved pipelines stay readable
+            prefix = f"[{getattr(record, 'request_id', '-')}] "
+            message = "\n".join(prefix + line for line in message.split("\n"))
+        return message
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    One JSON object per record, including any `extra` fields.
+
+    Records logged with extra={"sensitive": True} (e.g. the final response,
+    which contains the password) keep their fields but not their message.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        sensitive = getattr(record, "sensitive", False)
+        entry = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": "[redacted]" if sensitive else record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and key not in entry:
+                entry[key] = value
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def configure_logging(
+    level: int | str = logging.INFO,
+    quiet: bool = False,
+    json_path: str | Path | None = None,
+    console: TextIO | None = None,
+    with_request_id: bool = False,
+    queued: bool = True,
+) -> logging.handlers.QueueListener | None:
+    """
+    Route the nanoagent loggers to the console (and optionally a JSON-lines file).
+
+    Returns the started QueueListener; call .stop() before exiting to flush.
+    With queued=False, handlers write synchronously in the caller (no listener).
+    """
+    console_handler = logging.StreamHandler(console or sys.stdout)
+    console_handler.setFormatter(ConsoleFormatter(with_request_id=with_request_id))
+    console_handler.setLevel(logging.WARNING if quiet else logging.NOTSET)
+    handlers: list[logging.Handler] = [console_handler]
+
+    if json_path:
+        Path(json_path).parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.FileHandler(json_path, encoding="utf-8")
+        file_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(file_handler)
+
+    logger = get_logger()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    logger.propagate = False
+    # In quiet mode without a file sink, drop INFO records before they are built
+    logger.setLevel(logging.WARNING if quiet and not json_path else level)
+
+    if not queued:
+        for handler in handlers:
+            handler.addFilter(CorrelationFilter())
+            logger.addHandler(handler)
+        return None
+
+    queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(CorrelationFilter())
+    logger.addHandler(queue_handler)
+    listener = logging.handlers.QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
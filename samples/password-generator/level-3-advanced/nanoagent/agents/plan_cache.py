@@ -0,0 +1,103 @@
+"""
+Plan Cache
+
+Caches Planner output by canonical constraints instead of by request text.
+"16 char password with symbols" and "Generate a 16-character password including
+symbols" parse to the same constraints locally, so the second request reuses the
+first one's plan and skips the Planner's LLM call.
+
+Only the plan is cached. Passwords are generated after planning, on every
+request, and never enter the cache.
+"""
+
+import re
+import time
+from collections import OrderedDict
+
+from .classifier import CHARACTER_CLASSES, ParsedRequest
+
+# Trailing words that do not change what a use case needs
+GENERIC_USE_CASE_WORDS = {"account", "accounts", "application", "app", "login", "site", "website", "portal"}
+
+PlanKey = tuple
+
+
+def canonical_use_case(use_case: str | None) -> str | None:
+    """Normalize a use case: 'my Banking  Application' → 'banking'."""
+    if not use_case:
+        return None
+    words = re.sub(r"[^a-z0-9\s]", " ", use_case.lower()).split()
+    while len(words) > 1 and words[-1] in GENERIC_USE_CASE_WORDS:
+        words.pop()
+    return " ".join(words) or None
+
+
+class PlanCache:
+    """
+    LRU cache of plans keyed by (length, character classes, strength, use case).
+
+    max_entries bounds memory; ttl (seconds, None for no expiry) lets plans be
+    refreshed when the Planner's prompt or model changes.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float | None = 3600.0, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._plans: OrderedDict[PlanKey, tuple[str, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+
+    def key_for(self, parsed: ParsedRequest) -> PlanKey | None:
+        """Canonical key for a request, or None if its plan must not be shared."""
+        if not parsed.cacheable:
+            return None
+        classes = tuple(bool(parsed.config.get(name)) for name in CHARACTER_CLASSES)
+        return (
+            parsed.length,
+            classes,
+            bool(parsed.config.get("exclude_ambiguous")),
+            parsed.strength,
+            canonical_use_case(parsed.use_case),
+        )
+
+    def get(self, parsed: ParsedRequest) -> str | None:
+        """Return the cached plan for a request, counting hits, misses and uncacheable requests."""
+        key = self.key_for(parsed)
+        if key is None:
+            self.uncacheable += 1
+            return None
+        entry = self._plans.get(key)
+        if entry is not None and self.ttl is not None and self.clock() - entry[1] > self.ttl:
+            del self._plans[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._plans.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, parsed: ParsedRequest, plan: str | None) -> None:
+        key = self.key_for(parsed)
+        if key is None or not plan:
+            return
+        self._plans[key] = (plan, self.clock())
+        self._plans.move_to_end(key)
+        while len(self._plans) > self.max_entries:
+            self._plans.popitem(last=False)
+
+    def plans(self) -> list[str]:
+        """Cached plan texts, least recently used first."""
+        return [plan for plan, _ in self._plans.values()]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._plans),
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncacheable": self.uncacheable,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
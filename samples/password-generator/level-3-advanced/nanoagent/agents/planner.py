@@ -2,10 +2,20 @@
 Planner Agent
 
 Analyzes user requirements and creates a structured plan for password generation.
-Hands off to the Implementer agent.
+Hands off to the Implementer agent. With a BatchPolicy, concurrent requests are
+planned together in one LLM call (see batching.py).
 """
 
+import itertools
+import json
+import re
+
 from .base import BaseAgent, AgentRole, AgentContext, AgentMessage
+from .batching import BatchParseError, BatchPolicy, MicroBatcher
+from .cassette import Cassette
+from .circuit_breaker import CircuitBreaker
+from .log import request_id_var
+from .usage import UsageLedger, budget_var, usage_batch
 
 
 class PlannerAgent(BaseAgent):
@@ -19,49 +29,27 @@ class PlannerAgent(BaseAgent):
     - Assess security considerations
     """
     
-    def __init__(self, mock: bool = False):
-        super().__init__(AgentRole.PLANNER, mock)
-    
-    def _get_system_prompt(self) -> str:
-        return """You are a Planning Agent specialized in analyzing password requirements.
-
-Your job is to:
-1. Analyze the user's password requirements
-2. Identify constraints (length, character types, use case)
-3. Create a structured plan for password generation
-4. Consider security implications
-
-Output your plan in this format:
----
-REQUIREMENTS:
-- [List extracted requirements]
-
-CONSTRAINTS:
-- Length: [number]
-- Character types: [list]
-- Use case: [description]
-
-SECURITY CONSIDERATIONS:
-- [List security notes]
-
-IMPLEMENTATION PLAN:
-1. [Step 1]
-2. [Step 2]
-...
----
-
-Be concise but thorough."""
+    def __init__(
+        self,
+        mock: bool = False,
+        hedge: bool = False,
+        breaker: CircuitBreaker | None = None,
+        cassette: Cassette | None = None,
+        ledger: UsageLedger | None = None,
+        batch: BatchPolicy | None = None,
+    ):
+        super().__init__(AgentRole.PLANNER, mock, hedge, breaker, cassette, ledger)
+        self.batcher = MicroBatcher(self.create_plan, self.create_plans, batch) if batch else None
+        self._batch_ids = itertools.count(1)
     
     async def process(self, context: AgentContext) -> AgentContext:
         """Analyze requirements and create a plan."""
         self.log("Analyzing user requirements...")
         
-        messages = [
-            {"role": "system", "content": self.system_prompt},
-            {"role": "user", "content": f"Create a plan for: {context.user_request}"}
-        ]
-        
-        plan = await self.call_llm(messages)
+        if self.batcher:
+            plan = await self.batcher.submit(context.user_request)
+        else:
+            plan = await self.create_plan(context.user_request)
         context.plan = plan
         
         # Create handoff message
@@ -76,6 +64,40 @@ Be concise but thorough."""
         self.log("Plan created. Handing off to Implementer.")
         return context
     
+    async def create_plan(self, user_request: str) -> str:
+        """Plan a single request."""
+        return await self.call_llm(self.build_messages(f"Create a plan for: {user_request}"))
+    
+    async def create_plans(self, user_requests: list[str]) -> list[str]:
+        """
+        Plan several requests in one call.
+        
+        The system prompt is unchanged (cacheable prefix); the user message lists
+        the requests as JSON and asks for a JSON array of plans in the same order.
+        Raises BatchParseError if the response is not such an array.
+        
+        The call is shared by several requests, so its usage is recorded under
+        the batch rather than charged to (or budgeted against) any one of them.
+        """
+        self.log(f"Planning {len(user_requests)} requests in one call...")
+        content = (
+            f"Create a plan for each of the following {len(user_requests)} requests. "
+            f"Respond with only a JSON array of {len(user_requests)} strings, in the same order; "
+            "each string is the complete plan for that request, in the format above.\n\n"
+            f"Requests:\n{json.dumps(user_requests, indent=1, ensure_ascii=False)}"
+        )
+        mock_response = json.dumps([self._get_mock_response()] * len(user_requests))
+        batch_id = f"planner-batch-{next(self._batch_ids)}"
+        request_token = request_id_var.set(batch_id)
+        budget_token = budget_var.set(None)
+        try:
+            with usage_batch(batch_id):
+                response = await self.call_llm(self.build_messages(content), mock_response=mock_response)
+        finally:
+            budget_var.reset(budget_token)
+            request_id_var.reset(request_token)
+        return parse_plan_array(response, len(user_requests))
+    
     def _get_mock_response(self) -> str:
         return """---
 REQUIREMENTS:
@@ -99,3 +121,18 @@ IMPLEMENTATION PLAN:
 3. Verify password meets all constraints
 4. Calculate and report strength score
 ---"""
+
+
+def parse_plan_array(response: str | None, expected: int) -> list[str]:
+    """Parse a JSON array of plans, tolerating a surrounding Markdown code fence."""
+    text = (response or "").strip()
+    fenced = re.match(r"^```(?:json)?\s*(.*?)\s*```$", text, re.DOTALL)
+    if fenced:
+        text = fenced.group(1)
+    try:
+        plans = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise BatchParseError(f"Batched plan response is not JSON: {e}") from e
+    if not isinstance(plans, list) or len(plans) != expected or not all(isinstance(p, str) and p for p in plans):
+        raise BatchParseError(f"Expected a JSON array of {expected} non-empty strings")
+    return plans
@@ -0,0 +1,98 @@
+"""
+Prompt Prefix Caching
+
+Providers cache the longest byte-identical prompt prefix they have seen
+recently (OpenAI automatically, Anthropic via cache_control markers), which
+cuts time-to-first-token on repeated calls. This module keeps the prefix
+stable and measures how much of each prompt is cacheable:
+
+- the prefix is the tool definitions plus the agent's system prompt
+- each agent's system prompt is built once, at construction
+- cache_control markers are added only for models that support them
+"""
+
+import hashlib
+import json
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def estimate_tokens(text: str, model: str | None = None, exact: bool = True) -> int:
+    """
+    Count tokens with LiteLLM's tokenizer when available, else ~4 chars per token.
+    exact=False always uses the estimate (mock mode: no LiteLLM import, no tokenizer).
+    """
+    if not exact:
+        return max(1, round(len(text) / 4))
+    try:
+        from litellm import token_counter
+        return token_counter(model=model or "gpt-4o-mini", text=text)
+    except Exception:
+        return max(1, round(len(text) / 4))
+
+
+def supports_cache_control(model: str) -> bool:
+    """True if the model accepts explicit cache_control markers."""
+    try:
+        from litellm.utils import supports_prompt_caching
+        return bool(supports_prompt_caching(model=model))
+    except Exception:
+        return model.startswith(("anthropic/", "claude", "bedrock/anthropic"))
+
+
+def mark_cacheable(messages: list[dict], model: str) -> list[dict]:
+    """Return messages with a cache_control breakpoint on the system prompt, if supported."""
+    if not messages or messages[0]["role"] != "system" or not supports_cache_control(model):
+        return messages
+    system = messages[0]
+    marked = {
+        "role": "system",
+        "content": [{"type": "text", "text": system["content"], "cache_control": CACHE_CONTROL}],
+    }
+    return [marked, *messages[1:]]
+
+
+def _canonical(value) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+class PrefixCacheMeter:
+    """
+    Measures the cacheable prefix of each call and checks that it stays byte-stable.
+    exact=False counts tokens with the ~4 chars per token estimate (mock mode).
+    """
+
+    def __init__(self, exact: bool = True):
+        self.exact = exact
+        self.calls = 0
+        self.cacheable_tokens = 0
+        self.prompt_tokens = 0
+        self.prefix_changes = 0
+        self._last_prefix_hash: str | None = None
+
+    def record(self, messages: list[dict], tools: list[dict] | None = None) -> dict:
+        system = [m for m in messages[:1] if m["role"] == "system"]
+        prefix = _canonical(tools or []) + _canonical(system)
+        rest = _canonical(messages[len(system):])
+        prefix_hash = hashlib.sha256(prefix.encode("utf-8")).hexdigest()
+
+        stable = self._last_prefix_hash in (None, prefix_hash)
+        if not stable:
+            self.prefix_changes += 1
+        self._last_prefix_hash = prefix_hash
+
+        cacheable = estimate_tokens(prefix, exact=self.exact)
+        total = cacheable + estimate_tokens(rest, exact=self.exact)
+        self.calls += 1
+        self.cacheable_tokens += cacheable
+        self.prompt_tokens += total
+        return {"cacheable_tokens": cacheable, "prompt_tokens": total, "stable": stable}
+
+    def summary(self) -> dict:
+        return {
+            "calls": self.calls,
+            "cacheable_tokens": self.cacheable_tokens,
+            "prompt_tokens": self.prompt_tokens,
+            "cacheable_fraction": self.cacheable_tokens / self.prompt_tokens if self.prompt_tokens else 0.0,
+            "prefix_changes": self.prefix_changes,
+        }
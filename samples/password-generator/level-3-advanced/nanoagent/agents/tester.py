@@ -5,13 +5,19 @@ Validates the generated password against requirements and security standards.
 Reports results back to the Coordinator.
 """
 
+import logging
+
 from .base import BaseAgent, AgentRole, AgentContext, AgentMessage
+from .cassette import Cassette
+from .circuit_breaker import CircuitBreaker
+from .usage import UsageLedger
 
 # Import tools
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from tools.shared_tools import check_password_strength, CheckPasswordStrengthInput
+from tools.executor import ToolExecutor
 
 
 class TesterAgent(BaseAgent):
@@ -25,46 +31,34 @@ class TesterAgent(BaseAgent):
     - Provide pass/fail verdict
     """
     
-    def __init__(self, mock: bool = False):
-        super().__init__(AgentRole.TESTER, mock)
-    
-    def _get_system_prompt(self) -> str:
-        return """You are a Testing Agent that validates generated passwords.
-
-Your job is to:
-1. Check the password meets all requirements
-2. Analyze password strength
-3. Identify any security concerns
-4. Provide a clear pass/fail verdict
-
-Output format:
----
-VALIDATION RESULTS:
-- Length check: [PASS/FAIL]
-- Character variety: [PASS/FAIL]
-- Strength score: [score]
-
-SECURITY ANALYSIS:
-- [Analysis points]
-
-VERDICT: [PASS/FAIL]
-RECOMMENDATIONS: [If any]
----"""
+    def __init__(
+        self,
+        mock: bool = False,
+        hedge: bool = False,
+        breaker: CircuitBreaker | None = None,
+        cassette: Cassette | None = None,
+        ledger: UsageLedger | None = None,
+        executor: ToolExecutor | None = None,
+    ):
+        super().__init__(AgentRole.TESTER, mock, hedge, breaker, cassette, ledger)
+        self.executor = executor or ToolExecutor()
     
     async def process(self, context: AgentContext) -> AgentContext:
         """Validate the generated password."""
         self.log("Validating generated password...")
         
         if not context.implementation:
-            self.log("ERROR: No implementation to test!")
+            self.log("No implementation to test!", level=logging.ERROR)
             context.test_results = {"verdict": "FAIL", "reason": "No password generated"}
             return context
         
         password = context.implementation["password"]
         
         # Check password strength using tool
-        strength_result = check_password_strength(
-            CheckPasswordStrengthInput(password=password)
+        strength_result = await self.executor.run(
+            check_password_strength,
+            CheckPasswordStrengthInput(password=password),
+            size=len(password),
         )
         
         # Determine verdict
@@ -0,0 +1,290 @@
+"""
+Token and Cost Accounting
+
+Records the token usage of every LLM call (from response.usage, or estimated
+in mock mode) and aggregates it per agent role, per request and per batch,
+with cost estimates from a local price table. Budgets cap what one request may
+spend: when the next call would exceed the budget, it is either aborted or
+downgraded to a cheaper model.
+
+Request IDs come from the logging context (request_id_var); batch IDs from
+batch_id_var, which the Planner sets for micro-batched calls and callers can
+set for a batch workload with usage_batch().
+"""
+
+import contextlib
+import contextvars
+import json
+import os
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterator, Literal
+
+from .log import get_logger, request_id_var
+
+log = get_logger("usage")
+
+# USD per 1M tokens: (input, cached input, output). Edit to match your provider
+# contract, or point NANOAGENT_PRICE_TABLE at a JSON file with the same shape.
+PRICE_TABLE: dict[str, tuple[float, float, float]] = {
+    "gpt-4.1": (2.00, 0.50, 8.00),
+    "gpt-4.1-mini": (0.40, 0.10, 1.60),
+    "gpt-4.1-nano": (0.10, 0.025, 0.40),
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "claude-sonnet-4": (3.00, 0.30, 15.00),
+    "claude-3-5-haiku": (0.80, 0.08, 4.00),
+}
+
+# Batch the current call belongs to, if any
+batch_id_var: contextvars.ContextVar[str | None] = contextvars.ContextVar("batch_id", default=None)
+
+
+class BudgetExceededError(RuntimeError):
+    """Raised when a request's next LLM call would exceed its budget."""
+
+
+def load_price_table(path: str | Path | None = None) -> dict[str, tuple[float, float, float]]:
+    """The built-in table, overridden by entries from a JSON file (path or $NANOAGENT_PRICE_TABLE)."""
+    prices = dict(PRICE_TABLE)
+    path = path or os.getenv("NANOAGENT_PRICE_TABLE")
+    if path:
+        for model, rates in json.loads(Path(path).read_text(encoding="utf-8")).items():
+            prices[model] = tuple(rates)
+    return prices
+
+
+def price_for(model: str, prices: dict) -> tuple[float, float, float] | None:
+    """Look up a model, ignoring a provider prefix ("openai/gpt-4o") and dated suffixes."""
+    name = model.split("/")[-1]
+    if name in prices:
+        return prices[name]
+    matches = [key for key in prices if name.startswith(key)]
+    return prices[max(matches, key=len)] if matches else None
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int, cached_tokens: int, prices: dict) -> float | None:
+    rates = price_for(model, prices)
+    if rates is None:
+        return None
+    input_rate, cached_rate, output_rate = rates
+    uncached = max(0, prompt_tokens - cached_tokens)
+    return (uncached * input_rate + cached_tokens * cached_rate + completion_tokens * output_rate) / 1_000_000
+
+
+def _field(obj: Any, name: str) -> Any:
+    if obj is None:
+        return None
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+
+def usage_from_response(response: Any) -> tuple[int, int, int] | None:
+    """(prompt, completion, cached) tokens from an OpenAI/LiteLLM-style response, if reported."""
+    usage = _field(response, "usage")
+    if usage is None:
+        return None
+    prompt = _field(usage, "prompt_tokens") or 0
+    completion = _field(usage, "completion_tokens") or 0
+    cached = (
+        _field(_field(usage, "prompt_tokens_details"), "cached_tokens")
+        or _field(usage, "cache_read_input_tokens")
+        or 0
+    )
+    return int(prompt), int(completion), int(cached)
+
+
+@dataclass
+class UsageRecord:
+    """Usage of a single LLM call."""
+    role: str
+    model: str
+    prompt_tokens: int
+    completion_tokens: int
+    cached_tokens: int
+    cost_usd: float | None
+    request_id: str
+    batch_id: str | None
+    estimated: bool = False
+
+
+@dataclass
+class UsageTotals:
+    """Aggregated usage of a group of calls."""
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    cost_usd: float = 0.0
+    unpriced_calls: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def add(self, record: UsageRecord) -> None:
+        self.calls += 1
+        self.prompt_tokens += record.prompt_tokens
+        self.completion_tokens += record.completion_tokens
+        self.cached_tokens += record.cached_tokens
+        if record.cost_usd is None:
+            self.unpriced_calls += 1
+        else:
+            self.cost_usd += record.cost_usd
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "total_tokens": self.total_tokens, "cost_usd": round(self.cost_usd, 6)}
+
+
+@dataclass
+class Budget:
+    """
+    Per-request spending limit.
+
+    on_exceed="abort" raises BudgetExceededError; "downgrade" switches the call
+    to downgrade_model if that still fits, and raises otherwise. A call is
+    admitted when the request's spend so far plus the call's prompt stays
+    within the limits (the completion is only known afterwards). Under a cost
+    limit, a model missing from the price table never fits: its spend could
+    not be counted against the limit.
+    """
+    max_tokens: int | None = None
+    max_cost_usd: float | None = None
+    on_exceed: Literal["abort", "downgrade"] = "abort"
+    downgrade_model: str | None = "gpt-4.1-nano"
+
+    def _fits(self, spent: UsageTotals, model: str, prompt_tokens: int, prices: dict) -> bool:
+        if self.max_tokens is not None and spent.total_tokens + prompt_tokens > self.max_tokens:
+            return False
+        if self.max_cost_usd is not None:
+            cost = estimate_cost(model, prompt_tokens, 0, 0, prices)
+            if cost is None or spent.cost_usd + cost > self.max_cost_usd:
+                return False
+        return True
+
+    def admit(self, spent: UsageTotals, model: str, prompt_tokens: int, prices: dict) -> str:
+        """Return the model to call, or raise BudgetExceededError."""
+        if self._fits(spent, model, prompt_tokens, prices):
+            return model
+        unpriced = self.max_cost_usd is not None and price_for(model, prices) is None
+        if unpriced:
+            log.warning(f"No price for model {model!r}: it cannot run under a cost budget")
+        if (
+            self.on_exceed == "downgrade"
+            and self.downgrade_model
+            and self.downgrade_model != model
+            and self._fits(spent, self.downgrade_model, prompt_tokens, prices)
+        ):
+            return self.downgrade_model
+        if unpriced:
+            raise BudgetExceededError(
+                f"Model {model!r} is not in the price table, so the ${self.max_cost_usd} cost budget "
+                f"cannot be enforced; add it to the table (NANOAGENT_PRICE_TABLE)"
+            )
+        raise BudgetExceededError(
+            f"Request budget exceeded (spent {spent.total_tokens} tokens, ${spent.cost_usd:.6f}; "
+            f"next prompt ~{prompt_tokens} tokens)"
+        )
+
+
+# Budget of the request running in the current context, if any
+budget_var: contextvars.ContextVar[Budget | None] = contextvars.ContextVar("budget", default=None)
+
+
+@contextlib.contextmanager
+def usage_batch(batch_id: str) -> Iterator[None]:
+    """Attribute LLM calls made in this context (and tasks started from it) to a batch."""
+    token = batch_id_var.set(batch_id)
+    try:
+        yield
+    finally:
+        batch_id_var.reset(token)
+
+
+class UsageLedger:
+    """
+    Usage of all LLM calls made by a set of agents.
+
+    Per-request and per-batch totals are kept for the most recent max_requests
+    requests (and batches) so a long-running daemon does not grow without bound.
+    """
+
+    def __init__(self, prices: dict | None = None, max_requests: int = 1000):
+        self.prices = prices if prices is not None else load_price_table()
+        self.max_requests = max_requests
+        self.total = UsageTotals()
+        self.by_role: dict[str, UsageTotals] = {}
+        self.by_model: dict[str, UsageTotals] = {}
+        self.by_batch: OrderedDict[str, UsageTotals] = OrderedDict()
+        self.by_request: OrderedDict[str, UsageTotals] = OrderedDict()
+        self.budget_rejections = 0
+        self.budget_downgrades = 0
+
+    def record(
+        self,
+        role: str,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cached_tokens: int = 0,
+        estimated: bool = False,
+    ) -> UsageRecord:
+        record = UsageRecord(
+            role=role,
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cached_tokens=cached_tokens,
+            cost_usd=estimate_cost(model, prompt_tokens, completion_tokens, cached_tokens, self.prices),
+            request_id=request_id_var.get(),
+            batch_id=batch_id_var.get(),
+            estimated=estimated,
+        )
+        self.total.add(record)
+        self.by_role.setdefault(role, UsageTotals()).add(record)
+        self.by_model.setdefault(model, UsageTotals()).add(record)
+        if record.batch_id:
+            self._recent_totals(self.by_batch, record.batch_id).add(record)
+        self.request_totals(record.request_id).add(record)
+        return record
+
+    def request_totals(self, request_id: str) -> UsageTotals:
+        return self._recent_totals(self.by_request, request_id)
+
+    def _recent_totals(self, table: OrderedDict[str, UsageTotals], key: str) -> UsageTotals:
+        """Totals for key, evicting the least recently used keys beyond max_requests."""
+        totals = table.get(key)
+        if totals is not None:
+            # An in-flight request keeps its totals (and so its budget) however long it runs
+            table.move_to_end(key)
+            return totals
+        totals = table[key] = UsageTotals()
+        while len(table) > self.max_requests:
+            table.popitem(last=False)
+        return totals
+
+    def admit(self, model: str, prompt_tokens: int) -> str:
+        """Apply the current request's budget (if any) to a call; returns the model to use."""
+        budget = budget_var.get()
+        if budget is None:
+            return model
+        try:
+            admitted = budget.admit(self.request_totals(request_id_var.get()), model, prompt_tokens, self.prices)
+        except BudgetExceededError:
+            self.budget_rejections += 1
+            raise
+        if admitted != model:
+            self.budget_downgrades += 1
+        return admitted
+
+    def summary(self) -> dict:
+        """All aggregates as plain data."""
+        return {
+            "total": self.total.to_dict(),
+            "by_role": {k: v.to_dict() for k, v in self.by_role.items()},
+            "by_model": {k: v.to_dict() for k, v in self.by_model.items()},
+            "by_batch": {k: v.to_dict() for k, v in self.by_batch.items()},
+            "by_request": {k: v.to_dict() for k, v in self.by_request.items()},
+            "budget_rejections": self.budget_rejections,
+            "budget_downgrades": self.budget_downgrades,
+        }
@@ -0,0 +1,112 @@
+"""
+Planner Batching Benchmark
+
+Sends a stream of mock requests through the orchestrator (fast path and plan
+cache off, so every request needs a plan) and compares Planner LLM calls and
+prompt tokens with and without micro-batching. A third run makes every batched
+response unparseable to exercise the fallback to single calls. Every run checks
+that each single Planner call is charged to the request that made it.
+No network or API key required.
+
+Usage:
+    uv run benchmarks/bench_batching.py
+    uv run benchmarks/bench_batching.py --requests 400 --rate 500 --batch-size 16
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from agents import BatchPolicy
+from orchestrator import Orchestrator
+
+PROMPTS = [
+    "Generate a secure password for my email",
+    "Generate a highly secure password for my banking application",
+    "Create a password for my work laptop",
+    "Give me a simple password for the wifi",
+]
+
+
+async def run_mode(batch: BatchPolicy | None, requests: int, rate: float, broken: bool, seed: int) -> dict:
+    orchestrator = Orchestrator(mock=True, fast_path=False, batch=batch)
+    if broken:
+        planner = orchestrator.planner
+        call_llm = planner.call_llm
+
+        async def unparseable_batches(messages, tools=None, mock_response=None):
+            # Only create_plans passes a mock response (the JSON array of plans)
+            if mock_response is not None:
+                mock_response = "Sure! Here are the plans you asked for."
+            return await call_llm(messages, tools, mock_response)
+        planner.call_llm = unparseable_batches
+
+    rng = random.Random(seed)
+    latencies: list[float] = []
+
+    async def one(i: int) -> None:
+        start = time.perf_counter()
+        await orchestrator.run(PROMPTS[i % len(PROMPTS)], request_id=f"req-{i}")
+        latencies.append(time.perf_counter() - start)
+
+    tasks = []
+    for i in range(requests):
+        tasks.append(asyncio.ensure_future(one(i)))
+        await asyncio.sleep(rng.expovariate(rate))  # Poisson arrivals
+    await asyncio.gather(*tasks)
+
+    meter = orchestrator.planner.prefix_meter.summary()
+    ordered = sorted(latencies)
+    # Per-request attribution: a request's own calls are its single Planner calls
+    # (size-1 batches and parse fallbacks); shared batch calls are charged to the batch
+    by_request = orchestrator.metrics()["usage"]["by_request"]
+    calls = [by_request.get(f"req-{i}", {}).get("calls", 0) for i in range(requests)]
+    stats = orchestrator.metrics()["planner_batching"]
+    expected_single = stats["single_calls"] if stats else requests
+    if sum(calls) != expected_single or max(calls) > 1 or (broken and min(calls) != 1):
+        raise SystemExit(f"Per-request usage misattributed: {sum(calls)} calls over {requests} requests, "
+                         f"expected {expected_single} single calls, at most one per request")
+    return {
+        "planner_calls": meter["calls"],
+        "prompt_tokens": meter["prompt_tokens"],
+        "batching": orchestrator.metrics()["planner_batching"],
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[int(len(ordered) * 0.95) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Planner calls with and without micro-batching")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--rate", type=float, default=400.0, help="Mean arrivals per second")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--window-ms", type=float, default=10.0)
+    parser.add_argument("--max-wait-ms", type=float, default=50.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    policy = BatchPolicy(args.batch_size, args.window_ms / 1000, args.max_wait_ms / 1000)
+    modes = [("single calls", None, False), ("batched", policy, False), ("batched, unparseable", policy, True)]
+
+    print(f"{args.requests} mock requests at ~{args.rate:.0f}/s, batch size {args.batch_size}, "
+          f"window {args.window_ms} ms, max wait {args.max_wait_ms} ms\n")
+    print(f"{'mode':<22} {'LLM calls':>9} {'prompt tok':>10} {'batches':>7} {'mean size':>9} "
+          f"{'fallbacks':>9} {'p50 ms':>7} {'p95 ms':>7}")
+    for name, batch, broken in modes:
+        r = asyncio.run(run_mode(batch, args.requests, args.rate, broken, args.seed))
+        stats = r["batching"] or {"batches": 0, "mean_batch_size": 0.0, "parse_fallbacks": 0}
+        print(
+            f"{name:<22} {r['planner_calls']:>9} {r['prompt_tokens']:>10} {stats['batches']:>7} "
+            f"{stats['mean_batch_size']:>9.1f} {stats['parse_fallbacks']:>9} {r['p50_ms']:>7.1f} {r['p95_ms']:>7.1f}"
+        )
+    print("\nEvery single Planner call was charged to the request that made it.")
+    print("Mock LLM calls return instantly, so the latency columns show only the batching wait.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Daemon Benchmark
+
+Compares per-request latency of:
+- cold CLI runs (`orchestrator.py --mock`, a fresh interpreter per request)
+- the thin client CLI against a warm daemon (`client.py`, fresh interpreter)
+- raw socket requests against the warm daemon (no interpreter startup)
+
+Runs in mock mode, so no network or API key is needed.
+
+Usage:
+    uv run benchmarks/bench_daemon.py
+    uv run benchmarks/bench_daemon.py --runs 20
+"""
+
+import argparse
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+from protocol import request
+
+PROMPT = "Generate a 20-character password"
+
+
+def _time_subprocess(args: list[str], runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _wait_for_socket(path: Path, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not path.exists():
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Daemon did not create {path}")
+        time.sleep(0.05)
+
+
+def _report(name: str, timings: list[float]) -> None:
+    print(
+        f"{name:<22} mean {statistics.mean(timings) * 1000:>8.1f} ms   "
+        f"median {statistics.median(timings) * 1000:>8.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the daemon against cold CLI runs")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = Path(tmp) / "nanoagent.sock"
+        daemon = subprocess.Popen(
+            [sys.executable, "daemon.py", "--mock", "--socket", str(socket_path)],
+            cwd=ROOT,
+            stdout=subprocess.DEVNULL,
+        )
+        try:
+            _wait_for_socket(socket_path)
+
+            cold = _time_subprocess([sys.executable, "orchestrator.py", "--mock", PROMPT], args.runs)
+            client = _time_subprocess(
+                [sys.executable, "client.py", "--socket", str(socket_path), PROMPT], args.runs
+            )
+
+            warm = []
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(str(socket_path))
+                for _ in range(args.runs):
+                    start = time.perf_counter()
+                    request(sock, {"prompt": PROMPT})
+                    warm.append(time.perf_counter() - start)
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+    _report("cold orchestrator.py", cold)
+    _report("client.py → daemon", client)
+    _report("socket → daemon", warm)
+    print(f"\nSpeedup (cold vs client.py): {statistics.mean(cold) / statistics.mean(client):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Fast Path Classifier Benchmark
+
+Checks the RequestClassifier against a table of phrasings: each request must be
+confident (fast path) or not (Planner) as expected, and a confident request
+must exclude exactly the expected character classes. A fast-path request
+whose constraints were misread would produce a password that breaks them, so
+any mismatch fails the run. Then reports classification throughput.
+No network or API key required.
+
+Usage:
+    uv run benchmarks/bench_fast_path.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from agents import RequestClassifier
+
+U, L, N, S = "include_uppercase", "include_lowercase", "include_numbers", "include_symbols"
+
+# (request, confident, excluded classes when confident)
+CASES = [
+    ("Generate a 20-character password", True, set()),
+    ("Generate a 16 character password without symbols", True, {S}),
+    ("Make a 12-char password with no symbols", True, {S}),
+    ("I want a 12 character password excluding special characters", True, {S}),
+    # Coordinated lists after a negation
+    ("Generate a 16 character password without numbers or symbols", True, {N, S}),
+    ("Create a 16 char password with no uppercase, numbers or symbols", True, {U, N, S}),
+    ("Generate a 16 character password, no numbers, no symbols", True, {N, S}),
+    ("Generate a 16 char password without numbers and with uppercase", True, {N}),
+    ("Generate a 16 char password with no ambiguous characters or symbols", True, {S}),
+    # Only
+    ("Generate a 20-character password with only lowercase", True, {U, N, S}),
+    ("Create a 20 char password, lowercase only", True, {U, N, S}),
+    ("Create a 20 char password with only uppercase and numbers", True, {L, S}),
+    ("Create a 20 char password, uppercase and numbers only", True, {L, S}),
+    # Wording the classifier cannot map: the Planner decides
+    ("Generate a 16 character password using only letters", False, None),
+    ("Generate a 16 character password that does not need symbols", False, None),
+    ("Generate a 16 character password that doesn't include numbers", False, None),
+    ("Generate a 16 character password with at least 3 digits", False, None),
+    ("Generate a 16 character password with 2 symbols", False, None),
+    ("Generate a 16 char password without numbers or spaces", False, None),
+    ("Generate a 16 character password that starts with a letter", False, None),
+    ("Generate a 16 character password with no more than 2 symbols", False, None),
+    # Not fast-path requests at all
+    ("Generate a secure password for my email", False, None),
+    ("Generate a memorable 16 character password", False, None),
+    ("Generate a 4 character password", False, None),
+]
+
+
+def check(classifier: RequestClassifier) -> list[str]:
+    failures = []
+    for request, confident, excluded in CASES:
+        parsed = classifier.classify(request)
+        if parsed.confident != confident:
+            failures.append(f"{request!r}: confident={parsed.confident} ({parsed.reason}), expected {confident}")
+        elif confident and {k for k in (U, L, N, S) if not parsed.config[k]} != excluded:
+            got = sorted(k for k in (U, L, N, S) if not parsed.config[k])
+            failures.append(f"{request!r}: excluded {got}, expected {sorted(excluded)}")
+    return failures
+
+
+def main():
+    classifier = RequestClassifier()
+    failures = check(classifier)
+    if failures:
+        raise SystemExit("Classifier mismatches:\n  " + "\n  ".join(failures))
+    print(f"All {len(CASES)} phrasings classified as expected "
+          f"({sum(c for _, c, _ in CASES)} fast path, {sum(not c for _, c, _ in CASES)} Planner).")
+
+    rounds = 200
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for request, _, _ in CASES:
+            classifier.classify(request)
+    elapsed = time.perf_counter() - start
+    print(f"Classification: {elapsed / (rounds * len(CASES)) * 1e6:.1f} µs per request")
+
+
+if __name__ == "__main__":
+    main()
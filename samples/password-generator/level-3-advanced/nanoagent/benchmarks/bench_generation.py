@@ -0,0 +1,127 @@
+"""
+Generation Benchmark
+
+Checks that constructive policy-satisfying generation (require_each_class) is
+statistically sound and compares its throughput with regenerate-on-fail.
+
+Statistical checks (chi-square against a uniform expectation):
+- character frequencies within each class
+- the position of the guaranteed character of a singleton class
+
+Usage:
+    uv run benchmarks/bench_generation.py
+    uv run benchmarks/bench_generation.py --samples 50000
+"""
+
+import argparse
+import math
+import string
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from tools.shared_tools import (
+    SYMBOLS,
+    GeneratePasswordInput,
+    check_password_strength,
+    CheckPasswordStrengthInput,
+    generate_password,
+)
+
+
+def chi_square(counts: Counter, categories: str | range) -> tuple[float, int]:
+    total = sum(counts.values())
+    expected = total / len(categories)
+    statistic = sum((counts.get(c, 0) - expected) ** 2 / expected for c in categories)
+    return statistic, len(categories) - 1
+
+
+def critical_value(dof: int, z: float = 3.09) -> float:
+    """Wilson–Hilferty approximation of the chi-square quantile (z=3.09 → p=0.001)."""
+    return dof * (1 - 2 / (9 * dof) + z * math.sqrt(2 / (9 * dof))) ** 3
+
+
+def report(name: str, statistic: float, dof: int) -> bool:
+    limit = critical_value(dof)
+    ok = statistic < limit
+    print(f"  {name:<34} χ²={statistic:>8.1f}  dof={dof:>3}  limit={limit:>6.1f}  {'PASS' if ok else 'FAIL'}")
+    return ok
+
+
+def check_uniformity(samples: int) -> bool:
+    print(f"Uniformity ({samples} passwords, p=0.001):")
+    params = GeneratePasswordInput(length=12, require_each_class=True)
+    classes = {
+        "uppercase": string.ascii_uppercase,
+        "lowercase": string.ascii_lowercase,
+        "digits": string.digits,
+        "symbols": SYMBOLS,
+    }
+    counts = {name: Counter() for name in classes}
+    for _ in range(samples):
+        for c in generate_password(params):
+            for name, chars in classes.items():
+                if c in chars:
+                    counts[name][c] += 1
+    ok = all(report(f"characters within {name}", *chi_square(counts[name], chars)) for name, chars in classes.items())
+
+    # With only digits guaranteed once, the position of the single digit must be uniform
+    digit_only_once = GeneratePasswordInput(
+        length=10, include_uppercase=False, include_numbers=True, include_symbols=False,
+        exclude_characters=string.digits[1:], require_each_class=True,
+    )
+    positions = Counter()
+    for _ in range(samples):
+        password = generate_password(digit_only_once)
+        if password.count("0") == 1:
+            positions[password.index("0")] += 1
+    ok &= report("position of required character", *chi_square(positions, range(10)))
+    return ok
+
+
+def retry_generate(params: GeneratePasswordInput) -> tuple[str, int]:
+    """Baseline: regenerate until every class is present."""
+    attempts = 0
+    while True:
+        attempts += 1
+        password = generate_password(params)
+        checks = check_password_strength(CheckPasswordStrengthInput(password=password))["checks"]
+        if all(checks[k] for k in ("has_uppercase", "has_lowercase", "has_numbers", "has_symbols")):
+            return password, attempts
+
+
+def compare_throughput(samples: int) -> None:
+    print(f"\nThroughput ({samples} passwords per mode):")
+    for length in (8, 12, 16):
+        uniform = GeneratePasswordInput(length=length)
+        constructive = GeneratePasswordInput(length=length, require_each_class=True)
+
+        start = time.perf_counter()
+        attempts = sum(retry_generate(uniform)[1] for _ in range(samples))
+        retry_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(samples):
+            generate_password(constructive)
+        constructive_s = time.perf_counter() - start
+
+        print(
+            f"  length {length:>3}: retry {samples / retry_s:>9,.0f}/s "
+            f"({attempts / samples:.2f} attempts avg)   "
+            f"constructive {samples / constructive_s:>9,.0f}/s"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and benchmark constructive generation")
+    parser.add_argument("--samples", type=int, default=20000)
+    args = parser.parse_args()
+    ok = check_uniformity(args.samples)
+    compare_throughput(args.samples // 4)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
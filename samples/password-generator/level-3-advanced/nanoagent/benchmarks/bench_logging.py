@@ -0,0 +1,112 @@
+"""
+Logging Benchmark
+
+Runs a batch of mock orchestrator requests concurrently and compares request
+throughput with different logging setups:
+
+- sync:    handlers write in the event loop (what the old print calls did)
+- queued:  records are queued and written by a listener thread
+- quiet:   queued, console shows warnings only
+- json:    quiet console plus a JSON-lines file
+
+Throughput counts the time until the last request finishes; "drain" is the
+extra time the listener needs to write out the remaining records. Console
+output goes to stderr; --write-latency-ms adds a blocking delay per write to
+mimic a slow terminal or pipe consumer.
+
+Usage:
+    uv run benchmarks/bench_logging.py 2>/dev/null
+    uv run benchmarks/bench_logging.py --requests 1000 --write-latency-ms 0.2 2>/dev/null
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TextIO
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from agents import configure_logging
+from orchestrator import Orchestrator
+
+PROMPTS = [
+    "Generate a 20-character password",
+    "Generate a highly secure password for my banking application",
+    "I need a 12 character password without symbols",
+    "Create a password for my email",
+]
+
+
+class SlowStream:
+    """Stream wrapper that blocks for a fixed time on every write."""
+
+    def __init__(self, stream: TextIO, latency: float):
+        self.stream = stream
+        self.latency = latency
+
+    def write(self, text: str) -> int:
+        time.sleep(self.latency)
+        return self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+async def run_batch(requests: int, concurrency: int) -> None:
+    orchestrator = Orchestrator(mock=True)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            await orchestrator.run(PROMPTS[i % len(PROMPTS)], request_id=f"bench-{i}")
+
+    await asyncio.gather(*(one(i) for i in range(requests)))
+
+
+def run_mode(mode: str, requests: int, concurrency: int, json_path: Path, console: TextIO) -> dict:
+    listener = configure_logging(
+        quiet=mode in ("quiet", "json"),
+        json_path=json_path if mode == "json" else None,
+        console=console,
+        with_request_id=True,
+        queued=mode != "sync",
+    )
+    start = time.perf_counter()
+    asyncio.run(run_batch(requests, concurrency))
+    elapsed = time.perf_counter() - start
+    if listener:
+        listener.stop()
+    drained = time.perf_counter() - start
+    return {
+        "mode": mode,
+        "elapsed_s": elapsed,
+        "drain_s": drained - elapsed,
+        "requests_per_s": requests / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark logging setups on a mock request batch")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--write-latency-ms", type=float, default=0.0, help="Blocking delay per console write")
+    args = parser.parse_args()
+
+    console = SlowStream(sys.stderr, args.write_latency_ms / 1000) if args.write_latency_ms else sys.stderr
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [
+            run_mode(mode, args.requests, args.concurrency, Path(tmp) / "log.jsonl", console)
+            for mode in ("sync", "queued", "quiet", "json")
+        ]
+
+    print(f"\n{args.requests} mock requests, concurrency {args.concurrency}, "
+          f"console write latency {args.write_latency_ms} ms")
+    print(f"{'mode':<8} {'elapsed s':>10} {'drain s':>9} {'req/s':>10}")
+    for r in results:
+        print(f"{r['mode']:<8} {r['elapsed_s']:>10.3f} {r['drain_s']:>9.3f} {r['requests_per_s']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Plan Cache Benchmark
+
+Runs a corpus of differently-worded requests through a mock orchestrator and
+reports how many Planner calls the plan cache avoids, with and without the
+fast path. Also checks that no generated password ended up in the cache.
+No network or API key required.
+
+Usage:
+    uv run benchmarks/bench_plan_cache.py
+"""
+
+import asyncio
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from agents import PlanCache
+from orchestrator import Orchestrator
+
+CORPUS = [
+    # Same constraints, different wording
+    "16 char password with symbols",
+    "Generate a 16-character password including symbols",
+    "Create a password, 16 characters long, with symbols",
+    "I need a 16 chars password",
+    "Generate a 12 character password without symbols",
+    "Make a 12-char password with no symbols",
+    "I want a 12 character password excluding special characters",
+    "Generate a 20-character password with only lowercase",
+    "Create a 20 char password, lowercase only",
+    # No explicit length: the Planner decides, keyed by use case and strength
+    "Generate a secure password for my email",
+    "Create a password for my email account",
+    "I need a new password for the email app",
+    "Generate a highly secure password for my banking application",
+    "Create a very strong password for my bank account",
+    "Make a highly secure password for banking",
+    "Generate a password for my banking app",
+    "Give me a simple password for the wifi",
+    "I need a basic password for my wifi",
+    "Generate a password for my work laptop",
+    "Create a password for my work laptop login",
+    "Generate a password without ambiguous characters for my router",
+    "Create a password for my router, no look-alike characters",
+    "Generate a password without symbols for my database",
+    "Create a password for the database with no special characters",
+    # Not cacheable: needs the Planner's interpretation every time
+    "Generate a memorable password for my email",
+    "Give me several passwords to choose from",
+    "Generate a pronounceable password",
+    "Check the strength of my password",
+]
+
+PASSWORD_PATTERN = re.compile(r"\*\*Generated Password\*\*: `([^`]+)`")
+
+
+async def run_corpus(fast_path: bool, rounds: int = 2) -> dict:
+    cache = PlanCache()
+    orchestrator = Orchestrator(mock=True, fast_path=fast_path, plan_cache=cache)
+    passwords = []
+    for _ in range(rounds):
+        for request in CORPUS:
+            response = await orchestrator.run(request)
+            passwords += PASSWORD_PATTERN.findall(response)
+
+    leaked = sum(1 for password in passwords for plan in cache.plans() if password in plan)
+    return {
+        "requests": len(CORPUS) * rounds,
+        "fast_path": orchestrator.fast_path_stats.fast_path_hits,
+        "planner_calls": orchestrator.fast_path_stats.planner_calls,
+        "cache": cache.stats(),
+        "passwords_in_cache": leaked,
+    }
+
+
+def main():
+    print(f"Corpus: {len(CORPUS)} requests; pass 2 sends the corpus a second time\n")
+    print(f"{'mode':<22} {'requests':>8} {'fast path':>9} {'cache hits':>10} {'misses':>7} "
+          f"{'uncacheable':>11} {'hit rate':>8} {'planner calls':>13}")
+    for fast_path in (True, False):
+        for rounds in (1, 2):
+            r = asyncio.run(run_corpus(fast_path, rounds))
+            cache = r["cache"]
+            mode = f"{'fast path' if fast_path else 'no fast path'}, {rounds} pass{'es' if rounds > 1 else ''}"
+            print(
+                f"{mode:<22} {r['requests']:>8} {r['fast_path']:>9} "
+                f"{cache['hits']:>10} {cache['misses']:>7} {cache['uncacheable']:>11} "
+                f"{cache['hit_rate']:>8.1%} {r['planner_calls']:>13}"
+            )
+            assert r["passwords_in_cache"] == 0, "a generated password was found in a cached plan"
+    print("\nNo generated password found in any cached plan.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Scheduler Benchmark
+
+Drains a large bulk batch while interactive requests keep arriving, against a
+local stub backend with fixed concurrency, and compares interactive latency:
+
+- fifo:      one shared queue (a plain semaphore), bulk and interactive mixed
+- scheduler: RequestScheduler with priority classes, weighted fair queuing
+             and a bulk concurrency cap
+
+A baseline run with no bulk traffic shows what "flat" interactive latency is.
+No network or API key required.
+
+Usage:
+    uv run benchmarks/bench_scheduler.py
+    uv run benchmarks/bench_scheduler.py --bulk 1000 --interactive 100
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scheduler import RequestScheduler
+
+
+async def stub_backend(rng: random.Random, base: float = 0.02) -> str:
+    """A pipeline run: lognormal latency around `base` seconds."""
+    await asyncio.sleep(base * rng.lognormvariate(0, 0.3))
+    return "ok"
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run_mode(mode: str, bulk: int, interactive: int, concurrency: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    latencies: dict[str, list[float]] = {"interactive": [], "bulk": []}
+
+    if mode == "scheduler":
+        scheduler = RequestScheduler(lambda: stub_backend(rng), max_concurrency=concurrency)
+
+        async def call(priority: str) -> None:
+            start = time.perf_counter()
+            await scheduler.submit(priority=priority)
+            latencies[priority].append(time.perf_counter() - start)
+    else:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(priority: str) -> None:
+            start = time.perf_counter()
+            async with semaphore:
+                await stub_backend(rng)
+            latencies[priority].append(time.perf_counter() - start)
+
+    # The whole bulk batch lands at once; interactive requests arrive steadily meanwhile
+    tasks = [asyncio.ensure_future(call("bulk")) for _ in range(bulk)]
+    for _ in range(interactive):
+        tasks.append(asyncio.ensure_future(call("interactive")))
+        await asyncio.sleep(rng.expovariate(interactive / 2.0))  # spread over ~2 s
+    await asyncio.gather(*tasks)
+
+    result = {
+        "mode": mode,
+        "interactive_p50_ms": percentile(latencies["interactive"], 50) * 1000,
+        "interactive_p95_ms": percentile(latencies["interactive"], 95) * 1000,
+        "bulk_p95_ms": percentile(latencies["bulk"], 95) * 1000 if latencies["bulk"] else 0.0,
+    }
+    if mode == "scheduler":
+        result["metrics"] = scheduler.metrics()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Interactive latency while a bulk batch drains")
+    parser.add_argument("--bulk", type=int, default=600)
+    parser.add_argument("--interactive", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    runs = [
+        ("no bulk (baseline)", asyncio.run(run_mode("scheduler", 0, args.interactive, args.concurrency, args.seed))),
+        ("fifo", asyncio.run(run_mode("fifo", args.bulk, args.interactive, args.concurrency, args.seed))),
+        ("scheduler", asyncio.run(run_mode("scheduler", args.bulk, args.interactive, args.concurrency, args.seed))),
+    ]
+
+    print(f"{args.bulk} bulk + {args.interactive} interactive requests, concurrency {args.concurrency}\n")
+    print(f"{'mode':<20} {'interactive p50':>16} {'interactive p95':>16} {'bulk p95':>10}")
+    for name, r in runs:
+        print(f"{name:<20} {r['interactive_p50_ms']:>13.1f} ms {r['interactive_p95_ms']:>13.1f} ms "
+              f"{r['bulk_p95_ms']:>7.0f} ms")
+
+    classes = runs[-1][1]["metrics"]["classes"]
+    print("\nScheduler queue times:")
+    for name, c in classes.items():
+        print(f"  {name:<12} p50 {c['queue_time_p50_s']*1000:8.1f} ms   p95 {c['queue_time_p95_s']*1000:8.1f} ms   "
+              f"completed {c['completed']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Tool Offload Benchmark
+
+Runs many small pipelines (stub LLM wait + one password + one strength check)
+on one event loop while a few bulk generation jobs run alongside, and measures
+event-loop lag and small-request latency (from scheduled arrival to completion)
+with the bulk work placed:
+
+- inline:  every tool call runs directly on the event loop (previous behavior)
+- thread:  calls above the inline threshold run in a thread pool
+- process: calls above the process threshold run in a process pool
+
+No network or API key required.
+
+Usage:
+    uv run benchmarks/bench_tools.py
+    uv run benchmarks/bench_tools.py --requests 400 --bulk-jobs 8 --bulk-count 5000
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from tools import (
+    CheckPasswordStrengthInput,
+    GeneratePasswordInput,
+    LoopLagMonitor,
+    OffloadPolicy,
+    ToolExecutor,
+    check_password_strength,
+    generate_password,
+    generate_passwords,
+)
+
+POLICIES = {
+    "inline": OffloadPolicy(inline_max=sys.maxsize),
+    "thread": OffloadPolicy(),
+    "process": OffloadPolicy(process_min=50_000),
+}
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run_mode(policy: OffloadPolicy, requests: int, bulk_jobs: int, bulk_count: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    executor = ToolExecutor(policy)
+    params = GeneratePasswordInput(length=20, require_each_class=True)
+    bulk_params = GeneratePasswordInput(length=64, require_each_class=True)
+    latencies: list[float] = []
+
+    async def small_request(arrival: float) -> None:
+        await asyncio.sleep(0.01 * rng.lognormvariate(0, 0.3))  # Stub LLM round trip
+        password = await executor.run(generate_password, params, size=params.length)
+        await executor.run(check_password_strength, CheckPasswordStrengthInput(password=password), size=len(password))
+        latencies.append(time.perf_counter() - arrival)  # From when it should have arrived
+
+    async def bulk_job() -> None:
+        await executor.run(generate_passwords, bulk_params, bulk_count, size=bulk_params.length * bulk_count)
+
+    # Warm the pools so process start-up is not counted as lag
+    if policy.inline_max < sys.maxsize:
+        await bulk_job()
+
+    # Poisson arrivals over ~2 s; bulk jobs start at random points in the same window
+    events = [("small", t) for t in itertools.accumulate(rng.expovariate(requests / 2.0) for _ in range(requests))]
+    events += [("bulk", rng.uniform(0, 2.0)) for _ in range(bulk_jobs)]
+    events.sort(key=lambda event: event[1])
+
+    start = time.perf_counter()
+    async with LoopLagMonitor() as lag:
+        tasks = []
+        for kind, offset in events:
+            await asyncio.sleep(max(0.0, start + offset - time.perf_counter()))
+            tasks.append(asyncio.ensure_future(small_request(start + offset) if kind == "small" else bulk_job()))
+        await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    executor.close()
+
+    return {
+        "lag": lag.summary(),
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "elapsed_s": elapsed,
+        "calls": executor.stats()["calls"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event-loop lag with inline vs offloaded tool calls")
+    parser.add_argument("--requests", type=int, default=200, help="Small pipelines")
+    parser.add_argument("--bulk-jobs", type=int, default=4, help="Concurrent bulk generation jobs")
+    parser.add_argument("--bulk-count", type=int, default=3000, help="Passwords per bulk job")
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.requests} small requests + {args.bulk_jobs} bulk jobs of {args.bulk_count} passwords\n")
+    print(f"{'mode':<8} {'lag p50':>8} {'lag p95':>8} {'lag max':>8} {'req p50':>8} {'req p95':>8} {'total s':>8}  calls")
+    for name, policy in POLICIES.items():
+        r = asyncio.run(run_mode(policy, args.requests, args.bulk_jobs, args.bulk_count, args.seed))
+        lag = r["lag"]
+        print(
+            f"{name:<8} {lag['p50_ms']:>8.1f} {lag['p95_ms']:>8.1f} {lag['max_ms']:>8.1f} "
+            f"{r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['elapsed_s']:>8.2f}  {r['calls']}"
+        )
+    print("\nLag and latency in ms. Small calls stay inline in every mode; only bulk jobs move.")
+
+
+if __name__ == "__main__":
+    main()
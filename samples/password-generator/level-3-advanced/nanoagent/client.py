@@ -0,0 +1,69 @@
+"""
+Nanoagent Level 3: Daemon Client
+
+Thin client for daemon.py. Imports only the standard library, so it starts in
+a fraction of the time of a cold orchestrator.py run.
+
+Usage:
+    uv run client.py "Generate a 20-character password"
+    uv run client.py --priority bulk "Generate a password for a service account"
+    uv run client.py --metrics
+    uv run client.py --ping
+"""
+
+import argparse
+import json
+import socket
+import sys
+
+from protocol import default_socket_path, request
+
+
+def main():
+    """Entry point for the client."""
+    parser = argparse.ArgumentParser(
+        description="Send a request to a running nanoagent daemon"
+    )
+    parser.add_argument(
+        "prompt",
+        nargs="?",
+        default="Generate a highly secure password for my banking application",
+        help="The request to send to the multi-agent system"
+    )
+    parser.add_argument("--socket", default=default_socket_path(), help="Unix socket path")
+    parser.add_argument("--metrics", action="store_true", help="Print daemon metrics")
+    parser.add_argument("--ping", action="store_true", help="Check that the daemon is alive")
+    parser.add_argument(
+        "--priority",
+        default="interactive",
+        help="Priority class: interactive (default) or bulk"
+    )
+
+    args = parser.parse_args()
+
+    if args.ping:
+        message = {"command": "ping"}
+    elif args.metrics:
+        message = {"command": "metrics"}
+    else:
+        message = {"prompt": args.prompt, "priority": args.priority}
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(args.socket)
+            reply = request(sock, message)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"Error: no daemon listening on {args.socket}. Start it with 'uv run daemon.py'.")
+        sys.exit(1)
+
+    if not reply.get("ok"):
+        print(f"Error: {reply.get('error')}")
+        sys.exit(2)
+    if "response" in reply:
+        print(reply["response"])
+    else:
+        print(json.dumps(reply, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""
+Nanoagent Level 3: Orchestrator Daemon
+
+Keeps a warm Orchestrator resident (imports done, agents constructed, LiteLLM's
+HTTP clients reused across calls) and serves requests over a local Unix domain
+socket using the framed JSON protocol in protocol.py.
+
+Requests:
+    {"prompt": "Generate a 20-character password", "request_id": "optional-id", "priority": "interactive"}
+    {"command": "metrics"}
+    {"command": "ping"}
+
+Usage:
+    uv run daemon.py --mock
+    uv run daemon.py --socket /tmp/nanoagent.sock
+    uv run daemon.py --mock --quiet --log-json runs/daemon.jsonl
+    uv run daemon.py --batch-planner
+    uv run daemon.py --max-tokens 4000 --on-budget downgrade
+    uv run client.py "Generate a 20-character password"
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import time
+from pathlib import Path
+from typing import Any
+
+from agents import BatchPolicy, Budget, PlanCache, configure_logging, get_logger, new_request_id
+from orchestrator import Orchestrator
+from scheduler import RequestScheduler
+from protocol import HEADER, decode_length, default_socket_path, encode_frame
+
+
+EOF = object()
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Any:
+    """Read one frame from the stream; EOF on clean EOF (a frame may hold any JSON value)."""
+    try:
+        header = await reader.readexactly(HEADER.size)
+    except asyncio.IncompleteReadError:
+        return EOF
+    payload = await reader.readexactly(decode_length(header))
+    return json.loads(payload)
+
+
+log = get_logger("daemon")
+
+
+async def write_frame(writer: asyncio.StreamWriter, message: dict) -> None:
+    writer.write(encode_frame(message))
+    await writer.drain()
+
+
+class OrchestratorDaemon:
+    """Serves Orchestrator.run over a Unix domain socket, through a priority scheduler."""
+
+    def __init__(self, orchestrator: Orchestrator, socket_path: str, max_concurrency: int = 8):
+        self.orchestrator = orchestrator
+        self.socket_path = socket_path
+        self.scheduler = RequestScheduler(orchestrator.run, max_concurrency=max_concurrency)
+        self.requests_served = 0
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while (message := await read_frame(reader)) is not EOF:
+                await write_frame(writer, await self.dispatch(message))
+        except (ValueError, ConnectionError, asyncio.IncompleteReadError) as e:
+            log.warning(f"[DAEMON] Dropping client: {e}")
+        finally:
+            writer.close()
+
+    async def dispatch(self, message: Any) -> dict:
+        if not isinstance(message, dict):
+            return {"ok": False, "error": f"Expected a JSON object, got {type(message).__name__}"}
+        command = message.get("command", "run")
+        if command == "ping":
+            return {"ok": True, "requests_served": self.requests_served}
+        if command == "metrics":
+            return {
+                "ok": True,
+                "metrics": {**self.orchestrator.metrics(), "scheduler": self.scheduler.metrics()},
+            }
+        if command != "run" or not isinstance(message.get("prompt"), str):
+            return {"ok": False, "error": "Expected {'prompt': str} or a known command"}
+
+        request_id = str(message.get("request_id") or new_request_id())
+        priority = message.get("priority", "interactive")
+        if priority not in self.scheduler.classes:
+            return {"ok": False, "error": f"Unknown priority {priority!r}; expected one of {sorted(self.scheduler.classes)}"}
+        start = time.perf_counter()
+        try:
+            response = await self.scheduler.submit(message["prompt"], priority=priority, request_id=request_id)
+        except Exception as e:
+            log.error(f"[DAEMON] Request {request_id} failed: {type(e).__name__}: {e}")
+            return {"ok": False, "request_id": request_id, "error": f"{type(e).__name__}: {e}"}
+        self.requests_served += 1
+        return {
+            "ok": True,
+            "request_id": request_id,
+            "response": response,
+            "elapsed_ms": (time.perf_counter() - start) * 1000,
+        }
+
+    async def serve_forever(self) -> None:
+        path = Path(self.socket_path)
+        if path.exists():
+            path.unlink()  # Stale socket from a previous run
+        # Bind with owner-only permissions: a chmod after binding leaves a window
+        # in which any local user could connect
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(self.handle_client, path=str(path))
+        finally:
+            os.umask(old_umask)
+
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+
+        log.info(f"[DAEMON] Listening on {path}")
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            path.unlink(missing_ok=True)
+            log.info("[DAEMON] Stopped.")
+
+
+def _warm_imports() -> None:
+    """Pay the LiteLLM import cost once at startup instead of on the first request."""
+    try:
+        import litellm  # noqa: F401
+    except ImportError:
+        pass
+
+
+def main():
+    """Entry point for the daemon."""
+    parser = argparse.ArgumentParser(
+        description="Level 3 Nanoagent: Orchestrator daemon on a Unix socket"
+    )
+    parser.add_argument(
+        "--socket",
+        default=default_socket_path(),
+        help="Unix socket path (default: $NANOAGENT_SOCKET or a per-user runtime path)"
+    )
+    parser.add_argument(
+        "--mock",
+        action="store_true",
+        help="Run in mock mode without calling the LLM API"
+    )
+    parser.add_argument(
+        "--no-fast-path",
+        action="store_true",
+        help="Always call the Planner, even for requests with explicit constraints"
+    )
+    parser.add_argument(
+        "--no-plan-cache",
+        action="store_true",
+        help="Do not reuse plans across requests with equivalent constraints"
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=8,
+        help="Maximum pipelines running at once, including the slots reserved for interactive requests (default: 8)"
+    )
+    parser.add_argument(
+        "--batch-planner",
+        action="store_true",
+        help="Plan concurrent requests together in batched Planner calls"
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Fire a second LLM request when the first exceeds the observed p95 latency"
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only log warnings and errors to the console"
+    )
+    parser.add_argument(
+        "--log-json",
+        metavar="PATH",
+        help="Also write structured JSON-lines logs to this file"
+    )
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        help="Per-request token budget (prompt + completion)"
+    )
+    parser.add_argument(
+        "--max-cost",
+        type=float,
+        metavar="USD",
+        help="Per-request cost budget in USD, estimated from the local price table"
+    )
+    parser.add_argument(
+        "--on-budget",
+        choices=["abort", "downgrade"],
+        default="abort",
+        help="What to do when a request would exceed its budget (default: abort)"
+    )
+    parser.add_argument(
+        "--downgrade-model",
+        default="gpt-4.1-nano",
+        help="Cheaper model to switch to with --on-budget downgrade (default: gpt-4.1-nano)"
+    )
+
+    args = parser.parse_args()
+
+    if not args.mock:
+        _warm_imports()
+    listener = configure_logging(quiet=args.quiet, json_path=args.log_json, with_request_id=True)
+    orchestrator = Orchestrator(
+        mock=args.mock,
+        fast_path=not args.no_fast_path,
+        hedge=args.hedge,
+        plan_cache=None if args.no_plan_cache else PlanCache(),
+        batch=BatchPolicy() if args.batch_planner else None,
+        budget=(
+            Budget(args.max_tokens, args.max_cost, args.on_budget, args.downgrade_model)
+            if args.max_tokens is not None or args.max_cost is not None else None
+        ),
+    )
+    daemon = OrchestratorDaemon(orchestrator, args.socket, max_concurrency=args.max_concurrency)
+    try:
+        asyncio.run(daemon.serve_forever())
+    finally:
+        listener.stop()
+
+
+if __name__ == "__main__":
+    main()
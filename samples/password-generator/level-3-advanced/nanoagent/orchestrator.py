@@ -6,20 +6,65 @@ This orchestrator coordinates multiple specialized agents:
 - Implementer: Executes plans and generates passwords
 - Tester: Validates results and reports quality
 
+Simple requests with explicit constraints take a fast path that skips the Planner.
+Requests with the same canonical constraints reuse a cached plan. With a
+BatchPolicy, concurrent requests share batched Planner calls.
+When the LLM backend is unhealthy, a circuit breaker switches to degraded mode:
+constraints are parsed locally and generation/testing run without the LLM.
+Token usage and estimated cost are tracked per agent role, request and batch;
+an optional per-request Budget aborts the request, or downgrades it to a
+cheaper model and finally to local constraints, once it would be exceeded.
+Tool calls go through a ToolExecutor: small ones run inline, large ones in a
+thread or process pool so they do not stall other pipelines on the loop.
+
 Usage:
     uv run orchestrator.py "Generate a very secure password for banking"
     uv run orchestrator.py --mock "Generate a password"
+    uv run orchestrator.py --no-fast-path "Generate a 20-character password"
+    uv run orchestrator.py --no-plan-cache "Generate a password for my email"
+    uv run orchestrator.py --hedge "Generate a password for my email"
+    uv run orchestrator.py --record cassettes/banking.json "Generate a banking password"
+    uv run orchestrator.py --replay cassettes/banking.json "Generate a banking password"
+    uv run orchestrator.py --mock --profile "Generate a password"
+    uv run orchestrator.py --mock --quiet --log-json runs/log.jsonl "Generate a password"
+    uv run orchestrator.py --max-cost 0.001 --on-budget downgrade "Generate a banking password"
 """
 
 import argparse
 import asyncio
+import contextlib
+import sys
+import time
 
 from agents import (
     AgentContext,
+    AgentMessage,
+    AgentRole,
+    BatchPolicy,
+    Budget,
+    BudgetExceededError,
+    Cassette,
+    CassetteMiss,
+    CircuitBreaker,
+    FastPathStats,
+    ParsedRequest,
+    PlanCache,
     PlannerAgent,
     ImplementerAgent,
+    Profiler,
+    RequestClassifier,
     TesterAgent,
+    UsageLedger,
+    budget_var,
+    configure_logging,
+    get_logger,
+    new_request_id,
+    request_id_var,
 )
+from agents.profiler import stage
+from tools import OffloadPolicy, ToolExecutor
+
+log = get_logger("orchestrator")
 
 
 class Orchestrator:
@@ -33,65 +78,184 @@ class Orchestrator:
     4. Aggregates final results
     """
     
-    def __init__(self, mock: bool = False):
+    def __init__(
+        self,
+        mock: bool = False,
+        fast_path: bool = True,
+        hedge: bool = False,
+        breaker: CircuitBreaker | None = None,
+        cassette: Cassette | None = None,
+        plan_cache: PlanCache | None = None,
+        batch: BatchPolicy | None = None,
+        budget: Budget | None = None,
+        tool_policy: OffloadPolicy | None = None,
+    ):
         self.mock = mock
-        self.planner = PlannerAgent(mock=mock)
-        self.implementer = ImplementerAgent(mock=mock)
-        self.tester = TesterAgent(mock=mock)
+        self.fast_path = fast_path
+        self.plan_cache = plan_cache
+        self.budget = budget
+        self.breaker = breaker or CircuitBreaker()
+        self.usage = UsageLedger()
+        agent_options = {
+            "mock": mock, "hedge": hedge, "breaker": self.breaker, "cassette": cassette, "ledger": self.usage,
+        }
+        self.tool_executor = ToolExecutor(tool_policy)
+        self.planner = PlannerAgent(**agent_options, batch=batch)
+        self.implementer = ImplementerAgent(**agent_options, executor=self.tool_executor)
+        self.tester = TesterAgent(**agent_options, executor=self.tool_executor)
+        self.classifier = RequestClassifier()
+        self.fast_path_stats = FastPathStats()
+        self.degraded_requests = 0
+        self.budget_degraded_requests = 0
     
-    async def run(self, user_request: str) -> str:
+    async def run(self, user_request: str, request_id: str | None = None, budget: Budget | None = None) -> str:
         """
         Run the complete multi-agent workflow.
         
         Pipeline: User → Planner → Implementer → Tester → Response
+        Fast path: User → Implementer → Tester → Response
+        
+        Every log record of this run carries request_id (generated if omitted).
+        budget overrides the orchestrator's default Budget for this request;
+        in abort mode an exhausted budget raises BudgetExceededError.
+        On replay, a planner request missing from the cassette raises CassetteMiss.
         """
-        print(f"\n{'='*60}")
-        print("NANOAGENT LEVEL 3: Multi-Agent Orchestration")
-        print(f"{'='*60}")
-        print(f"\nUser Request: {user_request}")
-        print(f"\n{'-'*60}")
-        print("ORCHESTRATION PIPELINE")
-        print(f"{'-'*60}\n")
+        token = request_id_var.set(request_id or new_request_id())
+        budget_token = budget_var.set(budget or self.budget)
+        try:
+            return await self._run_pipeline(user_request)
+        finally:
+            budget_var.reset(budget_token)
+            request_id_var.reset(token)
+    
+    async def _run_pipeline(self, user_request: str) -> str:
+        log.info(
+            f"\n{'='*60}\nNANOAGENT LEVEL 3: Multi-Agent Orchestration\n{'='*60}\n"
+            f"\nUser Request: {user_request}\n\n{'-'*60}\nORCHESTRATION PIPELINE\n{'-'*60}\n",
+            extra={"event": "request", "user_request": user_request},
+        )
         
         # Initialize context
         context = AgentContext(user_request=user_request)
         
-        # Phase 1: Planning
-        print("📋 PHASE 1: PLANNING")
-        context = await self.planner.process(context)
-        print()
+        # Phase 1: Planning (skipped on the fast path or when the LLM is unhealthy)
+        with stage("classify"):
+            parsed = self.classifier.classify(user_request)
+        if self.fast_path and parsed.confident:
+            log.info("⚡ PHASE 1: FAST PATH (planner skipped)", extra={"phase": "fast_path"})
+            self._use_local_constraints(context, parsed, "Constraints parsed locally.")
+            self.fast_path_stats.record_fast_path()
+        elif self.plan_cache and (plan := self.plan_cache.get(parsed)) is not None:
+            log.info("📋 PHASE 1: PLANNING (cached plan)", extra={"phase": "plan_cache"})
+            context.plan = plan
+            context.add_message(AgentMessage(
+                from_agent=AgentRole.COORDINATOR,
+                to_agent=AgentRole.IMPLEMENTER,
+                content="Reusing cached plan for equivalent constraints. Handing off to implementer.",
+                metadata={"plan": plan}
+            ))
+        elif self.breaker.is_open():
+            log.warning("🛟 PHASE 1: DEGRADED MODE (LLM backend unhealthy)", extra={"phase": "degraded"})
+            self._use_local_constraints(context, parsed, "LLM backend unavailable; using local constraints.")
+            self.degraded_requests += 1
+        else:
+            log.info("📋 PHASE 1: PLANNING", extra={"phase": "planning"})
+            if self.fast_path:
+                log.info(f"Fast path not taken: {parsed.reason}", extra={"role": "coordinator"})
+            start = time.perf_counter()
+            try:
+                with stage("planning"):
+                    context = await self.planner.process(context)
+                self.fast_path_stats.record_planner(time.perf_counter() - start)
+                if self.plan_cache:
+                    self.plan_cache.put(parsed, context.plan)
+            except BudgetExceededError as e:
+                if budget_var.get().on_exceed == "abort":
+                    log.error(f"Request aborted: {e}", extra={"role": "coordinator", "event": "budget_abort"})
+                    raise
+                log.warning(
+                    f"{e}. Downgrading to local constraints.",
+                    extra={"role": "coordinator", "event": "budget_downgrade"},
+                )
+                self._use_local_constraints(context, parsed, "Budget exhausted; using local constraints.")
+                self.budget_degraded_requests += 1
+            except CassetteMiss as e:
+                # A stale cassette, not an unhealthy backend: degrading would hide it
+                log.error(f"Replay failed: {e}", extra={"role": "coordinator", "event": "cassette_miss"})
+                raise
+            except Exception as e:
+                log.warning(
+                    f"Planner failed ({e}). Switching to degraded mode.",
+                    extra={"role": "coordinator", "error": f"{type(e).__name__}: {e}"},
+                )
+                self._use_local_constraints(context, parsed, "Planner failed; using local constraints.")
+                self.degraded_requests += 1
         
         # Phase 2: Implementation
-        print("🔧 PHASE 2: IMPLEMENTATION")
-        context = await self.implementer.process(context)
-        print()
+        log.info("\n🔧 PHASE 2: IMPLEMENTATION", extra={"phase": "implementation"})
+        with stage("implementation"):
+            context = await self.implementer.process(context)
         
         # Phase 3: Testing
-        print("🧪 PHASE 3: TESTING")
-        context = await self.tester.process(context)
-        print()
+        log.info("\n🧪 PHASE 3: TESTING", extra={"phase": "testing"})
+        with stage("testing"):
+            context = await self.tester.process(context)
         
         # Generate final response
         final_response = self._generate_final_response(context)
         context.final_response = final_response
         
-        # Print message history
-        print(f"{'-'*60}")
-        print("MESSAGE HISTORY (Agent Handoffs)")
-        print(f"{'-'*60}")
-        for msg in context.history:
-            print(f"  {msg}")
-        print()
+        # Message history (agent handoffs) and final response
+        history = "\n".join(f"  {msg}" for msg in context.history)
+        log.info(
+            f"\n{'-'*60}\nMESSAGE HISTORY (Agent Handoffs)\n{'-'*60}\n{history}\n",
+            extra={"event": "history", "handoffs": len(context.history)},
+        )
+        log.info(
+            f"{'='*60}\nFINAL RESPONSE\n{'='*60}\n{final_response}\n\n{'='*60}\n",
+            extra={
+                "event": "response",
+                "verdict": (context.test_results or {}).get("verdict"),
+                "sensitive": True,
+            },
+        )
         
-        # Print final response
-        print(f"{'='*60}")
-        print("FINAL RESPONSE")
-        print(f"{'='*60}")
-        print(final_response)
-        print(f"\n{'='*60}\n")
+        usage = self.usage.request_totals(request_id_var.get())
+        log.info(
+            f"Usage: {usage.total_tokens} tokens in {usage.calls} LLM calls, ~${usage.cost_usd:.6f}",
+            extra={"event": "usage", **usage.to_dict()},
+        )
         
         return final_response
     
+    def _use_local_constraints(self, context: AgentContext, parsed: ParsedRequest, note: str) -> None:
+        """Hand locally-parsed constraints straight to the Implementer."""
+        context.config = parsed.config
+        context.add_message(AgentMessage(
+            from_agent=AgentRole.COORDINATOR,
+            to_agent=AgentRole.IMPLEMENTER,
+            content=f"{note} Handing off to implementer.",
+            metadata={"config": parsed.config, "use_case": parsed.use_case}
+        ))
+        log.info(f"Local constraints: {parsed.config}", extra={"role": "coordinator"})
+    
+    def metrics(self) -> dict:
+        """Fast path, degraded mode, circuit breaker, usage and tool execution metrics."""
+        return {
+            "fast_path": self.fast_path_stats.summary(),
+            "plan_cache": self.plan_cache.stats() if self.plan_cache else None,
+            "planner_batching": self.planner.batcher.stats() if self.planner.batcher else None,
+            "degraded_requests": self.degraded_requests,
+            "budget_degraded_requests": self.budget_degraded_requests,
+            "circuit_breaker": self.breaker.metrics(),
+            "prompt_cache": {
+                agent.role.value: agent.prefix_meter.summary()
+                for agent in (self.planner, self.implementer, self.tester)
+            },
+            "usage": self.usage.summary(),
+            "tools": self.tool_executor.stats(),
+        }
+    
     def _generate_final_response(self, context: AgentContext) -> str:
         """Generate the final user-facing response."""
         if not context.implementation or not context.test_results:
@@ -125,10 +289,26 @@ class Orchestrator:
         return response.strip()
 
 
-async def main_async(user_input: str, mock: bool = False) -> None:
-    """Async entry point."""
-    orchestrator = Orchestrator(mock=mock)
+async def main_async(
+    user_input: str,
+    mock: bool = False,
+    fast_path: bool = True,
+    hedge: bool = False,
+    cassette: Cassette | None = None,
+    plan_cache: bool = True,
+    budget: Budget | None = None,
+) -> dict:
+    """Async entry point; returns the orchestrator metrics."""
+    orchestrator = Orchestrator(
+        mock=mock,
+        fast_path=fast_path,
+        hedge=hedge,
+        cassette=cassette,
+        plan_cache=PlanCache() if plan_cache else None,
+        budget=budget,
+    )
     await orchestrator.run(user_input)
+    return orchestrator.metrics()
 
 
 def main():
@@ -147,10 +327,126 @@ def main():
         action="store_true",
         help="Run in mock mode without calling the LLM API"
     )
+    parser.add_argument(
+        "--no-fast-path",
+        action="store_true",
+        help="Always call the Planner, even for requests with explicit constraints"
+    )
+    parser.add_argument(
+        "--no-plan-cache",
+        action="store_true",
+        help="Do not reuse plans across requests with equivalent constraints"
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Fire a second LLM request when the first exceeds the observed p95 latency"
+    )
+    parser.add_argument(
+        "--record",
+        metavar="CASSETTE",
+        help="Record real LLM requests/responses (with latency) to a cassette file"
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="CASSETTE",
+        help="Replay LLM responses from a cassette file (no network)"
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=None,
+        help="Replay at recorded latency divided by this factor (default: instant)"
+    )
+    parser.add_argument(
+        "--replay-loose",
+        action="store_true",
+        help="With --replay, serve unmatched requests from the next recorded interaction instead of failing"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the run; writes PREFIX.txt, PREFIX.collapsed and PREFIX.prof"
+    )
+    parser.add_argument(
+        "--profile-out",
+        default="profile",
+        metavar="PREFIX",
+        help="Output prefix for --profile (default: profile)"
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only log warnings and errors to the console"
+    )
+    parser.add_argument(
+        "--log-json",
+        metavar="PATH",
+        help="Also write structured JSON-lines logs to this file"
+    )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Minimum log level (default: INFO)"
+    )
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        help="Per-request token budget (prompt + completion)"
+    )
+    parser.add_argument(
+        "--max-cost",
+        type=float,
+        metavar="USD",
+        help="Per-request cost budget in USD, estimated from the local price table"
+    )
+    parser.add_argument(
+        "--on-budget",
+        choices=["abort", "downgrade"],
+        default="abort",
+        help="What to do when a request would exceed its budget (default: abort)"
+    )
+    parser.add_argument(
+        "--downgrade-model",
+        default="gpt-4.1-nano",
+        help="Cheaper model to switch to with --on-budget downgrade (default: gpt-4.1-nano)"
+    )
     
     args = parser.parse_args()
     
-    asyncio.run(main_async(args.prompt, mock=args.mock))
+    cassette = None
+    if args.record:
+        cassette = Cassette(args.record, mode="record")
+    elif args.replay:
+        cassette = Cassette(args.replay, mode="replay", speed=args.replay_speed, loose=args.replay_loose)
+    
+    budget = None
+    if args.max_tokens is not None or args.max_cost is not None:
+        budget = Budget(args.max_tokens, args.max_cost, args.on_budget, args.downgrade_model)
+    
+    listener = configure_logging(level=args.log_level, quiet=args.quiet, json_path=args.log_json)
+    profiler = Profiler(args.profile_out) if args.profile else None
+    try:
+        with profiler or contextlib.nullcontext():
+            metrics = asyncio.run(main_async(
+                args.prompt,
+                mock=args.mock,
+                fast_path=not args.no_fast_path,
+                hedge=args.hedge,
+                cassette=cassette,
+                plan_cache=not args.no_plan_cache,
+                budget=budget,
+            ))
+    except (BudgetExceededError, CassetteMiss):
+        sys.exit(1)  # Already logged by the orchestrator
+    finally:
+        listener.stop()  # Flush queued log records before printing anything else
+    
+    print(f"Metrics: {metrics}")
+    if profiler:
+        print(profiler.format_summary(limit=0))
+        print(f"\nProfile written to: {', '.join(str(p) for p in profiler.write())}")
 
 
 if __name__ == "__main__":
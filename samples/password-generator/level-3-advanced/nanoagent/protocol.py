@@ -0,0 +1,56 @@
+"""
+Framed JSON Protocol
+
+Messages between the daemon and its clients are JSON objects, each prefixed
+with a 4-byte big-endian length. Only lightweight standard library modules are
+imported so the client stays fast to start; the asyncio side lives in daemon.py.
+"""
+
+import json
+import os
+import socket
+import struct
+from pathlib import Path
+
+HEADER = struct.Struct(">I")
+MAX_FRAME_BYTES = 1024 * 1024
+
+
+def default_socket_path() -> str:
+    """Per-user socket path, overridable with NANOAGENT_SOCKET."""
+    if os.getenv("NANOAGENT_SOCKET"):
+        return os.environ["NANOAGENT_SOCKET"]
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR") or os.getenv("TMPDIR") or "/tmp"
+    return str(Path(runtime_dir) / f"nanoagent-{os.getuid()}.sock")
+
+
+def encode_frame(message: dict) -> bytes:
+    payload = json.dumps(message).encode("utf-8")
+    if len(payload) > MAX_FRAME_BYTES:
+        raise ValueError(f"Frame too large: {len(payload)} bytes")
+    return HEADER.pack(len(payload)) + payload
+
+
+def decode_length(header: bytes) -> int:
+    (length,) = HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise ValueError(f"Frame too large: {length} bytes")
+    return length
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("Connection closed by daemon")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def request(sock: socket.socket, message: dict) -> dict:
+    """Send one frame over a blocking socket and wait for the reply."""
+    sock.sendall(encode_frame(message))
+    length = decode_length(_recv_exactly(sock, HEADER.size))
+    return json.loads(_recv_exactly(sock, length))
@@ -0,0 +1,162 @@
+"""
+Nanoagent Level 3: Priority Request Scheduler
+
+Sits in front of Orchestrator.run so a large bulk job cannot starve interactive
+requests. Each request is submitted with a priority class; the scheduler keeps
+one FIFO queue per class and admits requests as slots free up:
+
+- Global concurrency limit: at most max_concurrency requests run at once
+- Reserved slots: a class's `reserved` slots are never handed to other
+  classes, so bulk work always leaves room for interactive requests; the
+  other classes' caps derive from max_concurrency (at least 1 slot each)
+- Weighted fair queuing: among classes with waiting requests, the one with the
+  lowest virtual time is served next; each admission advances the class's
+  virtual time by 1/weight, so interactive (weight 8) gets 8 slots for every
+  bulk (weight 1) slot when both are backlogged
+- Queue-time metrics per class (p50/p95/max time from submit to start)
+
+Usage:
+    scheduler = RequestScheduler(orchestrator.run)
+    response = await scheduler.submit("Generate a password", priority="interactive")
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+
+@dataclass
+class PriorityClass:
+    """
+    A traffic class with its fair-share weight, optional concurrency cap, and
+    slots reserved for it (kept out of every other class's reach).
+    """
+    name: str
+    weight: float = 1.0
+    max_concurrency: int | None = None
+    reserved: int = 0
+
+
+DEFAULT_CLASSES = (
+    PriorityClass("interactive", weight=8.0, reserved=2),
+    PriorityClass("bulk", weight=1.0),
+)
+
+
+@dataclass
+class _ClassState:
+    spec: PriorityClass
+    cap: int  # Effective concurrency cap under the scheduler's limit
+    waiting: deque = field(default_factory=deque)
+    running: int = 0
+    completed: int = 0
+    virtual_time: float = 0.0
+    queue_times: deque = field(default_factory=lambda: deque(maxlen=1000))
+
+    def can_start(self) -> bool:
+        return bool(self.waiting) and self.running < self.cap
+
+
+def _percentile(samples, pct: float) -> float | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class RequestScheduler:
+    """Admits requests to `run` by priority class, weighted fair queuing and concurrency caps."""
+
+    def __init__(
+        self,
+        run: Callable[..., Awaitable[Any]],
+        classes: tuple[PriorityClass, ...] = DEFAULT_CLASSES,
+        max_concurrency: int = 8,
+    ):
+        self.run = run
+        self.max_concurrency = max_concurrency
+        reserved = sum(spec.reserved for spec in classes)
+        self.classes = {}
+        for spec in classes:
+            # Slots reserved for the other classes are off limits, but every class can run something
+            cap = max(1, max_concurrency - (reserved - spec.reserved))
+            if spec.max_concurrency is not None:
+                cap = min(cap, spec.max_concurrency)
+            self.classes[spec.name] = _ClassState(spec, cap)
+        self.running = 0
+
+    async def submit(self, *args: Any, priority: str = "interactive", **kwargs: Any) -> Any:
+        """Queue a call to run(*args, **kwargs) and return its result once it has run."""
+        state = self.classes.get(priority)
+        if state is None:
+            raise ValueError(f"Unknown priority class {priority!r}; expected one of {sorted(self.classes)}")
+
+        if not state.waiting and state.running == 0:
+            # A class returning from idle must not bank credit from the time it was away
+            state.virtual_time = max(state.virtual_time, self._min_active_virtual_time())
+        slot = asyncio.get_running_loop().create_future()
+        enqueued = time.perf_counter()
+        state.waiting.append(slot)
+        self._dispatch()
+
+        try:
+            await slot
+        except asyncio.CancelledError:
+            if slot in state.waiting:
+                state.waiting.remove(slot)
+            elif slot.done() and not slot.cancelled():
+                self._release(state)  # Admitted, then cancelled before starting
+            raise
+        state.queue_times.append(time.perf_counter() - enqueued)
+
+        try:
+            return await self.run(*args, **kwargs)
+        finally:
+            state.completed += 1
+            self._release(state)
+
+    def _min_active_virtual_time(self) -> float:
+        active = [s.virtual_time for s in self.classes.values() if s.waiting or s.running]
+        return min(active, default=0.0)
+
+    def _dispatch(self) -> None:
+        while self.running < self.max_concurrency:
+            eligible = [s for s in self.classes.values() if s.can_start()]
+            if not eligible:
+                return
+            state = min(eligible, key=lambda s: s.virtual_time)
+            slot = state.waiting.popleft()
+            if slot.done():
+                continue  # Cancelled while queued
+            state.virtual_time += 1.0 / state.spec.weight
+            state.running += 1
+            self.running += 1
+            slot.set_result(None)
+
+    def _release(self, state: _ClassState) -> None:
+        state.running -= 1
+        self.running -= 1
+        self._dispatch()
+
+    def metrics(self) -> dict:
+        """Per-class queue depth, running count and queue-time percentiles (seconds)."""
+        return {
+            "running": self.running,
+            "max_concurrency": self.max_concurrency,
+            "classes": {
+                name: {
+                    "weight": s.spec.weight,
+                    "max_concurrency": s.cap,
+                    "reserved": s.spec.reserved,
+                    "queued": len(s.waiting),
+                    "running": s.running,
+                    "completed": s.completed,
+                    "queue_time_p50_s": _percentile(s.queue_times, 50),
+                    "queue_time_p95_s": _percentile(s.queue_times, 95),
+                    "queue_time_max_s": max(s.queue_times, default=None),
+                }
+                for name, s in self.classes.items()
+            },
+        }
@@ -1,14 +1,24 @@
 # Tools package for the advanced nanoagent
 from .shared_tools import (
     generate_password,
+    generate_passwords,
     check_password_strength,
     GeneratePasswordInput,
     CheckPasswordStrengthInput,
 )
+from .reservoir import PasswordReservoir, check_policy, policy_key
+from .executor import LoopLagMonitor, OffloadPolicy, ToolExecutor
 
 __all__ = [
     "generate_password",
+    "generate_passwords",
     "check_password_strength",
     "GeneratePasswordInput",
     "CheckPasswordStrengthInput",
+    "PasswordReservoir",
+    "check_policy",
+    "policy_key",
+    "LoopLagMonitor",
+    "OffloadPolicy",
+    "ToolExecutor",
 ]
@@ -0,0 +1,147 @@
+"""
+Async Tool Execution
+
+The tools are plain synchronous functions. Called directly from an agent's
+async process(), they block the event loop, and with it every other pipeline
+sharing that loop, for as long as they run. ToolExecutor decides per call:
+
+- inline:  small calls (size below inline_max) run directly; a thread hop
+           would cost more than the work itself
+- thread:  larger calls run in a thread pool, so the loop keeps serving other
+           coroutines (the GIL is still shared, but released every switch
+           interval instead of held for the whole call)
+- process: calls at or above process_min run in a process pool, off the GIL
+           entirely; arguments and results must be picklable
+
+`size` is a rough work estimate supplied by the caller, e.g. the number of
+characters to generate or scan. LoopLagMonitor measures how late the loop
+wakes up a sleeping coroutine, which is what blocking calls show up as.
+
+Usage:
+    executor = ToolExecutor()
+    password = await executor.run(generate_password, params, size=params.length)
+"""
+
+import asyncio
+import functools
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass
+class OffloadPolicy:
+    """Where a tool call runs, by its size (work units, e.g. characters)."""
+    inline_max: int = 1024  # ~1.5 ms of generation; a thread hop costs ~35 µs
+    process_min: int | None = None  # None: never use processes
+    max_workers: int | None = None
+
+
+class ToolExecutor:
+    """Runs synchronous tools inline, in a thread pool or in a process pool."""
+
+    def __init__(self, policy: OffloadPolicy | None = None):
+        self.policy = policy or OffloadPolicy()
+        self._threads: ThreadPoolExecutor | None = None
+        self._processes: ProcessPoolExecutor | None = None
+        self.calls = {"inline": 0, "thread": 0, "process": 0}
+        self.seconds = {"inline": 0.0, "thread": 0.0, "process": 0.0}
+
+    def placement(self, size: int) -> str:
+        if size < self.policy.inline_max:
+            return "inline"
+        if self.policy.process_min is not None and size >= self.policy.process_min:
+            return "process"
+        return "thread"
+
+    async def run(self, func: Callable[..., Any], *args: Any, size: int = 0) -> Any:
+        """Run func(*args) where its size says it belongs and return the result."""
+        where = self.placement(size)
+        start = time.perf_counter()
+        try:
+            if where == "inline":
+                return func(*args)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool(where), functools.partial(func, *args))
+        finally:
+            self.calls[where] += 1
+            self.seconds[where] += time.perf_counter() - start
+
+    def _pool(self, where: str) -> Executor:
+        # Pools are created on first use, so inline-only workloads never start one
+        if where == "process":
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(self.policy.max_workers)
+            return self._processes
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(self.policy.max_workers, thread_name_prefix="nanoagent-tool")
+        return self._threads
+
+    def close(self) -> None:
+        for pool in (self._threads, self._processes):
+            if pool is not None:
+                pool.shutdown(wait=True)
+        self._threads = self._processes = None
+
+    def stats(self) -> dict:
+        return {
+            "inline_max": self.policy.inline_max,
+            "process_min": self.policy.process_min,
+            "calls": dict(self.calls),
+            "seconds": {k: round(v, 6) for k, v in self.seconds.items()},
+        }
+
+
+class LoopLagMonitor:
+    """
+    Samples event-loop lag: a coroutine sleeps `interval` seconds in a loop and
+    records how much later than requested it actually woke up.
+
+    Usage:
+        async with LoopLagMonitor() as lag:
+            ...
+        print(lag.summary())
+    """
+
+    def __init__(self, interval: float = 0.005, max_samples: int = 10000):
+        self.interval = interval
+        self.samples: deque[float] = deque(maxlen=max_samples)
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "LoopLagMonitor":
+        self._task = asyncio.ensure_future(self._sample())
+        await asyncio.sleep(0)  # Let the sampler start
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - start - self.interval))
+
+    def summary(self) -> dict:
+        """Lag percentiles in milliseconds."""
+        if not self.samples:
+            return {"samples": 0, "p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+        ordered = sorted(self.samples)
+
+        def pct(p: float) -> float:
+            return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] * 1000
+
+        return {
+            "samples": len(ordered),
+            "p50_ms": pct(50),
+            "p95_ms": pct(95),
+            "p99_ms": pct(99),
+            "max_ms": ordered[-1] * 1000,
+        }
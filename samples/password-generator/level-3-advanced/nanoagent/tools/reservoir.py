@@ -0,0 +1,170 @@
+"""
+Password Reservoir
+
+Keeps per-policy pools of ready passwords so issuing one at request time is an
+O(1) pop instead of a generation call. A background thread refills any pool
+that drops below its low-water mark.
+
+Each pool is keyed by the GeneratePasswordInput field values. Passwords are
+popped exactly once and never re-queued, so no entry is handed out twice.
+Pooled passwords live in process memory until issued; only use a reservoir in
+processes you would trust with the issued credentials anyway.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+from .shared_tools import GeneratePasswordInput, _character_classes, generate_password
+
+
+PolicyKey = tuple
+
+
+def policy_key(params: GeneratePasswordInput) -> PolicyKey:
+    """Pool key built from the input's field values (in declaration order)."""
+    return tuple(params.model_dump().values())
+
+
+def check_policy(params: GeneratePasswordInput) -> None:
+    """
+    Raise ValueError for a policy no password can satisfy. generate_password
+    returns an "Error: ..." string for these, which a pool would hand out as
+    if it were a password.
+    """
+    classes = _character_classes(params)
+    if not "".join(classes):
+        raise ValueError("At least one character type must be selected")
+    if params.require_each_class:
+        if not all(classes):
+            raise ValueError("Excluded characters remove every character of an enabled class")
+        required = params.min_per_class * len(classes)
+        if required > params.length:
+            raise ValueError(f"Length {params.length} is too short for {required} required characters")
+
+
+class PasswordReservoir:
+    """
+    Pre-generated password pools with background refill.
+
+    Usage:
+        with PasswordReservoir() as reservoir:
+            password = reservoir.get(GeneratePasswordInput(length=20))
+    """
+
+    def __init__(
+        self,
+        low_water: int = 32,
+        high_water: int = 128,
+        generator: Callable[[GeneratePasswordInput], str] = generate_password,
+    ):
+        if not 1 <= low_water < high_water:
+            raise ValueError("Expected 1 <= low_water < high_water")
+        self.low_water = low_water
+        self.high_water = high_water
+        self.generator = generator
+
+        self._pools: dict[PolicyKey, deque[str]] = {}
+        self._policies: dict[PolicyKey, GeneratePasswordInput] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self.hits = 0
+        self.misses = 0
+        self.refilled = 0
+        self.refill_seconds = 0.0
+
+    def start(self) -> "PasswordReservoir":
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._refill_loop, name="password-reservoir", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "PasswordReservoir":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def register(self, params: GeneratePasswordInput) -> PolicyKey:
+        """Create an (empty) pool for a policy and schedule it for refill."""
+        key = policy_key(params)
+        if key not in self._pools:
+            check_policy(params)
+        with self._lock:
+            if key not in self._pools:
+                self._pools[key] = deque()
+                self._policies[key] = params
+        self._wakeup.set()
+        return key
+
+    def get(self, params: GeneratePasswordInput) -> str:
+        """
+        Pop a ready password, generating inline if the pool is empty.
+        Raises ValueError if the policy cannot produce a password.
+        """
+        key = policy_key(params)
+        if key not in self._pools:
+            self.register(params)
+        with self._lock:
+            pool = self._pools[key]
+            password = pool.popleft() if pool else None
+            if password is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            below_low_water = len(pool) < self.low_water
+        if below_low_water:
+            self._wakeup.set()
+        return password if password is not None else self.generator(params)
+
+    def fill(self, params: GeneratePasswordInput) -> None:
+        """Synchronously fill a policy's pool to the high-water mark."""
+        self._refill(self.register(params))
+
+    def _refill(self, key: PolicyKey) -> None:
+        params = self._policies[key]
+        while not self._stopping.is_set():
+            with self._lock:
+                missing = self.high_water - len(self._pools[key])
+            if missing <= 0:
+                return
+            start = time.perf_counter()
+            batch = [self.generator(params) for _ in range(missing)]
+            with self._lock:
+                self._pools[key].extend(batch)
+                self.refilled += len(batch)
+                self.refill_seconds += time.perf_counter() - start
+
+    def _refill_loop(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait()
+            self._wakeup.clear()
+            with self._lock:
+                low = [key for key, pool in self._pools.items() if len(pool) < self.low_water]
+            for key in low:
+                self._refill(key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            pool_sizes = {str(key): len(pool) for key, pool in self._pools.items()}
+        requests = self.hits + self.misses
+        return {
+            "pool_sizes": pool_sizes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / requests if requests else 0.0,
+            "refilled": self.refilled,
+            "refill_rate_per_s": self.refilled / self.refill_seconds if self.refill_seconds else 0.0,
+        }
@@ -8,6 +8,11 @@ import secrets
 import string
 from pydantic import BaseModel, Field
 
+SYMBOLS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+AMBIGUOUS_CHARACTERS = "Il1O0o|"
+
+_system_random = secrets.SystemRandom()
+
 
 class GeneratePasswordInput(BaseModel):
     """Input schema for password generation."""
@@ -16,6 +21,14 @@ class GeneratePasswordInput(BaseModel):
     include_lowercase: bool = Field(default=True, description="Include lowercase letters")
     include_numbers: bool = Field(default=True, description="Include numbers")
     include_symbols: bool = Field(default=True, description="Include special symbols")
+    require_each_class: bool = Field(
+        default=False, description="Guarantee characters from every enabled class"
+    )
+    min_per_class: int = Field(
+        default=1, ge=1, le=32, description="Minimum characters per enabled class (with require_each_class)"
+    )
+    exclude_characters: str = Field(default="", description="Characters that must not appear")
+    exclude_ambiguous: bool = Field(default=False, description=f"Exclude look-alike characters ({AMBIGUOUS_CHARACTERS})")
 
 
 class CheckPasswordStrengthInput(BaseModel):
@@ -23,23 +36,59 @@ class CheckPasswordStrengthInput(BaseModel):
     password: str = Field(description="The password to check")
 
 
-def generate_password(params: GeneratePasswordInput) -> str:
-    """Generate a cryptographically secure password."""
-    charset = ""
+def _character_classes(params: GeneratePasswordInput) -> list[str]:
+    """Return the enabled character classes with excluded characters removed."""
+    classes = []
     if params.include_uppercase:
-        charset += string.ascii_uppercase
+        classes.append(string.ascii_uppercase)
     if params.include_lowercase:
-        charset += string.ascii_lowercase
+        classes.append(string.ascii_lowercase)
     if params.include_numbers:
-        charset += string.digits
+        classes.append(string.digits)
     if params.include_symbols:
-        charset += "!@#$%^&*()_+-=[]{}|;:,.<>?"
+        classes.append(SYMBOLS)
+    
+    excluded = set(params.exclude_characters)
+    if params.exclude_ambiguous:
+        excluded |= set(AMBIGUOUS_CHARACTERS)
+    if not excluded:
+        return classes
+    return ["".join(c for c in chars if c not in excluded) for chars in classes]
+
+
+def generate_password(params: GeneratePasswordInput) -> str:
+    """
+    Generate a cryptographically secure password.
+    
+    With require_each_class, the password is built constructively: min_per_class
+    characters are drawn from each enabled class, the rest from the merged charset,
+    and the result is shuffled so required characters land in uniformly random
+    positions. No rejection loop is needed.
+    """
+    classes = _character_classes(params)
+    charset = "".join(classes)
     
     if not charset:
         return "Error: At least one character type must be selected"
     
-    password = ''.join(secrets.choice(charset) for _ in range(params.length))
-    return password
+    if not params.require_each_class:
+        return ''.join(secrets.choice(charset) for _ in range(params.length))
+    
+    if not all(classes):
+        return "Error: Excluded characters remove every character of an enabled class"
+    required = params.min_per_class * len(classes)
+    if required > params.length:
+        return f"Error: Length {params.length} is too short for {required} required characters"
+    
+    chars = [secrets.choice(chars) for chars in classes for _ in range(params.min_per_class)]
+    chars += [secrets.choice(charset) for _ in range(params.length - required)]
+    _system_random.shuffle(chars)
+    return ''.join(chars)
+
+
+def generate_passwords(params: GeneratePasswordInput, count: int) -> list[str]:
+    """Generate `count` passwords with the same settings (bulk generation)."""
+    return [generate_password(params) for _ in range(count)]
 
 
 def check_password_strength(params: CheckPasswordStrengthInput) -> dict:
@@ -51,7 +100,7 @@ def check_password_strength(params: CheckPasswordStrengthInput) -> dict:
         "has_uppercase": any(c.isupper() for c in password),
         "has_lowercase": any(c.islower() for c in password),
         "has_numbers": any(c.isdigit() for c in password),
-        "has_symbols": any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password),
+        "has_symbols": any(c in SYMBOLS for c in password),
     }
     
     score = sum(checks.values())
@@ -0,0 +1,407 @@
+"""
+Sample Generation Runner
+
+Generates the three levels of many training projects concurrently, outside
+VS Code: every (project, level) pair is one job, and a bounded pool of workers
+sends each job to a model backend with the sampler agent as the system prompt.
+The shared assets (sampler.agent.md, the /initialize prompt and the repo's
+copilot instructions) are read once and reused by every job.
+
+The model answers with a JSON object mapping file paths (relative to the level
+folder) to file contents; the runner writes them to output/{project}/{level}/
+and records the level in the project's manifest (see manifest.py). Levels the
+manifest reports as up to date are skipped unless --force is given. When a
+level is regenerated, files edited since generation and untracked files are
+left as they are (unless --force), and previously generated files the model no
+longer returns are deleted.
+
+Backends:
+- litellm: a real model via LiteLLM ($SAMPLER_MODEL, default gpt-4.1)
+- stub:    offline; returns a minimal, well-formed level after a simulated delay
+
+Projects are given as "name: requirements" arguments or in a file with one per
+line (blank lines and # comments ignored).
+
+Usage:
+    python scripts/generate.py "password-generator: web app with HTML, CSS and JavaScript"
+    python scripts/generate.py --projects-file projects.txt --workers 6
+    python scripts/generate.py --backend stub --output /tmp/output --projects-file projects.txt
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Protocol
+
+import manifest
+
+REPO_ROOT = manifest.REPO_ROOT
+LEVELS = manifest.LEVELS
+
+
+@dataclass(frozen=True)
+class SharedAssets:
+    """Generator inputs shared by every job, loaded once."""
+    sampler_agent: str
+    initialize_prompt: str
+    copilot_instructions: str
+
+    @classmethod
+    def load(cls, repo_root: Path = REPO_ROOT) -> "SharedAssets":
+        def body(name: str) -> str:
+            return strip_front_matter((repo_root / name).read_text(encoding="utf-8"))
+
+        return cls(
+            sampler_agent=body(".github/agents/sampler.agent.md"),
+            initialize_prompt=body(".github/prompts/initialize.prompt.md"),
+            copilot_instructions=body(".github/copilot-instructions.md"),
+        )
+
+    @property
+    def system_prompt(self) -> str:
+        return f"{self.sampler_agent}\n\n# Repository Instructions\n\n{self.copilot_instructions}"
+
+
+@dataclass(frozen=True)
+class Project:
+    name: str
+    requirements: str
+
+
+@dataclass(frozen=True)
+class Job:
+    project: Project
+    level: str
+
+    @property
+    def label(self) -> str:
+        return f"{self.project.name}/{self.level}"
+
+
+@dataclass
+class JobResult:
+    job: Job
+    status: str  # "generated", "skipped" or "failed"
+    seconds: float = 0.0
+    files: int = 0
+    kept: int = 0  # Edited or untracked files left as they were
+    removed: int = 0  # Previously generated files the model no longer returned
+    error: str | None = None
+
+
+@dataclass
+class RunReport:
+    results: list[JobResult] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def failed(self) -> list[JobResult]:
+        return [r for r in self.results if r.status == "failed"]
+
+
+def strip_front_matter(text: str) -> str:
+    if text.startswith("---"):
+        end = text.find("\n---", 3)
+        if end != -1:
+            return text[end + 4:].lstrip("\n")
+    return text
+
+
+def parse_projects(lines: list[str]) -> list[Project]:
+    """'name: requirements' entries; the name must be a folder-safe slug."""
+    projects = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        name, _, requirements = line.partition(":")
+        name = name.strip()
+        if not re.fullmatch(r"[a-z0-9][a-z0-9-]*", name):
+            raise ValueError(f"Invalid project name {name!r}; use lowercase letters, digits and hyphens")
+        projects.append(Project(name, requirements.strip() or name.replace("-", " ")))
+    return projects
+
+
+def build_messages(assets: SharedAssets, job: Job) -> list[dict]:
+    task = assets.initialize_prompt.replace("$ARGUMENTS", f"{job.project.name}: {job.project.requirements}")
+    return [
+        {"role": "system", "content": assets.system_prompt},
+        {
+            "role": "user",
+            "content": (
+                f"{task}\n\n"
+                f"Generate only `{job.level}` for the project `{job.project.name}`. Do not ask clarifying "
+                "questions; use the requirements above. Respond with only a JSON object that maps each file "
+                f"path, relative to `output/{job.project.name}/{job.level}/`, to the complete file content."
+            ),
+        },
+    ]
+
+
+def parse_files(response: str) -> dict[str, str]:
+    """The {path: content} object from a model response (code fences allowed), with safe paths only."""
+    text = response.strip()
+    fenced = re.match(r"^```(?:json)?\s*\n(.*)\n```$", text, re.DOTALL)
+    if fenced:
+        text = fenced.group(1)
+    files = json.loads(text)
+    if not isinstance(files, dict) or not all(isinstance(v, str) for v in files.values()):
+        raise ValueError("Expected a JSON object mapping file paths to contents")
+    for path in files:
+        parts = PurePosixPath(path).parts
+        if not parts or PurePosixPath(path).is_absolute() or ".." in parts or "\\" in path:
+            raise ValueError(f"Unsafe file path in response: {path!r}")
+    return files
+
+
+class Backend(Protocol):
+    async def complete(self, messages: list[dict], job: Job) -> str: ...
+
+
+class LiteLLMBackend:
+    """Real model calls through LiteLLM (credentials from the usual provider env vars)."""
+
+    def __init__(self, model: str | None = None):
+        self.model = model or os.getenv("SAMPLER_MODEL", "gpt-4.1")
+
+    async def complete(self, messages: list[dict], job: Job) -> str:
+        from litellm import acompletion
+
+        response = await acompletion(
+            model=self.model, messages=messages, temperature=0.4, response_format={"type": "json_object"}
+        )
+        return response.choices[0].message.content
+
+
+class StubBackend:
+    """Offline backend: a minimal, well-formed level after a random delay."""
+
+    def __init__(self, delay: float = 0.5, jitter: float = 0.5, seed: int | None = None):
+        self.delay = delay
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.calls = 0
+
+    async def complete(self, messages: list[dict], job: Job) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay * (1 + self.rng.uniform(-self.jitter, self.jitter)))
+        return json.dumps(stub_level(job))
+
+
+def _md(description: str, title: str, body: str, **extra: str) -> str:
+    front = "".join(f"{key}: {value}\n" for key, value in extra.items())
+    return f"---\ndescription: '{description}'\n{front}---\n\n# {title}\n\n{body}\n"
+
+
+def stub_level(job: Job) -> dict[str, str]:
+    """The files of a level in the expected layout, with placeholder content."""
+    name, requirements = job.project.name, job.project.requirements
+    title = name.replace("-", " ").title()
+    files = {
+        "README.md": f"# {title}: {job.level}\n\nRequirements: {requirements}\n",
+        ".github/copilot-instructions.md": f"# Copilot Instructions\n\nProject: {title}.\n",
+        f".github/prompts/{name}.prompt.md": _md(f"Create the {title}", title, f"Build: {requirements}."),
+    }
+    if job.level == "level-1-basic":
+        return files
+    for topic in ("security", "accessibility", "testability", "performance"):
+        files[f".github/instructions/{topic}.instructions.md"] = _md(
+            f"{topic.title()} best practices", f"{topic.title()} Best Practices",
+            f"Apply {topic} best practices. See [the prompt](../prompts/{name}.prompt.md).",
+            applyTo="'**'",
+        )
+    for skill in ("testing", "security-validation", "code-quality"):
+        files[f".github/skills/{skill}/SKILL.md"] = (
+            f"---\nname: {name}-{skill}\ndescription: {skill.replace('-', ' ').title()} workflow for {title}\n---\n\n"
+            f"# {skill.replace('-', ' ').title()}\n\nFollow the steps for {skill}.\n"
+        )
+    if job.level == "level-3-advanced":
+        for role in ("planner", "coordinator", "implementer", "tester"):
+            files[f".github/agents/{role}.agent.md"] = (
+                f"---\nname: {role.title()}\ndescription: '{role.title()} agent for {title}'\n"
+                f"tools:\n  - codebase\n---\n\nYou are the **{role.title()} Agent** for {title}.\n"
+            )
+        files[".github/skills/testing/test-template.js"] = "// Test template\n"
+    return files
+
+
+def write_level(output_dir: Path, job: Job, files: dict[str, str], protected: set[str]) -> tuple[set[str], set[str]]:
+    """
+    Write a level's files, except protected ones (paths relative to the project
+    dir). Returns the paths written and the protected paths left untouched.
+    """
+    project_dir = output_dir / job.project.name
+    written, kept = set(), set()
+    for path, content in files.items():
+        relative = f"{job.level}/{PurePosixPath(path).as_posix()}"
+        if relative in protected:
+            kept.add(relative)
+            continue
+        target = project_dir / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content, encoding="utf-8")
+        written.add(relative)
+    return written, kept
+
+
+def remove_stale(output_dir: Path, job: Job, written: set[str]) -> set[str]:
+    """
+    Delete files of the level's previous generation that the model no longer
+    returned. Only files still identical to what was generated are deleted;
+    edited and untracked files stay.
+    """
+    project_dir = output_dir / job.project.name
+    removed = set()
+    for path, entry in manifest.load_manifest(project_dir)["files"].items():
+        target = project_dir / path
+        if entry["level"] != job.level or path in written or not target.is_file():
+            continue
+        if manifest.sha256_file(target) == entry["sha256"]:
+            target.unlink()
+            removed.add(path)
+            # Prune directories the deletion left empty, up to the level folder
+            parent = target.parent
+            while parent != project_dir / job.level and not any(parent.iterdir()):
+                parent.rmdir()
+                parent = parent.parent
+    return removed
+
+
+def pending_levels(output_dir: Path, project: Project, force: bool) -> dict[str, set[str]]:
+    """
+    Levels of a project that need (re)generating according to its manifest,
+    each with the files it must not overwrite: files edited since generation
+    and untracked files (every file of a level never recorded). --force
+    regenerates every level and overwrites them all.
+    """
+    project_dir = output_dir / project.name
+    if not project_dir.is_dir():
+        return {level: set() for level in LEVELS}
+    report = manifest.status(project_dir, project.requirements)
+    pending = {}
+    for level, entry in report["levels"].items():
+        if not force and entry["state"] == "up-to-date" and not entry["missing_files"]:
+            continue
+        protected = set()
+        if not force:
+            protected = set(entry["edited_files"]) | set(entry["untracked_files"])
+            if entry["state"] == "untracked":
+                protected |= set(manifest.level_files(project_dir, level))
+        pending[level] = protected
+    return pending
+
+
+async def run(
+    projects: list[Project],
+    backend: Backend,
+    output_dir: Path,
+    workers: int = 4,
+    force: bool = False,
+    assets: SharedAssets | None = None,
+    progress=print,
+) -> RunReport:
+    """Generate every pending (project, level) with at most `workers` jobs in flight."""
+    assets = assets or SharedAssets.load()
+    report = RunReport()
+    jobs = []
+    protected: dict[Job, set[str]] = {}
+    for project in projects:
+        pending = pending_levels(output_dir, project, force)
+        for level in LEVELS:
+            if level in pending:
+                jobs.append(Job(project, level))
+                protected[jobs[-1]] = pending[level]
+            else:
+                report.results.append(JobResult(Job(project, level), "skipped"))
+
+    semaphore = asyncio.Semaphore(workers)
+    locks = {project.name: asyncio.Lock() for project in projects}  # One manifest writer per project
+    done = 0
+    start = time.perf_counter()
+
+    async def run_job(job: Job) -> None:
+        nonlocal done
+        async with semaphore:
+            job_start = time.perf_counter()
+            try:
+                files = parse_files(await backend.complete(build_messages(assets, job), job))
+                written, kept = write_level(output_dir, job, files, protected[job])
+                async with locks[job.project.name]:
+                    removed = remove_stale(output_dir, job, written)
+                    manifest.record(
+                        output_dir / job.project.name, [job.level], job.project.requirements, generated=written
+                    )
+                result = JobResult(
+                    job, "generated", time.perf_counter() - job_start, len(written), len(kept), len(removed)
+                )
+            except Exception as e:
+                result = JobResult(job, "failed", time.perf_counter() - job_start, error=f"{type(e).__name__}: {e}")
+        report.results.append(result)
+        done += 1
+        detail = result.error
+        if result.status == "generated":
+            detail = f"{result.files} files"
+            if result.kept or result.removed:
+                detail += f" ({result.kept} kept, {result.removed} removed)"
+        progress(f"[{done}/{len(jobs)}] {job.label:<45} {result.status:<9} {result.seconds:6.2f}s  {detail}")
+
+    if report.results:
+        progress(f"Skipping {len(report.results)} up-to-date level(s)")
+    await asyncio.gather(*(run_job(job) for job in jobs))
+    report.wall_seconds = time.perf_counter() - start
+    return report
+
+
+def format_report(report: RunReport) -> str:
+    lines = [f"\n{'project':<28} {'level':<22} {'status':<10} {'seconds':>8} {'files':>6}"]
+    for r in sorted(report.results, key=lambda r: (r.job.project.name, r.job.level)):
+        lines.append(
+            f"{r.job.project.name:<28} {r.job.level:<22} {r.status:<10} {r.seconds:>8.2f} {r.files:>6}"
+        )
+    busy = sum(r.seconds for r in report.results)
+    generated = sum(r.status == "generated" for r in report.results)
+    lines.append(
+        f"\n{generated} generated, {len(report.failed)} failed, "
+        f"{sum(r.status == 'skipped' for r in report.results)} skipped in {report.wall_seconds:.2f}s wall "
+        f"({busy:.2f}s of job time, {busy / report.wall_seconds if report.wall_seconds else 0:.1f}x concurrency)"
+    )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate sample levels for many projects concurrently")
+    parser.add_argument("projects", nargs="*", help="'name: requirements' entries")
+    parser.add_argument("--projects-file", type=Path, help="File with one 'name: requirements' entry per line")
+    parser.add_argument("--output", type=Path, default=REPO_ROOT / "output", help="Output root (default: output/)")
+    parser.add_argument("--workers", type=int, default=4, help="Maximum jobs in flight (default: 4)")
+    parser.add_argument("--backend", choices=["litellm", "stub"], default="litellm")
+    parser.add_argument("--model", help="LiteLLM model (default: $SAMPLER_MODEL or gpt-4.1)")
+    parser.add_argument("--stub-delay", type=float, default=0.5, help="Mean stub latency in seconds")
+    parser.add_argument("--force", action="store_true", help="Regenerate every level and overwrite edited and untracked files")
+    args = parser.parse_args()
+
+    lines = list(args.projects)
+    if args.projects_file:
+        lines += args.projects_file.read_text(encoding="utf-8").splitlines()
+    try:
+        projects = parse_projects(lines)
+    except ValueError as e:
+        parser.error(str(e))
+    if not projects:
+        parser.error("no projects given")
+
+    backend = StubBackend(args.stub_delay) if args.backend == "stub" else LiteLLMBackend(args.model)
+    report = asyncio.run(run(projects, backend, args.output, workers=args.workers, force=args.force))
+    print(format_report(report))
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
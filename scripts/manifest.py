@@ -0,0 +1,267 @@
+"""
+Sample Manifest: incremental regeneration for output/{project-name}
+
+Records, next to each generated project, a manifest of every generated file
+(path -> content hash) and of the inputs each level was generated from:
+
+- the sampler agent definition, split into blocks so that an edit to the
+  "level 3" guidance only invalidates level 3 (blocks that mention no level
+  are shared by all levels)
+- the /initialize and /update prompts and the repo's copilot instructions
+- the project requirements the user typed after the command
+
+`status` compares the manifest with the current tree and inputs and tells the
+sampler agent what actually needs regenerating:
+
+- stale levels:    an input changed; regenerate the level
+- missing files:   recorded but deleted; regenerate the file
+- edited files:    content changed since generation; review, do not overwrite
+- untracked files: present but never recorded
+
+`record` rewrites the manifest entries of the levels that were just written.
+
+Usage:
+    python scripts/manifest.py status output/password-generator
+    python scripts/manifest.py status output/password-generator --requirements "web app, no frameworks" --json
+    python scripts/manifest.py record output/password-generator --level level-3-advanced
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MANIFEST_NAME = ".manifest.json"
+MANIFEST_VERSION = 1
+
+LEVELS = ("level-1-basic", "level-2-intermediate", "level-3-advanced")
+
+# Inputs every level depends on as a whole
+SHARED_INPUTS = (
+    ".github/prompts/initialize.prompt.md",
+    ".github/prompts/update.prompt.md",
+    ".github/copilot-instructions.md",
+)
+# Inputs split into per-level blocks
+LEVELED_INPUTS = (".github/agents/sampler.agent.md",)
+
+SKIP_NAMES = {MANIFEST_NAME, "__pycache__", ".venv", ".DS_Store", "uv.lock"}
+
+_LEVEL_MENTION = re.compile(r"level[\s_-]*([123])((?:\s*(?:,|and|&|or)\s*[123])*)", re.IGNORECASE)
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path: Path) -> str:
+    return sha256_bytes(path.read_bytes())
+
+
+def mentioned_levels(block: str) -> set[int]:
+    """Levels a block of text refers to ("level 3", "Level-1", "level 2 and 3")."""
+    levels = set()
+    for match in _LEVEL_MENTION.finditer(block):
+        levels.add(int(match.group(1)))
+        levels.update(int(n) for n in re.findall(r"[123]", match.group(2)))
+    return levels
+
+
+def level_slices(text: str) -> dict[str, str]:
+    """
+    The text relevant to each level: blocks (separated by blank lines) that
+    mention no level go to every level, the others only to the levels they
+    mention. Errs on the side of regenerating too much rather than too little.
+    """
+    slices = {level: [] for level in LEVELS}
+    for block in re.split(r"\n\s*\n", text.replace("\r\n", "\n")):
+        levels = mentioned_levels(block) or {1, 2, 3}
+        for n in sorted(levels):
+            slices[LEVELS[n - 1]].append(block.strip())
+    return {level: "\n\n".join(blocks) for level, blocks in slices.items()}
+
+
+def level_inputs(repo_root: Path = REPO_ROOT) -> dict[str, dict[str, str]]:
+    """Per level, input name -> content hash (missing inputs hash as 'missing')."""
+    inputs = {level: {} for level in LEVELS}
+    for name in SHARED_INPUTS:
+        path = repo_root / name
+        digest = sha256_file(path) if path.exists() else "missing"
+        for level in LEVELS:
+            inputs[level][name] = digest
+    for name in LEVELED_INPUTS:
+        path = repo_root / name
+        if not path.exists():
+            for level in LEVELS:
+                inputs[level][name] = "missing"
+            continue
+        for level, text in level_slices(path.read_text(encoding="utf-8")).items():
+            inputs[level][f"{name}#{level}"] = sha256_bytes(text.encode("utf-8"))
+    return inputs
+
+
+def requirements_hash(requirements: str | None) -> str | None:
+    if requirements is None:
+        return None
+    return sha256_bytes(" ".join(requirements.split()).encode("utf-8"))
+
+
+def level_files(project_dir: Path, level: str) -> dict[str, str]:
+    """Relative path (from the project dir) -> content hash for every file of a level."""
+    files = {}
+    level_dir = project_dir / level
+    if not level_dir.is_dir():
+        return files
+    for path in sorted(level_dir.rglob("*")):
+        if path.is_file() and not SKIP_NAMES.intersection(path.relative_to(project_dir).parts):
+            files[path.relative_to(project_dir).as_posix()] = sha256_file(path)
+    return files
+
+
+def load_manifest(project_dir: Path) -> dict:
+    path = project_dir / MANIFEST_NAME
+    if not path.exists():
+        return {"version": MANIFEST_VERSION, "project": project_dir.name, "levels": {}, "files": {}}
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"{path}: unsupported manifest version {manifest.get('version')!r}")
+    return manifest
+
+
+def record(
+    project_dir: Path,
+    levels: list[str],
+    requirements: str | None = None,
+    repo_root: Path = REPO_ROOT,
+    generated: set[str] | None = None,
+) -> dict:
+    """
+    Update the manifest for freshly generated levels and write it.
+
+    generated: the paths (relative to the project dir) that were written. Only
+    these are recorded with their new hash. Other files of the levels keep their
+    previous entry if they still exist (an edited file stays "edited"), and are
+    otherwise left untracked. None records every file present.
+    """
+    manifest = load_manifest(project_dir)
+    inputs = level_inputs(repo_root)
+    now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    if requirements is not None:
+        manifest["requirements_sha256"] = requirements_hash(requirements)
+
+    for level in levels:
+        manifest["levels"][level] = {
+            "generated_at": now,
+            "inputs": inputs[level],
+            "requirements_sha256": manifest.get("requirements_sha256"),
+        }
+        previous = {path: entry for path, entry in manifest["files"].items() if entry["level"] == level}
+        manifest["files"] = {path: entry for path, entry in manifest["files"].items() if path not in previous}
+        for path, digest in level_files(project_dir, level).items():
+            if generated is None or path in generated:
+                manifest["files"][path] = {"sha256": digest, "level": level}
+            elif path in previous:
+                manifest["files"][path] = previous[path]
+
+    manifest["files"] = dict(sorted(manifest["files"].items()))
+    (project_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return manifest
+
+
+def status(project_dir: Path, requirements: str | None = None, repo_root: Path = REPO_ROOT) -> dict:
+    """What needs regenerating, per level, compared with the manifest."""
+    manifest = load_manifest(project_dir)
+    inputs = level_inputs(repo_root)
+    requested = requirements_hash(requirements)
+    report = {"project": project_dir.name, "levels": {}}
+
+    for level in LEVELS:
+        recorded = manifest["levels"].get(level)
+        current_files = level_files(project_dir, level)
+        recorded_files = {p: e["sha256"] for p, e in manifest["files"].items() if e["level"] == level}
+
+        if recorded is None:
+            state, changed = ("untracked" if current_files else "missing"), []
+        else:
+            changed = sorted(
+                name for name in inputs[level].keys() | recorded["inputs"].keys()
+                if inputs[level].get(name) != recorded["inputs"].get(name)
+            )
+            if requested is not None and requested != recorded.get("requirements_sha256"):
+                changed.append("requirements")
+            state = "stale" if changed else "up-to-date"
+
+        report["levels"][level] = {
+            "state": state,
+            "changed_inputs": changed,
+            "missing_files": sorted(p for p in recorded_files if p not in current_files),
+            "edited_files": sorted(
+                p for p, digest in recorded_files.items() if p in current_files and current_files[p] != digest
+            ),
+            "untracked_files": sorted(p for p in current_files if p not in recorded_files) if recorded else [],
+        }
+
+    report["regenerate_levels"] = [
+        level for level, entry in report["levels"].items() if entry["state"] in ("stale", "missing")
+    ]
+    report["regenerate_files"] = sorted(
+        path
+        for level, entry in report["levels"].items()
+        if level not in report["regenerate_levels"]
+        for path in entry["missing_files"]
+    )
+    return report
+
+
+def format_status(report: dict) -> str:
+    lines = [f"Project: {report['project']}"]
+    for level, entry in report["levels"].items():
+        lines.append(f"  {level:<22} {entry['state']}")
+        for name in entry["changed_inputs"]:
+            lines.append(f"      changed input: {name}")
+        for key, label in (("missing_files", "missing"), ("edited_files", "edited"), ("untracked_files", "untracked")):
+            for path in entry[key]:
+                lines.append(f"      {label}: {path}")
+    lines.append(f"Regenerate levels: {', '.join(report['regenerate_levels']) or 'none'}")
+    lines.append(f"Regenerate files:  {', '.join(report['regenerate_files']) or 'none'}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Content-hash manifest for generated sample projects")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    status_parser = sub.add_parser("status", help="Show what needs regenerating")
+    status_parser.add_argument("project_dir", type=Path, help="e.g. output/password-generator")
+    status_parser.add_argument("--requirements", help="Project requirements of this run (compared by hash)")
+    status_parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    record_parser = sub.add_parser("record", help="Record freshly generated levels in the manifest")
+    record_parser.add_argument("project_dir", type=Path, help="e.g. output/password-generator")
+    record_parser.add_argument(
+        "--level", action="append", choices=LEVELS, help="Level that was regenerated (repeatable; default: all present)"
+    )
+    record_parser.add_argument("--requirements", help="Project requirements the levels were generated from")
+
+    args = parser.parse_args()
+    if not args.project_dir.is_dir():
+        print(f"error: {args.project_dir} is not a directory", file=sys.stderr)
+        return 2
+
+    if args.command == "status":
+        report = status(args.project_dir, args.requirements)
+        print(json.dumps(report, indent=2) if args.json else format_status(report))
+        return 0
+
+    levels = args.level or [level for level in LEVELS if (args.project_dir / level).is_dir()]
+    manifest = record(args.project_dir, levels, args.requirements)
+    print(f"Recorded {', '.join(levels)} ({len(manifest['files'])} files) in {args.project_dir / MANIFEST_NAME}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,372 @@
+"""
+Sample Tree Validator
+
+Checks a generated `output/` or `samples/` tree (or a single project folder):
+
+- front matter: `*.prompt.md`, `*.instructions.md`, `*.agent.md` and
+  `SKILL.md` start with well-formed YAML front matter carrying the keys
+  Copilot needs (description; name for skills and agents)
+- links: every relative Markdown link resolves to an existing file, and
+  `#anchors` into Markdown files match a heading there
+- layout: each level folder contains what the repo README prescribes
+  (README.md, .github/prompts/, and for levels 2-3 instructions and
+  copilot-instructions.md; agents for level 3)
+
+Markdown files are parsed in parallel (a process pool), and each parse result
+is cached by content hash, so re-validating an unchanged tree only re-hashes
+files and re-checks that link targets exist.
+
+Usage:
+    python scripts/validate.py samples
+    python scripts/validate.py output/password-generator --json
+    python scripts/validate.py output --jobs 8 --no-cache
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+try:
+    import yaml
+    _YamlLoader = getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader  # libyaml when available
+except ImportError:  # Optional: fall back to the minimal parser below
+    yaml = None
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE = REPO_ROOT / ".cache" / "validate.json"
+CACHE_VERSION = 2
+
+LEVELS = ("level-1-basic", "level-2-intermediate", "level-3-advanced")
+
+# Required front matter keys by file kind
+REQUIRED_KEYS = {
+    "prompt": ("description",),
+    "instructions": ("description",),
+    "agent": ("description",),
+    "skill": ("name", "description"),
+}
+# Warnings, not errors: Copilot works without them but the samples should show them
+RECOMMENDED_KEYS = {
+    "instructions": ("applyTo",),
+}
+
+SKIP_DIRS = {".git", "__pycache__", ".venv", "node_modules", ".cache"}
+
+_LINK = re.compile(r"(?<!!)\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+\"[^\"]*\")?\s*\)")
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_INLINE_CODE = re.compile(r"`[^`]*`")
+
+
+@dataclass
+class Issue:
+    path: str
+    line: int
+    severity: str  # "error" or "warning"
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.line}: {self.severity}: {self.message}"
+
+
+def file_kind(path: Path) -> str | None:
+    name = path.name
+    if name == "SKILL.md":
+        return "skill"
+    for kind in ("prompt", "instructions", "agent"):
+        if name.endswith(f".{kind}.md"):
+            return kind
+    return None
+
+
+def slugify(heading: str) -> str:
+    """GitHub-style heading anchor."""
+    text = re.sub(r"<[^>]+>", "", _INLINE_CODE.sub(lambda m: m.group(0)[1:-1], heading))
+    text = re.sub(r"\[([^\]]*)\]\([^)]*\)", r"\1", text)
+    return re.sub(r"[^\w\- ]", "", text.strip().lower()).replace(" ", "-")
+
+
+def split_front_matter(text: str) -> tuple[str | None, int]:
+    """The front matter text (None if absent) and the line where the body starts."""
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return None, 1
+    for i, line in enumerate(lines[1:], start=1):
+        if line.strip() == "---":
+            return "\n".join(lines[1:i]), i + 2
+    raise ValueError("front matter is not closed with '---'")
+
+
+def parse_front_matter(block: str) -> dict:
+    """YAML front matter as a dict; PyYAML if installed, else a minimal subset parser."""
+    if yaml is not None:
+        data = yaml.load(block, Loader=_YamlLoader) if block.strip() else {}
+        if not isinstance(data, dict):
+            raise ValueError("front matter is not a mapping")
+        return data
+
+    data: dict = {}
+    key = None
+    for number, line in enumerate(block.splitlines(), start=2):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if line[0] in " \t" or line.startswith("- "):
+            if key is None:
+                raise ValueError(f"line {number}: indented value without a key")
+            data[key] = data[key] or []
+            continue
+        match = re.match(r"^([A-Za-z_][\w-]*)\s*:(?:\s+(.*))?$", line)
+        if not match:
+            raise ValueError(f"line {number}: expected 'key: value'")
+        key, value = match.group(1), (match.group(2) or "").strip()
+        if key in data:
+            raise ValueError(f"line {number}: duplicate key {key!r}")
+        if value and value[0] in "'\"" and (len(value) < 2 or value[-1] != value[0]):
+            raise ValueError(f"line {number}: unterminated quoted value")
+        data[key] = value.strip("'\"") if value else None
+    return data
+
+
+def parse_markdown(text: str, kind: str | None) -> dict:
+    """
+    Everything that depends only on the file's content: front matter issues,
+    relative links (with line numbers) and heading anchors. This is what gets
+    cached by content hash.
+    """
+    issues: list[tuple[int, str, str]] = []
+    body_start = 1
+    try:
+        block, body_start = split_front_matter(text)
+    except ValueError as e:
+        block = None
+        issues.append((1, "error", str(e)))
+    else:
+        if block is None:
+            if kind:
+                issues.append((1, "error", f"{kind} file has no front matter"))
+        else:
+            try:
+                data = parse_front_matter(block)
+            except Exception as e:
+                issues.append((1, "error", f"invalid front matter: {e}".splitlines()[0]))
+            else:
+                for key in REQUIRED_KEYS.get(kind, ()):
+                    if not data.get(key):
+                        issues.append((1, "error", f"front matter is missing '{key}'"))
+                for key in RECOMMENDED_KEYS.get(kind, ()):
+                    if key not in data:
+                        issues.append((1, "warning", f"front matter has no '{key}'"))
+                if kind == "skill" and data.get("name") and not re.fullmatch(r"[a-z0-9]+(-[a-z0-9]+)*", str(data["name"])):
+                    issues.append((1, "error", "skill name must be lowercase letters, digits and hyphens"))
+
+    links: list[tuple[int, str]] = []
+    anchors: list[str] = []
+    seen: dict[str, int] = {}
+    in_fence = False
+    for number, line in enumerate(text.splitlines(), start=1):
+        if number < body_start:
+            continue
+        if line.lstrip().startswith(("```", "~~~")):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        heading = _HEADING.match(line) if line.startswith("#") else None
+        if heading:
+            slug = slugify(heading.group(2))
+            count = seen.get(slug, 0)
+            seen[slug] = count + 1
+            anchors.append(slug if count == 0 else f"{slug}-{count}")
+        if "](" not in line:
+            continue
+        for match in _LINK.finditer(_INLINE_CODE.sub("", line)):
+            target = match.group(1)
+            if not re.match(r"^[a-z][a-z0-9+.-]*:", target, re.IGNORECASE):  # Skip http:, mailto:, ...
+                links.append((number, target))
+    return {"issues": issues, "links": links, "anchors": anchors}
+
+
+def cache_key(data: bytes, kind: str | None) -> str:
+    """Parse results depend on the content and on the file kind (its front matter rules)."""
+    return f"{hashlib.sha256(data).hexdigest()}:{kind or ''}"
+
+
+def _parse_file(args: tuple[str, str | None]) -> tuple[str, str, dict]:
+    """Worker: hash and parse one file (runs in the process pool)."""
+    path, cached_key = args
+    data = Path(path).read_bytes()
+    kind = file_kind(Path(path))
+    key = cache_key(data, kind)
+    if key == cached_key:
+        return path, key, {}
+    return path, key, parse_markdown(data.decode("utf-8", errors="replace"), kind)
+
+
+def find_levels(root: Path) -> list[Path]:
+    """Level folders under a tree root, a project folder, or a level folder itself."""
+    if root.name in LEVELS:
+        return [root]
+    return sorted(path for path in root.rglob("level-*") if path.is_dir() and path.name in LEVELS
+                  and not SKIP_DIRS.intersection(path.relative_to(root).parts))
+
+
+def check_layout(level_dir: Path, display: callable) -> list[Issue]:
+    """The per-level layout from the repo README."""
+    issues = []
+    n = LEVELS.index(level_dir.name) + 1
+    github = level_dir / ".github"
+
+    def require(condition: bool, message: str, severity: str = "error") -> None:
+        if not condition:
+            issues.append(Issue(display(level_dir), 0, severity, message))
+
+    require((level_dir / "README.md").is_file(), "missing README.md")
+    require(any((github / "prompts").glob("*.prompt.md")), "no .github/prompts/*.prompt.md")
+    if n >= 2:
+        require(any((github / "instructions").glob("*.instructions.md")), "no .github/instructions/*.instructions.md")
+        require(
+            (level_dir / "copilot-instructions.md").is_file() or (github / "copilot-instructions.md").is_file(),
+            "missing copilot-instructions.md",
+        )
+        require(any((github / "skills").glob("*/SKILL.md")), "no .github/skills/*/SKILL.md", "warning")
+    if n == 3:
+        require(any((github / "agents").glob("*.agent.md")), "no .github/agents/*.agent.md")
+    return issues
+
+
+def load_cache(path: Path | None) -> dict:
+    if path is None or not path.exists():
+        return {}
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    valid = cache.get("version") == CACHE_VERSION and cache.get("yaml") == (yaml is not None)
+    return cache.get("entries", {}) if valid else {}
+
+
+def save_cache(path: Path | None, entries: dict) -> None:
+    if path is None:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"version": CACHE_VERSION, "yaml": yaml is not None, "entries": entries}), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def validate(root: Path, jobs: int | None = None, cache_path: Path | None = DEFAULT_CACHE) -> dict:
+    """Validate a tree; returns issues and timing/cache statistics."""
+    start = time.perf_counter()
+    root = root.resolve()
+    base = root.parent
+
+    def display(path: Path) -> str:
+        return path.relative_to(base).as_posix()
+
+    files = sorted(
+        str(path) for path in root.rglob("*.md")
+        if path.is_file() and not SKIP_DIRS.intersection(path.relative_to(root).parts)
+    )
+    cache = load_cache(cache_path)
+    # Cache entries are keyed by content hash and file kind; remember each path's key from last time
+    by_path = {path: key for key, entry in cache.items() for path in entry.get("paths", [])}
+    tasks = [(path, by_path.get(path)) for path in files]
+
+    if jobs == 1 or len(tasks) < 32:
+        results = [_parse_file(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(jobs) as pool:
+            results = list(pool.map(_parse_file, tasks, chunksize=16))
+
+    parsed: dict[str, dict] = {}
+    # Keep entries of other trees sharing the cache file; this tree's are rebuilt below
+    entries: dict[str, dict] = {}
+    prefix = str(root) + os.sep
+    for key, entry in cache.items():
+        others = [path for path in entry.get("paths", []) if not path.startswith(prefix)]
+        if others:
+            entries[key] = {**entry, "paths": others}
+    hits = 0
+    for path, key, result in results:
+        if not result:
+            hits += 1
+            result = cache[key]["result"]
+        parsed[path] = result
+        entry = entries.setdefault(key, {"result": result, "paths": []})
+        entry["paths"].append(path)
+
+    issues: list[Issue] = []
+    for path, result in parsed.items():
+        source = Path(path)
+        for line, severity, message in result["issues"]:
+            issues.append(Issue(display(source), line, severity, message))
+        for line, target in result["links"]:
+            target_path, _, anchor = target.partition("#")
+            resolved = (source.parent / target_path).resolve() if target_path else source
+            if not resolved.exists():
+                issues.append(Issue(display(source), line, "error", f"broken link: {target}"))
+                continue
+            if anchor and resolved.suffix == ".md":
+                headings = parsed.get(str(resolved))
+                if headings is None:  # Link target outside the validated tree
+                    headings = parse_markdown(resolved.read_text(encoding="utf-8", errors="replace"), None)
+                if anchor.lower() not in headings["anchors"]:
+                    issues.append(Issue(display(source), line, "error", f"no heading for anchor: {target}"))
+
+    levels = find_levels(root)
+    for level_dir in levels:
+        issues.extend(check_layout(level_dir, display))
+
+    save_cache(cache_path, entries)
+    issues.sort(key=lambda i: (i.path, i.line, i.message))
+    return {
+        "root": str(root),
+        "files": len(files),
+        "levels": len(levels),
+        "cache_hits": hits,
+        "seconds": time.perf_counter() - start,
+        "errors": sum(i.severity == "error" for i in issues),
+        "warnings": sum(i.severity == "warning" for i in issues),
+        "issues": issues,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Validate generated sample trees")
+    parser.add_argument("roots", nargs="+", type=Path, help="output/, samples/, or a project folder")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count; 1 = serial)")
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE, help=f"Cache file (default: {DEFAULT_CACHE})")
+    parser.add_argument("--no-cache", action="store_true", help="Parse every file")
+    parser.add_argument("--json", action="store_true", help="Print the reports as JSON")
+    parser.add_argument("--strict", action="store_true", help="Exit 1 on warnings too")
+    args = parser.parse_args()
+
+    reports = []
+    for root in args.roots:
+        if not root.is_dir():
+            parser.error(f"{root} is not a directory")
+        reports.append(validate(root, args.jobs, None if args.no_cache else args.cache))
+
+    if args.json:
+        print(json.dumps([{**r, "issues": [asdict(i) for i in r["issues"]]} for r in reports], indent=2))
+    else:
+        for r in reports:
+            for issue in r["issues"]:
+                print(issue)
+            print(
+                f"{r['root']}: {r['files']} files in {r['levels']} levels, {r['errors']} errors, "
+                f"{r['warnings']} warnings ({r['cache_hits']} cached, {r['seconds'] * 1000:.0f} ms)"
+            )
+
+    failed = any(r["errors"] or (args.strict and r["warnings"]) for r in reports)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())